@@ -55,6 +55,7 @@ decorator) can be undone and redone. If using :mod:`aeidon` in a context where
 reverting actions is never needed, greater flexibility can be achieved by
 accessing the subtitles directly (via :attr:`aeidon.Project.subtitles`).
 
+:var CACHE_HOME_DIR: Path to the user's local cache directory
 :var CONFIG_HOME_DIR: Path to the user's local configuration directory
 :var DATA_DIR: Path to the global data directory
 :var DATA_HOME_DIR: Path to the user's local data directory
@@ -71,6 +72,7 @@ accessing the subtitles directly (via :attr:`aeidon.Project.subtitles`).
 :var registers: Enumerations for action action reversion register types
 """
 
+import importlib
 import re
 import sys
 
@@ -81,12 +83,6 @@ RUNNING_SPHINX = (sys.argv[0].endswith("autogen.py") or
 
 RE_ANY_TAG = re.compile(r"(^[/\\_]+|<.*?>|\{.*?\})")
 
-try:
-    import gi
-    gi.require_version("Gspell", "1")
-except Exception:
-    pass
-
 from aeidon.paths import * # noqa
 from aeidon.position import * # noqa
 from aeidon import deco # noqa
@@ -100,28 +96,67 @@ from aeidon.observable import * # noqa
 from aeidon.errors import * # noqa
 from aeidon.enum import * # noqa
 from aeidon.enums import * # noqa
-from aeidon import encodings # noqa
-from aeidon import languages # noqa
-from aeidon import countries # noqa
-from aeidon import locales # noqa
-from aeidon import scripts # noqa
-from aeidon.metadata import * # noqa
-from aeidon.calculator import * # noqa
-from aeidon.finder import * # noqa
-from aeidon.parser import * # noqa
-from aeidon.liner import * # noqa
-from aeidon import containers # noqa
-from aeidon.subtitle import * # noqa
-from aeidon.file import * # noqa
-from aeidon import files # noqa
-from aeidon.markup import * # noqa
-from aeidon import markups # noqa
-from aeidon.markupconv import * # noqa
-from aeidon.pattern import * # noqa
-from aeidon.patternman import * # noqa
-from aeidon.clipboard import * # noqa
-from aeidon.revertable import * # noqa
-from aeidon.spell import * # noqa
-from aeidon import agents # noqa
-from aeidon.project import * # noqa
-from aeidon.unittest import * # noqa
+
+# Submodules and names defined in them that are imported only upon first
+# access via the module-level __getattr__ (PEP 562) below in order to keep
+# 'import aeidon' fast, especially for processes handling only a few files.
+_LAZY_MODULES = (
+    "agents",
+    "containers",
+    "convert",
+    "countries",
+    "encodings",
+    "files",
+    "languages",
+    "locales",
+    "markups",
+    "scripts",
+)
+
+_LAZY_NAMES = {
+    "Calculator": "calculator",
+    "Clipboard": "clipboard",
+    "FileSniffer": "sniffer",
+    "Finder": "finder",
+    "IntervalIndex": "index",
+    "Liner": "liner",
+    "Markup": "markup",
+    "MarkupConverter": "markupconv",
+    "MetadataItem": "metadata",
+    "Parser": "parser",
+    "Pattern": "pattern",
+    "PatternManager": "patternman",
+    "Project": "project",
+    "ProjectCache": "cache",
+    "RevertableAction": "revertable",
+    "RevertableActionGroup": "revertable",
+    "SpellCheckNavigator": "spell",
+    "SpellCheckTokenizer": "spell",
+    "SpellChecker": "spell",
+    "Subtitle": "subtitle",
+    "SubtitleFile": "file",
+    "SubtitleRow": "table",
+    "SubtitleTable": "table",
+    "TestCase": "unittest",
+}
+
+def __getattr__(name):
+    """Return lazily imported submodule or name defined in it."""
+    if name in _LAZY_MODULES:
+        return importlib.import_module("aeidon.{}".format(name))
+    if name in _LAZY_NAMES:
+        module = importlib.import_module("aeidon.{}".format(_LAZY_NAMES[name]))
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}"
+                         .format(__name__, name))
+
+def __dir__():
+    """Return names defined including those imported lazily."""
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(_LAZY_NAMES))
+
+if RUNNING_SPHINX:
+    # Import everything for API documentation.
+    for name in _LAZY_MODULES + tuple(_LAZY_NAMES):
+        __getattr__(name)
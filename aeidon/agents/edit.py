@@ -18,6 +18,7 @@
 """Basic editing of entire subtitles."""
 
 import aeidon
+import array
 
 from aeidon.i18n import _
 
@@ -34,6 +35,30 @@ class EditAgent(aeidon.Delegate):
         self.replace_texts(indices, doc, new_texts, register=register)
         self.set_action_description(register, _("Clearing texts"))
 
+    def _get_text_deltas(self, orig_texts, texts):
+        """
+        Return deltas from which to restore `orig_texts` from `texts`.
+
+        Return a tuple of lengths of unchanged heads, lengths of unchanged
+        tails and the changed middle parts of `orig_texts`.
+        """
+        heads = array.array("q")
+        tails = array.array("q")
+        middles = []
+        for orig, text in zip(orig_texts, texts):
+            size = min(len(orig), len(text))
+            head = 0
+            while head < size and orig[head] == text[head]:
+                head += 1
+            tail = 0
+            while (tail < size - head and
+                   orig[-tail-1] == text[-tail-1]):
+                tail += 1
+            heads.append(head)
+            tails.append(tail)
+            middles.append(orig[head:len(orig)-tail])
+        return heads, tails, middles
+
     @aeidon.deco.revertable
     @aeidon.deco.notify_frozen
     def _insert_blank_subtitles(self, indices, register=-1):
@@ -102,6 +127,22 @@ class EditAgent(aeidon.Delegate):
         self.insert_subtitles([indices[0]], [subtitle], register=register)
         self.group_actions(register, 2, _("Merging subtitles"))
 
+    def _pack_deltas(self, values):
+        """Return `values` as a single integer if uniform, else an array."""
+        if all(x == values[0] for x in values):
+            return values[0]
+        return array.array("q", values)
+
+    def _pack_indices(self, indices):
+        """Return `indices` as a flat array of start, stop pairs of runs."""
+        runs = array.array("q")
+        for index in indices:
+            if runs and index == runs[-1]:
+                runs[-1] = index + 1
+                continue
+            runs.extend((index, index + 1))
+        return runs
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     @aeidon.deco.notify_frozen
@@ -121,16 +162,46 @@ class EditAgent(aeidon.Delegate):
     @aeidon.deco.revertable
     @aeidon.deco.notify_frozen
     def replace_positions(self, indices, subtitles, register=-1):
-        """Replace positions at `indices` with those from `subtitles`."""
-        orig_subtitles = [self.subtitles[i].copy() for i in indices]
+        """
+        Replace positions at `indices` with those from `subtitles`.
+
+        Original positions are stored for reversion as offsets from the new
+        positions, a single offset for uniform shifts, instead of copies of
+        subtitles to keep the undo history of large edits small.
+        """
+        modes = set(self.subtitles[i].mode for i in indices)
+        if len(modes) == 1:
+            orig_starts = [self.subtitles[i]._start for i in indices]
+            orig_ends = [self.subtitles[i]._end for i in indices]
+        else:
+            orig_subtitles = [self.subtitles[i].copy_positions()
+                              for i in indices]
         for i, index in enumerate(indices):
-            self.subtitles[index].start = subtitles[i].start
-            self.subtitles[index].end = subtitles[i].end
+            subtitle = self.subtitles[index]
+            if subtitle.mode == subtitles[i].mode:
+                # Copy native positions as is to avoid conversions.
+                subtitle._start = subtitles[i]._start
+                subtitle._end = subtitles[i]._end
+                continue
+            subtitle.start = subtitles[i].start
+            subtitle.end = subtitles[i].end
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Replacing positions")
-        action.revert_function = self.replace_positions
-        action.revert_args = (indices, orig_subtitles)
+        if len(modes) == 1:
+            start_deltas = [x - self.subtitles[i]._start
+                            for x, i in zip(orig_starts, indices)]
+            end_deltas = [x - self.subtitles[i]._end
+                          for x, i in zip(orig_ends, indices)]
+            action.revert_function = self._revert_positions
+            action.revert_args = (self._pack_indices(indices),
+                                  modes.pop(),
+                                  self._pack_deltas(start_deltas),
+                                  self._pack_deltas(end_deltas))
+        else:
+            # Fall back on copies for rare mixed modes.
+            action.revert_function = self.replace_positions
+            action.revert_args = (indices, orig_subtitles)
         self.register_action(action)
         self.emit("positions-changed", indices)
 
@@ -138,18 +209,58 @@ class EditAgent(aeidon.Delegate):
     @aeidon.deco.revertable
     @aeidon.deco.notify_frozen
     def replace_texts(self, indices, doc, texts, register=-1):
-        """Replace texts in `doc`'s `indices` with `texts`."""
+        """
+        Replace texts in `doc`'s `indices` with `texts`.
+
+        Original texts are stored for reversion as deltas from `texts`, i.e.
+        only the changed middle parts of texts, to keep the undo history of
+        large edits small.
+        """
         orig_texts = [self.subtitles[i].get_text(doc) for i in indices]
         for i, index in enumerate(indices):
             self.subtitles[index].set_text(doc, texts[i])
         action = aeidon.RevertableAction(register=register)
         action.docs = (doc,)
         action.description = _("Replacing texts")
-        action.revert_function = self.replace_texts
-        action.revert_args = (indices, doc, orig_texts)
+        action.revert_function = self._revert_texts
+        action.revert_args = (self._pack_indices(indices),
+                              doc,
+                              *self._get_text_deltas(orig_texts, texts))
         self.register_action(action)
         self.emit(self.get_text_signal(doc), indices)
 
+    def _revert_positions(self, indices, mode, start_deltas, end_deltas,
+                          register=-1):
+        """Restore positions from deltas stored by :meth:`replace_positions`."""
+        indices = self._unpack_indices(indices)
+        subtitles = []
+        for i, index in enumerate(indices):
+            subtitle = self.subtitles[index]
+            orig = aeidon.Subtitle(mode, subtitle.framerate)
+            if subtitle.mode == mode:
+                orig._start = subtitle._start
+                orig._end = subtitle._end
+            else:
+                orig.start = subtitle.start
+                orig.end = subtitle.end
+            orig._start += (start_deltas if isinstance(start_deltas, int)
+                            else start_deltas[i])
+            orig._end += (end_deltas if isinstance(end_deltas, int)
+                          else end_deltas[i])
+            subtitles.append(orig)
+        self.replace_positions(indices, subtitles, register=register)
+
+    def _revert_texts(self, indices, doc, heads, tails, middles, register=-1):
+        """Restore texts from deltas stored by :meth:`replace_texts`."""
+        indices = self._unpack_indices(indices)
+        texts = []
+        for i, index in enumerate(indices):
+            text = self.subtitles[index].get_text(doc)
+            texts.append("".join((text[:heads[i]],
+                                  middles[i],
+                                  text[len(text)-tails[i]:])))
+        self.replace_texts(indices, doc, texts, register=register)
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def split_subtitle(self, index, register=-1):
@@ -169,3 +280,8 @@ class EditAgent(aeidon.Delegate):
         subtitles = (subtitle_1, subtitle_2)
         self.insert_subtitles(indices, subtitles, register=register)
         self.group_actions(register, 2, _("Splitting subtitle"))
+
+    def _unpack_indices(self, runs):
+        """Return a list of indices from runs packed by :meth:`_pack_indices`."""
+        return [i for start, stop in zip(runs[0::2], runs[1::2])
+                for i in range(start, stop)]
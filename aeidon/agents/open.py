@@ -18,7 +18,6 @@
 """Reading and parsing data from subtitle files."""
 
 import aeidon
-import bisect
 
 
 class OpenAgent(aeidon.Delegate):
@@ -34,34 +33,53 @@ class OpenAgent(aeidon.Delegate):
 
     def _align_translations_by_position(self, subtitles):
         """Add translation texts by aligning subtitle positions."""
-        subtitles = [x.copy() for x in subtitles]
-        mode = self.main_file.mode
+        # Compare plain integer positions in the units of the main file,
+        # middles rounded the same way as by Calculator.get_middle.
+        if self.main_file.mode == aeidon.modes.TIME:
+            get = lambda x, pos: x._get_milliseconds(pos)
+            to_ms = self.calc.seconds_to_milliseconds
+            middle = lambda x, y: to_ms((x + y) / 2000)
+        else: # FRAME
+            get = lambda x, pos: x._get_frame(pos)
+            middle = lambda x, y: round((x + y) / 2)
+        starts = [get(x, x._start) for x in self.subtitles]
+        ends = [get(x, x._end) for x in self.subtitles]
+        inserted = []
         i = 0
-        while subtitles:
+        for subtitle in subtitles:
             # Examine subtitles to be added one-by-one by comparing
             # their temporal middle positions with the start and end
             # positions of existing subtitles.
-            ts = subtitles[0].get_start(mode)
-            te = subtitles[0].get_end(mode)
-            tm = self.calc.get_middle(ts, te)
-            while True:
-                # Skip over existing subtitles when
-                # no suitable match found among translations.
-                if i == len(self.subtitles): break
-                ms = self.subtitles[i].get_start(mode)
-                me = self.subtitles[i].get_end(mode)
-                if not self.calc.is_earlier(me, tm): break
+            tm = middle(get(subtitle, subtitle._start),
+                        get(subtitle, subtitle._end))
+
+            # Skip over existing subtitles when
+            # no suitable match found among translations.
+            while i < len(ends) and ends[i] < tm:
                 i += 1
-            if i == len(self.subtitles) or self.calc.is_later(ms, tm):
+            if i == len(starts) or starts[i] > tm:
                 # Add a new subtitle when no suitable match
                 # found among existing subtitles.
-                subtitle = self.new_subtitle()
-                subtitle.start = subtitles[0].start
-                subtitle.end = subtitles[0].end
-                self.subtitles.insert(i, subtitle)
-            self.subtitles[i].tran_text = subtitles[0].main_text
-            subtitles.pop(0)
+                new = self.new_subtitle()
+                new.start = subtitle.start
+                new.end = subtitle.end
+                new.tran_text = subtitle.main_text
+                inserted.append((i, new))
+                continue
+            self.subtitles[i].tran_text = subtitle.main_text
             i += 1
+        if not inserted: return
+        # Splice all new subtitles in at once.
+        merged = []
+        j = 0
+        for i, subtitle in inserted:
+            merged.extend(self.subtitles[j:i])
+            merged.append(subtitle)
+            j = i
+        merged.extend(self.subtitles[j:])
+        if self.table:
+            merged = aeidon.SubtitleTable(merged)
+        self.subtitles = merged
 
     @aeidon.deco.export
     def open(self, doc, path, encoding=None, align_method=None):
@@ -83,6 +101,31 @@ class OpenAgent(aeidon.Delegate):
             return self.open_translation(path, encoding, align_method)
         raise ValueError("Invalid document: {!r}".format(doc))
 
+    def _open_file(self, path, encoding):
+        """
+        Read file at `path` and return file, subtitles and sort count.
+
+        If :attr:`cache` is set, return subtitles from the cache if the file
+        at `path` is unchanged, otherwise read the file and store in cache.
+        """
+        if self.cache is not None:
+            cached = self.cache.load(path, encoding)
+            if cached is not None:
+                return cached
+        sniffer = aeidon.FileSniffer(path)
+        bom_encoding = sniffer.detect_bom()
+        read_encoding = encoding
+        if not bom_encoding in (read_encoding, None):
+            read_encoding = bom_encoding
+        format = sniffer.detect_format(read_encoding)
+        file = aeidon.files.new(format, path, read_encoding)
+        file.sniffer = sniffer
+        subtitles = self._read_file(file)
+        subtitles, sort_count = self._sort_subtitles(subtitles)
+        if self.cache is not None:
+            self.cache.save(path, encoding, file, subtitles, sort_count)
+        return file, subtitles, sort_count
+
     @aeidon.deco.export
     @aeidon.deco.notify_frozen
     def open_main(self, path, encoding=None):
@@ -99,13 +142,10 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         encoding = encoding or aeidon.util.get_default_encoding()
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_main(path, bom_encoding)
-        format = aeidon.util.detect_format(path, encoding)
-        self.main_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.main_file)
-        self.subtitles, sort_count = self._sort_subtitles(subtitles)
+        self.main_file, subtitles, sort_count = self._open_file(path, encoding)
+        if self.table:
+            subtitles = aeidon.SubtitleTable(subtitles)
+        self.subtitles = subtitles
         self.set_framerate(self.framerate, register=None)
         self.main_changed = 0
         # Deactivate possible translation file.
@@ -142,13 +182,7 @@ class OpenAgent(aeidon.Delegate):
         """
         encoding = encoding or aeidon.util.get_default_encoding()
         align_method = align_method or aeidon.align_methods.POSITION
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_translation(path, bom_encoding, align_method)
-        format = aeidon.util.detect_format(path, encoding)
-        self.tran_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.tran_file)
-        subtitles, sort_count = self._sort_subtitles(subtitles)
+        self.tran_file, subtitles, sort_count = self._open_file(path, encoding)
         for subtitle in subtitles:
             subtitle.framerate = self.framerate
         for subtitle in self.subtitles:
@@ -178,10 +212,23 @@ class OpenAgent(aeidon.Delegate):
 
     def _sort_subtitles(self, subtitles):
         """Return sorted `subtitles` and sort count."""
+        if not subtitles: return subtitles, 0
+        key = None
+        mode = subtitles[0]._mode
+        if all(x._mode == mode for x in subtitles):
+            # Subtitles read from a file share the same mode,
+            # so native positions can be compared directly.
+            starts = [x._start for x in subtitles]
+            if all(x <= y for x, y in zip(starts, starts[1:])):
+                return subtitles, 0
+            key = lambda x: x._start
+        # Count the subtitles that start earlier than some preceding
+        # subtitle, i.e. the ones that need to be moved.
         sort_count = 0
-        sorted_starts = []
+        latest = None
         for start in (x.start_frame for x in subtitles):
-            bisect.insort(sorted_starts, start)
-            if sorted_starts[-1] != start:
+            if latest is not None and start < latest:
                 sort_count += 1
-        return sorted(subtitles), sort_count
+            else:
+                latest = start
+        return sorted(subtitles, key=key), sort_count
@@ -66,7 +66,7 @@ class PositionAgent(aeidon.Delegate):
             end = max(start, end_max - gap) if dogap else end
             if end != self.subtitles[index].end_seconds:
                 new_indices.append(index)
-                subtitle = self.subtitles[index].copy()
+                subtitle = self.subtitles[index].copy_positions()
                 subtitle.end_seconds = end
                 new_subtitles.append(subtitle)
         if not new_indices: return []
@@ -74,6 +74,11 @@ class PositionAgent(aeidon.Delegate):
         self.set_action_description(register, _("Adjusting durations"))
         return new_indices
 
+    def _clamp(self, milliseconds):
+        """Return `milliseconds` clamped to the range of valid times."""
+        limit = aeidon.Calculator.MAX_MILLISECONDS
+        return max(-limit, min(limit, milliseconds))
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def convert_framerate(self, indices, framerate_in, framerate_out,
@@ -84,13 +89,15 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles. `framerate_in` and
         `framerate_out` should be constants from :attr:`aeidon.framerates`.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         self.set_framerate(framerate_in, register=None)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.convert_framerate(framerate_out)
-            new_subtitles.append(subtitle)
+        coefficient = framerate_out.value / framerate_in.value
+        def convert(mode, calc, positions):
+            if mode == aeidon.modes.TIME:
+                return [self._clamp(round(x / coefficient))
+                        for x in positions]
+            return [round(coefficient * x) for x in positions]
+        new_subtitles = self._get_transformed(indices, convert)
         self.set_framerate(framerate_out)
         self.replace_positions(indices, new_subtitles, register=register)
         self.group_actions(register, 2, _("Converting framerate"))
@@ -107,6 +114,34 @@ class PositionAgent(aeidon.Delegate):
         constant = int(round(-coefficient * x1 + y1, 0))
         return coefficient, constant
 
+    def _get_transformed(self, indices, function):
+        """
+        Return position-only subtitles at `indices` transformed by `function`.
+
+        Subtitles are processed in batches of equal mode and framerate.
+        `function` is called with arguments mode, calculator and a list of
+        native start and end positions and should return a list of the same
+        length with new native positions.
+        """
+        batches = {}
+        for index in indices:
+            subtitle = self.subtitles[index]
+            key = (subtitle.mode, subtitle.framerate)
+            batches.setdefault(key, []).append(index)
+        new_subtitles = {}
+        for (mode, framerate), batch in batches.items():
+            subtitles = [self.subtitles[i] for i in batch]
+            positions = [x._start for x in subtitles]
+            positions.extend(x._end for x in subtitles)
+            calc = aeidon.Calculator(framerate)
+            positions = function(mode, calc, positions)
+            for i, index in enumerate(batch):
+                subtitle = aeidon.Subtitle(mode, framerate)
+                subtitle._start = positions[i]
+                subtitle._end = positions[i + len(batch)]
+                new_subtitles[index] = subtitle
+        return [new_subtitles[i] for i in indices]
+
     def _get_seconds_transform(self, p1, p2):
         """Return a formula for linear correction of positions."""
         # Think of this as a linear transformation where input positions
@@ -158,12 +193,14 @@ class PositionAgent(aeidon.Delegate):
         `value` can be any valid position type, negative to make subtitles
         appear ealier, positive to make subtitles appear later.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.shift_positions(value)
-            new_subtitles.append(subtitle)
+        def shift(mode, calc, positions):
+            if mode == aeidon.modes.TIME:
+                value_ms = calc.to_milliseconds(value)
+                return [self._clamp(x + value_ms) for x in positions]
+            value_frame = calc.to_frame(value)
+            return [x + value_frame for x in positions]
+        new_subtitles = self._get_transformed(indices, shift)
         self.replace_positions(indices, new_subtitles, register=register)
         self.set_action_description(register, _("Shifting positions"))
 
@@ -176,13 +213,16 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles.
         `p1` and `p2` should be tuples of index, position.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         coefficient, constant = self._get_transform(p1, p2)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.scale_positions(coefficient)
-            subtitle.shift_positions(constant)
-            new_subtitles.append(subtitle)
+        def transform(mode, calc, positions):
+            if mode == aeidon.modes.TIME:
+                constant_ms = calc.to_milliseconds(constant)
+                return [self._clamp(self._clamp(round(x * coefficient)) +
+                                    constant_ms) for x in positions]
+            constant_frame = calc.to_frame(constant)
+            return [round(x * coefficient) + constant_frame
+                    for x in positions]
+        new_subtitles = self._get_transformed(indices, transform)
         self.replace_positions(indices, new_subtitles, register=register)
         self.set_action_description(register, _("Transforming positions"))
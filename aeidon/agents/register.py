@@ -43,6 +43,8 @@ This way it will not be in any way processed by the undo/redo system.
 """
 
 import aeidon
+import bisect
+import contextlib
 
 
 class RegisterAgent(aeidon.Delegate):
@@ -51,19 +53,65 @@ class RegisterAgent(aeidon.Delegate):
     Managing revertable actions.
 
     :ivar _do_description: Original description of the action
+    :ivar _redo_size: Approximate memory use of actions in redo stack
+    :ivar _undo_size: Approximate memory use of actions in undo stack
     """
 
     def __init__(self, master):
         """Initialize a :class:`RegisterAgent` instance."""
         aeidon.Delegate.__init__(self, master)
         self._do_description = None
+        self._redo_size = 0
+        self._undo_size = 0
         aeidon.util.connect(self, self, "notify::undo_limit")
+        aeidon.util.connect(self, self, "notify::undo_size_limit")
 
-    def _break_action_group(self, stack, index=0):
+    @aeidon.deco.export
+    @contextlib.contextmanager
+    def batch(self, description):
+        """
+        Return a context manager to group edits as one action.
+
+        All revertable edits done within the ``with`` block are registered as
+        one action with `description`. Undo and redo stacks are cut and the
+        action signal emitted only once at exit. Emissions of signals of
+        changed texts, positions and subtitles are deferred and emitted once
+        at exit with indices merged. Emissions of signals of inserted and
+        removed subtitles are not deferred, but cause indices of the deferred
+        signals to be shifted to keep them valid. Nested batches have no
+        effect of their own.
+        """
+        register = aeidon.registers.DO
+        if not self.block(register.signal):
+            # Nested in another batch or revertable action,
+            # which will take care of registering edits.
+            yield
+            return
+        main_changed = self.main_changed
+        tran_changed = self.tran_changed
+        count = len(self.undoables)
+        frozen = self._freeze_change_signals()
+        try:
+            yield
+        finally:
+            self.unblock(register.signal)
+            count = len(self.undoables) - count
+            if count > 1:
+                self.group_actions(register, count, description)
+            if count == 1:
+                self.set_action_description(register, description)
+            self.thaw_signals(frozen)
+            self.cut_reversion_stacks()
+            if (self.main_changed != main_changed or
+                self.tran_changed != tran_changed):
+                self.emit_action_signal(register)
+
+    def _break_action_group(self, stack):
         """Break the action group in `stack` and return amount broken into."""
-        action_group = stack.pop(index)
-        for action in reversed(action_group.actions):
-            stack.insert(index, action)
+        # Size of group matches the sum of its parts,
+        # no need to update the size of the stack.
+        action_group = stack.popleft()
+        stack.extendleft(reversed(action_group.actions))
         return len(action_group.actions)
 
     @aeidon.deco.export
@@ -78,10 +126,17 @@ class RegisterAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     def cut_reversion_stacks(self):
-        """Cut undo and redo stacks to their maximum lengths."""
-        if self.undo_limit is not None:
-            del self.redoables[self.undo_limit:]
-            del self.undoables[self.undo_limit:]
+        """Cut undo and redo stacks to their maximum lengths and sizes."""
+        for stack in (self.undoables, self.redoables):
+            while (self.undo_limit is not None and
+                   len(stack) > self.undo_limit):
+                self._pop_action(stack, oldest=True)
+        if self.undo_size_limit is None: return
+        for stack in (self.undoables, self.redoables):
+            while (len(stack) > 1 and
+                   self._undo_size + self._redo_size >
+                   self.undo_size_limit):
+                self._pop_action(stack, oldest=True)
 
     @aeidon.deco.export
     def emit_action_signal(self, register):
@@ -108,6 +163,19 @@ class RegisterAgent(aeidon.Delegate):
         raise ValueError("Invalid register: {!r}"
                          .format(register))
 
+    def _freeze_change_signals(self):
+        """Queue signals of changed data to be emitted coalesced."""
+        # Map queued indices across insertions and removals
+        # to keep them pointing to the same subtitles.
+        return self.freeze_signals(("main-texts-changed",
+                                    "positions-changed",
+                                    "subtitles-changed",
+                                    "translation-texts-changed"),
+                                   {"subtitles-inserted":
+                                    self._remap_inserted_indices,
+                                    "subtitles-removed":
+                                    self._remap_removed_indices})
+
     @aeidon.deco.export
     def group_actions(self, register, count, description):
         """Group the registered actions as one item in the stack."""
@@ -116,19 +184,37 @@ class RegisterAgent(aeidon.Delegate):
         action_group.actions = []
         action_group.description = description
         stack = self._get_destination_stack(register)
+        # Size of group matches the sum of its parts,
+        # no need to update the size of the stack.
         for i in range(count):
-            action = stack.pop(0)
+            action = stack.popleft()
             if isinstance(action, aeidon.RevertableActionGroup):
                 action_group.actions.extend(action.actions)
             else: # Single action
                 action_group.actions.append(action)
-        stack.insert(0, action_group)
+        stack.appendleft(action_group)
 
     def _on_notify_undo_limit(self, *args):
         """Cut reversion stacks if limit set."""
         if self.undo_limit is not None:
             self.cut_reversion_stacks()
 
+    def _on_notify_undo_size_limit(self, *args):
+        """Cut reversion stacks if limit set."""
+        if self.undo_size_limit is not None:
+            self.cut_reversion_stacks()
+
+    def _pop_action(self, stack, oldest=False):
+        """Remove and return the newest or oldest action in `stack`."""
+        action = stack.pop() if oldest else stack.popleft()
+        self._shift_size(stack, -action.get_size())
+        return action
+
+    def _push_action(self, stack, action):
+        """Add `action` as the newest in `stack`."""
+        stack.appendleft(action)
+        self._shift_size(stack, action.get_size())
+
     @aeidon.deco.export
     def redo(self, count=1):
         """Redo `count` amount of actions from the redoable stack."""
@@ -136,27 +222,49 @@ class RegisterAgent(aeidon.Delegate):
         if count > 1 or isinstance(self.redoables[0], group):
             return self._revert_multiple(count, aeidon.registers.REDO)
         self._do_description = self.redoables[0].description
-        self.redoables.pop(0).revert()
+        self._pop_action(self.redoables).revert()
 
     @aeidon.deco.export
     def register_action(self, action):
         """Register `action` as done, undone or redone."""
         if action.register == aeidon.registers.DO:
-            self.undoables.insert(0, action)
-            self.redoables = []
+            self._push_action(self.undoables, action)
+            self.redoables.clear()
+            self._redo_size = 0
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.UNDO:
-            self.redoables.insert(0, action)
+            self._push_action(self.redoables, action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.REDO:
-            self.undoables.insert(0, action)
+            self._push_action(self.undoables, action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
 
+    def _remap_inserted_indices(self, indices, inserted):
+        """Return `indices` shifted by subtitles `inserted`."""
+        # Inserted indices are those after insertion,
+        # shift by each in ascending order of insertion.
+        inserted = sorted(inserted)
+        new_indices = []
+        for index in indices:
+            for pos in inserted:
+                if index < pos: break
+                index += 1
+            new_indices.append(index)
+        return new_indices
+
+    def _remap_removed_indices(self, indices, removed):
+        """Return `indices` shifted by subtitles `removed`."""
+        removed = sorted(set(removed))
+        skip = set(removed)
+        return [x - bisect.bisect_left(removed, x)
+                for x in indices if not x in skip]
+
     def _revert_multiple(self, count, register):
         """Revert multiple actions."""
         self.block(register.signal)
+        frozen = self._freeze_change_signals()
         stack = self._get_source_stack(register)
         for i in range(count):
             part_count = 1
@@ -165,9 +273,10 @@ class RegisterAgent(aeidon.Delegate):
                 part_count = self._break_action_group(stack)
             for j in range(part_count):
                 self._do_description = stack[0].description
-                stack.pop(0).revert()
+                self._pop_action(stack).revert()
             if part_count > 1:
                 self.group_actions(register, part_count, description)
+        self.thaw_signals(frozen)
         self.unblock(register.signal)
         self.cut_reversion_stacks()
         self.emit_action_signal(register)
@@ -191,6 +300,13 @@ class RegisterAgent(aeidon.Delegate):
             if self.tran_changed is not None:
                 self.tran_changed += shift
 
+    def _shift_size(self, stack, size):
+        """Add `size` to the tracked memory use of `stack`."""
+        if stack is self.undoables:
+            self._undo_size += size
+        if stack is self.redoables:
+            self._redo_size += size
+
     @aeidon.deco.export
     def undo(self, count=1):
         """Undo `count` amount of actions from the undoable stack."""
@@ -198,4 +314,4 @@ class RegisterAgent(aeidon.Delegate):
         if count > 1 or isinstance(self.undoables[0], group):
             return self._revert_multiple(count, aeidon.registers.UNDO)
         self._do_description = self.undoables[0].description
-        self.undoables.pop(0).revert()
+        self._pop_action(self.undoables).revert()
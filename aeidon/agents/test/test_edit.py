@@ -100,6 +100,20 @@ class TestEditAgent(aeidon.TestCase):
             assert subtitles[i].start == new_subtitles[i].start
             assert subtitles[i].end == new_subtitles[i].end
 
+    @aeidon.deco.reversion_test
+    def test_replace_positions__shift(self):
+        subtitles = self.project.subtitles
+        indices = [0, 1, 2, 5]
+        new_subtitles = [subtitles[i].copy_positions() for i in indices]
+        for subtitle in new_subtitles:
+            subtitle.shift_positions(1.5)
+        self.project.replace_positions(indices, new_subtitles)
+        action = self.project.undoables[0]
+        assert isinstance(action.revert_args[2], int)
+        assert isinstance(action.revert_args[3], int)
+        for i, index in enumerate(indices):
+            assert subtitles[index].start == new_subtitles[i].start
+
     @aeidon.deco.reversion_test
     def test_replace_texts(self):
         doc = aeidon.documents.MAIN
@@ -107,6 +121,15 @@ class TestEditAgent(aeidon.TestCase):
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
 
+    @aeidon.deco.reversion_test
+    def test_replace_texts__delta(self):
+        doc = aeidon.documents.MAIN
+        subtitles = self.project.subtitles
+        texts = ["x" + subtitles[i].main_text[1:] for i in (3, 1)]
+        self.project.replace_texts((3, 1), doc, texts)
+        assert subtitles[3].main_text == texts[0]
+        assert subtitles[1].main_text == texts[1]
+
     @aeidon.deco.reversion_test
     def test_split_subtitle(self):
         subtitles = self.project.subtitles
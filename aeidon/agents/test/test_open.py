@@ -40,6 +40,17 @@ class TestOpenAgent(aeidon.TestCase):
         assert self.project.subtitles
         assert self.project.main_file.encoding == "utf_8_sig"
 
+    def test_open_main__cache(self):
+        directory = aeidon.temp.create_directory()
+        self.project.cache = aeidon.ProjectCache(directory)
+        path = self.new_subrip_file()
+        self.project.open_main(path, "ascii")
+        subtitles = [x.copy() for x in self.project.subtitles]
+        self.project.open_main(path, "ascii")
+        assert self.project.subtitles == subtitles
+        assert self.project.main_file.format == aeidon.formats.SUBRIP
+        assert self.project.main_file.path == path
+
     def test_open_main__sort(self):
         path = self.new_microdvd_file()
         with open(path, "w") as f:
@@ -49,6 +60,30 @@ class TestOpenAgent(aeidon.TestCase):
         sort_count = self.project.open_main(path, "ascii")
         assert sort_count == 1
 
+    def test_open_main__sort__multiple(self):
+        path = self.new_microdvd_file()
+        with open(path, "w") as f:
+            f.write("{100}{200}\n")
+            f.write("{500}{600}\n")
+            f.write("{300}{400}\n")
+            f.write("{200}{300}\n")
+        sort_count = self.project.open_main(path, "ascii")
+        assert sort_count == 2
+        starts = [x.start_frame for x in self.project.subtitles]
+        assert starts == [100, 200, 300, 500]
+
+    def test_open_main__sort__sorted(self):
+        path = self.new_microdvd_file()
+        sort_count = self.project.open_main(path, "ascii")
+        assert sort_count == 0
+
+    def test_open_main__table(self):
+        self.project = aeidon.Project(table=True)
+        path = self.new_subrip_file()
+        self.project.open_main(path, "ascii")
+        assert isinstance(self.project.subtitles, aeidon.SubtitleTable)
+        assert self.project.subtitles == sorted(self.project.subtitles)
+
     def test_open_translation__align_number(self):
         for format in aeidon.formats:
             path = self.new_temp_file(format)
@@ -61,6 +96,27 @@ class TestOpenAgent(aeidon.TestCase):
             method = aeidon.align_methods.POSITION
             self.project.open_translation(path, "ascii", method)
 
+    def test_open_translation__align_position__insert(self):
+        path = self.new_microdvd_file()
+        with open(path, "w") as f:
+            f.write("{100}{200}a\n")
+            f.write("{500}{600}b\n")
+        self.project.open_main(path, "ascii")
+        with open(path, "w") as f:
+            f.write("{0}{50}1\n")
+            f.write("{100}{200}2\n")
+            f.write("{300}{400}3\n")
+            f.write("{500}{600}4\n")
+            f.write("{700}{800}5\n")
+        method = aeidon.align_methods.POSITION
+        self.project.open_translation(path, "ascii", method)
+        texts = [x.main_text for x in self.project.subtitles]
+        assert texts == ["", "a", "", "b", ""]
+        texts = [x.tran_text for x in self.project.subtitles]
+        assert texts == ["1", "2", "3", "4", "5"]
+        starts = [x.start_frame for x in self.project.subtitles]
+        assert starts == [0, 100, 300, 500, 700]
+
     def test_open_translation__bom(self):
         path = self.new_subrip_file()
         with open(path, "rb") as f:
@@ -23,10 +23,111 @@ TRAN = aeidon.documents.TRAN
 
 class TestRegisterAgent(aeidon.TestCase):
 
+    def assert_mirrored(self, texts):
+        assert texts == [x.main_text for x in self.project.subtitles]
+
+    def mirror_texts(self):
+        texts = [x.main_text for x in self.project.subtitles]
+        def on_changed(project, indices):
+            for i in indices:
+                texts[i] = project.subtitles[i].main_text
+        def on_inserted(project, indices):
+            for i in sorted(indices):
+                texts.insert(i, project.subtitles[i].main_text)
+        def on_removed(project, indices):
+            for i in sorted(indices, reverse=True):
+                texts.pop(i)
+        self.project.connect("main-texts-changed", on_changed)
+        self.project.connect("subtitles-inserted", on_inserted)
+        self.project.connect("subtitles-removed", on_removed)
+        return texts
+
     def setup_method(self, method):
         self.project = self.new_project()
         self.delegate = self.project.undo.__self__
 
+    @aeidon.deco.reversion_test
+    def test_batch(self):
+        emitted = []
+        def on_changed(project, indices):
+            emitted.append(indices)
+        self.project.connect("main-texts-changed", on_changed)
+        with self.project.batch("Test"):
+            self.project.set_text(2, MAIN, "test")
+            self.project.set_text(0, MAIN, "test")
+            self.project.set_text(2, MAIN, "testing")
+            assert not emitted
+        assert emitted == [[0, 2]]
+        assert len(self.project.undoables) == 1
+        assert self.project.undoables[0].description == "Test"
+
+    def test_batch__insert(self):
+        emitted = []
+        def on_changed(project, indices):
+            emitted.append(("changed", indices))
+        def on_inserted(project, indices):
+            emitted.append(("inserted", indices))
+        self.project.connect("main-texts-changed", on_changed)
+        self.project.connect("subtitles-inserted", on_inserted)
+        with self.project.batch("Test"):
+            self.project.set_text(1, MAIN, "test")
+            self.project.insert_subtitles((0,))
+            self.project.set_text(0, MAIN, "test")
+        assert emitted == [("inserted", (0,)),
+                           ("changed", [0, 2])]
+
+    def test_batch__insert_remove(self):
+        texts = self.mirror_texts()
+        with self.project.batch("Test"):
+            self.project.set_text(1, MAIN, "test 1")
+            self.project.insert_subtitles((0, 1))
+            self.project.set_text(5, MAIN, "test 5")
+            self.project.remove_subtitles((2, 4))
+            self.project.set_text(0, MAIN, "test 0")
+        self.assert_mirrored(texts)
+        self.project.undo()
+        self.assert_mirrored(texts)
+        self.project.redo()
+        self.assert_mirrored(texts)
+
+    def test_batch__nested(self):
+        with self.project.batch("Outer"):
+            self.project.set_text(0, MAIN, "test")
+            with self.project.batch("Inner"):
+                self.project.set_text(1, MAIN, "test")
+        assert len(self.project.undoables) == 1
+        assert self.project.undoables[0].description == "Outer"
+        self.project.undo()
+        assert self.project.subtitles[0].main_text != "test"
+        assert self.project.subtitles[1].main_text != "test"
+
+    def test_cut_reversion_stacks__undo_limit(self):
+        self.project.undo_limit = 2
+        self.project.clear_texts((0,), MAIN)
+        self.project.clear_texts((1,), MAIN)
+        self.project.clear_texts((2,), MAIN)
+        assert len(self.project.undoables) == 2
+        self.project.undo(2)
+        assert len(self.project.undoables) == 0
+        assert len(self.project.redoables) == 2
+
+    def test_cut_reversion_stacks__undo_size_limit(self):
+        self.project.clear_texts((0,), MAIN)
+        self.project.clear_texts((1,), MAIN)
+        self.project.clear_texts((2,), MAIN)
+        assert len(self.project.undoables) == 3
+        size = (self.project.undoables[0].get_size() +
+                self.project.undoables[1].get_size())
+        self.project.undo_size_limit = size
+        assert len(self.project.undoables) == 2
+        self.project.undo_size_limit = 1
+        assert len(self.project.undoables) == 1
+        self.project.undo()
+        assert len(self.project.undoables) == 0
+        assert len(self.project.redoables) == 1
+        assert self.delegate._undo_size == 0
+        assert self.delegate._redo_size > 0
+
     def test_redo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
@@ -44,6 +145,15 @@ class TestRegisterAgent(aeidon.TestCase):
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
 
+    def test_undo__insert(self):
+        texts = self.mirror_texts()
+        self.project.insert_subtitles((0,))
+        self.project.set_text(2, MAIN, "test")
+        self.project.undo(2)
+        self.assert_mirrored(texts)
+        self.project.redo(2)
+        self.assert_mirrored(texts)
+
     def test_undo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
@@ -48,6 +48,53 @@ class TestTextAgent(aeidon.TestCase):
         for subtitle in self.project.subtitles:
             assert subtitle.main_text == "Test. Test I."
 
+    def test_capitalize__processes(self):
+        # With 1500 texts and 3 processes, shards start at 500 and 1000.
+        texts = ["test. test i.", "and then?", "so i said", "test"]
+        manager = aeidon.PatternManager("capitalization")
+        patterns = manager.get_patterns("Latn", "en")
+        results = []
+        for processes in (1, 3):
+            project = self.new_project()
+            project.subtitles = [aeidon.Subtitle() for i in range(1500)]
+            for i, subtitle in enumerate(project.subtitles):
+                subtitle.main_text = texts[i % len(texts)]
+            project.subtitles[499].main_text = "so i said"
+            project.subtitles[500].main_text = "test"
+            project.subtitles[999].main_text = "i know."
+            project.subtitles[1000].main_text = "test"
+            project.capitalize(None,
+                               aeidon.documents.MAIN,
+                               patterns,
+                               processes=processes)
+
+            results.append([x.main_text for x in project.subtitles])
+        assert results[0] == results[1]
+        assert results[1][500] == "test"
+        assert results[1][1000] == "Test"
+
+    def test_capitalize__processes_indices(self):
+        # With 1000 texts and 2 processes, the second shard starts
+        # at index 751, which does not follow the index before.
+        indices = [i for i in range(1500) if i % 3 != 0]
+        manager = aeidon.PatternManager("capitalization")
+        patterns = manager.get_patterns("Latn", "en")
+        results = []
+        for processes in (1, 2):
+            project = self.new_project()
+            project.subtitles = [aeidon.Subtitle() for i in range(1500)]
+            for subtitle in project.subtitles:
+                subtitle.main_text = "i know."
+            project.subtitles[751].main_text = "test"
+            project.capitalize(indices,
+                               aeidon.documents.MAIN,
+                               patterns,
+                               processes=processes)
+
+            results.append([x.main_text for x in project.subtitles])
+        assert results[0] == results[1]
+        assert results[1][751] == "test"
+
     def test_correct_common_errors(self):
         self.project.subtitles[0].main_text = "''Test''"
         self.project.subtitles[1].main_text = "123o456o789"
@@ -59,6 +106,38 @@ class TestTextAgent(aeidon.TestCase):
         assert self.project.subtitles[0].main_text == '"Test"'
         assert self.project.subtitles[1].main_text == "12304560789"
 
+    def test_correct_common_errors__markup(self):
+        self.project.subtitles[0].main_text = "<i>''Test''</i>"
+        self.project.subtitles[1].main_text = "<b>123o456o789</b> test"
+        manager = aeidon.PatternManager("common-error")
+        self.project.correct_common_errors(self.project.get_all_indices(),
+                                           aeidon.documents.MAIN,
+                                           manager.get_patterns("Latn"))
+
+        assert self.project.subtitles[0].main_text == '<i>"Test"</i>'
+        assert self.project.subtitles[1].main_text == "<b>12304560789</b> test"
+
+    def test_correct_common_errors__processes(self):
+        texts = ["<i>123o456o789</i>", "123o456o789", "<b>''Test''</b> test"]
+        manager = aeidon.PatternManager("common-error")
+        patterns = manager.get_patterns("Latn")
+        results = []
+        for processes in (1, 2):
+            project = self.new_project()
+            project.subtitles = [aeidon.Subtitle() for i in range(1200)]
+            for i, subtitle in enumerate(project.subtitles):
+                subtitle.main_text = texts[i % len(texts)]
+            project.correct_common_errors(None,
+                                          aeidon.documents.MAIN,
+                                          patterns,
+                                          processes=processes)
+
+            results.append([x.main_text for x in project.subtitles])
+        assert results[0] == results[1]
+        assert results[1][:3] == ["<i>12304560789</i>",
+                                  "12304560789",
+                                  '<b>"Test"</b> test']
+
     def test_remove_hearing_impaired(self):
         orig_length = len(self.project.subtitles)
         self.project.subtitles[0].main_text = "[Boo] Test."
@@ -74,6 +153,20 @@ class TestTextAgent(aeidon.TestCase):
         assert self.project.subtitles[0].main_text == "Test."
         assert len(self.project.subtitles) == orig_length - 1
 
+    def test_remove_hearing_impaired__lines(self):
+        self.project.subtitles[0].main_text = "Hello\n[DOOR SLAMS]\nWorld"
+        self.project.subtitles[1].main_text = "- Hi!\n- (LAUGHS)\n- Bye."
+        manager = aeidon.PatternManager("hearing-impaired")
+        patterns = manager.get_patterns("Latn", "en")
+        for pattern in patterns:
+            pattern.enabled = True
+        self.project.remove_hearing_impaired((0, 1),
+                                             aeidon.documents.MAIN,
+                                             patterns)
+
+        assert self.project.subtitles[0].main_text == "Hello\nWorld"
+        assert self.project.subtitles[1].main_text == "- Hi!\n- Bye."
+
     def test_spell_check_join_words(self):
         for subtitle in self.project.subtitles:
             subtitle.main_text = subtitle.main_text.replace("a", " a")
@@ -18,16 +18,162 @@
 """Automatic correcting of texts."""
 
 import aeidon
+import concurrent.futures
+import itertools
+import os
 import re
 
 from aeidon.i18n import _
 
+_re_capitalizable = re.compile(r"^\W*(?<!\.\.\.)(?<!…)\w")
+
+# Arguments shared by all shards processed by a worker process,
+# set once per worker when the process pool is started.
+_worker_args = None
+
+def _capitalize(parser, capitalizations, index, text, cap_next):
+    """Return capitalized `text` and whether to capitalize next."""
+    parser.set_text(text)
+    if cap_next or index == 0:
+        _capitalize_first(parser, 0)
+        cap_next = False
+    for regex, capitalize in capitalizations:
+        parser.pattern = regex
+        parser.pos = 0
+        cap_next = _capitalize_text(parser, capitalize, cap_next)
+    return parser.get_text(), cap_next
+
+def _capitalize_first(parser, pos):
+    """Capitalize the first alphanumeric character from `pos`."""
+    match = _re_capitalizable.search(parser.text[pos:])
+    if match is not None:
+        i = pos + match.end() - 1
+        prefix = parser.text[:i]
+        text = parser.text[i:i+1].capitalize()
+        suffix = parser.text[i+1:]
+        parser.text = prefix + text + suffix
+    return match is not None
+
+def _capitalize_text(parser, capitalize, cap_next):
+    """Capitalize all matches of pattern in `parser`'s text."""
+    while True:
+        try:
+            a, z = parser.next()
+        except StopIteration:
+            return cap_next
+        if capitalize == "Start":
+            _capitalize_first(parser, a)
+        if capitalize == "After":
+            cap_next = not _capitalize_first(parser, z)
+
+def _capitalize_texts(args, items):
+    """Return capitalized texts and whether to capitalize next for `items`."""
+    re_tag, clean_func, capitalizations = args
+    parser = aeidon.Parser(re_tag, clean_func)
+    results = []
+    for i, (index, text) in enumerate(items):
+        # Capitalization carries over only to directly following
+        # subtitles and not to the first item of a shard.
+        cap_next = (results[-1][1] if i > 0 and
+                    index == items[i-1][0] + 1 else False)
+
+        results.append(_capitalize(parser,
+                                   capitalizations,
+                                   index,
+                                   text,
+                                   cap_next))
+
+    return results
+
+def _init_worker(args):
+    """Store `args` shared by all shards processed by worker."""
+    global _worker_args
+    _worker_args = args
+
+def _run_worker(function, items):
+    """Return results of `function` for a shard of `items`."""
+    return function(_worker_args, items)
+
+def _subn(regex, replacement, text):
+    """Return `text` with matches of `regex` replaced and their count."""
+    # Unlike re.subn, find each match in the text as modified by preceding
+    # replacements, as Parser does, since the result of context-dependent
+    # patterns, e.g. ones with a multiline '^', can differ.
+    match = regex.search(text)
+    if match is None:
+        return text, 0
+    expand = "\\" in replacement
+    count = 0
+    empty_pos = None
+    while match is not None:
+        a, z = match.span()
+        if a == z == empty_pos:
+            if a == len(text): break
+            match = regex.search(text, a + 1)
+            continue
+        value = match.expand(replacement) if expand else replacement
+        text = text[:a] + value + text[z:]
+        count += 1
+        pos = a + len(value)
+        empty_pos = pos if a == z else None
+        match = regex.search(text, pos)
+    return text, count
+
+def _substitute(parser, text, substitutions):
+    """Return `text` with `substitutions` applied."""
+    if parser.re_tag is None or parser.re_tag.search(text) is None:
+        # Without markup tags substitutions can be made directly on the
+        # text, skipping the parser's bookkeeping of tag positions.
+        for regex, replacement, repeat in substitutions:
+            text, count = _subn(regex, replacement, text)
+            while repeat and count:
+                text, count = _subn(regex, replacement, text)
+        if parser.clean_func is not None:
+            text = parser.clean_func(text)
+        return text
+    parser.set_text(text)
+    for regex, replacement, repeat in substitutions:
+        parser.pattern = regex
+        parser.replacement = replacement
+        count = parser.replace_all()
+        while repeat and count:
+            count = parser.replace_all()
+    return parser.get_text()
+
+def _substitute_texts(args, texts):
+    """Return `texts` with substitutions applied."""
+    re_tag, clean_func, substitutions = args
+    parser = aeidon.Parser(re_tag, clean_func)
+    return [_substitute(parser, x, substitutions) for x in texts]
+
 
 class TextAgent(aeidon.Delegate):
 
     """Automatic correcting of texts."""
 
-    _re_capitalizable = re.compile(r"^\W*(?<!\.\.\.)(?<!…)\w")
+    # Substitutions to clean up after removing hearing impaired texts,
+    # in the form used by _substitute, i.e. regex, replacement, repeat.
+    _leftover_hi = [(re.compile(x, re.DOTALL|re.MULTILINE), y, False)
+                    for x, y in (
+        # Remove leading and trailing spaces.
+        (r"(^\s+|\s+$)", ""),
+        # Consolidate multiple consequtive spaces.
+        (r" {2,}", " "),
+        # Remove lines with no alphanumeric characters.
+        (r"^\W*$", ""),
+        # Remove empty lines.
+        (r"(^\n|\n$)", ""),
+        # Add space after dialogue dashes.
+        (r"^([\-\–\—])(\S)", r"\1 \2"),
+        # Remove dialogue dashes if not present on other lines.
+        (r"^[\-\–\—] (.*?^[^\-\–\—])", r"\1"),
+        # Remove dialogue dashes from single-line subtitles.
+        (r"\A[\-\–\—] ([^\n]*)\Z", r"\1"),
+    )]
+
+    # Minimum amount of texts per shard when processing in parallel,
+    # smaller batches are faster to process than to start processes for.
+    _min_shard_size = 500
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -92,96 +238,72 @@ class TextAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     @aeidon.deco.revertable
-    def capitalize(self, indices, doc, patterns, register=-1):
+    def capitalize(self, indices, doc, patterns, processes=1, register=-1):
         """
         Capitalize texts as defined by `patterns`.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
+        be a sequence of instances of :class:`aeidon.Pattern`. `processes` is
+        the amount of processes to use, see :meth:`_map_texts`. Raise
         :exc:`re.error` if a bad regular expression among `patterns`.
         """
         new_indices = []
         new_texts = []
-        parser = self.get_parser(doc)
         patterns = [x for x in patterns if x.enabled]
-        indices = indices or self.get_all_indices()
-        for indices in aeidon.util.get_ranges(indices):
-            cap_next = False
-            for index in indices:
-                subtitle = self.subtitles[index]
-                parser.set_text(subtitle.get_text(doc))
-                if cap_next or index == 0:
-                    self._capitalize_first(parser, 0)
-                    cap_next = False
-                for pattern in patterns:
-                    string = pattern.get_field("Pattern")
-                    flags = pattern.get_flags()
-                    parser.set_regex(string, flags)
-                    parser.pos = 0
-                    cap_next = self._capitalize_text(parser, pattern, cap_next)
-                text = parser.get_text()
-                if text != subtitle.get_text(doc):
-                    new_indices.append(index)
-                    new_texts.append(text)
+        capitalizations = [(
+            re.compile(x.get_field("Pattern"), x.get_flags()),
+            x.get_field("Capitalize"),
+        ) for x in patterns]
+        indices = sorted(set(indices or self.get_all_indices()))
+        items = [(x, self.subtitles[x].get_text(doc)) for x in indices]
+        args = (self.get_markup_tag_regex(doc),
+                self.get_markup_clean_func(doc),
+                capitalizations)
+
+        results, starts = self._map_texts(
+            _capitalize_texts, args, items, processes)
+        # Shards were processed without knowing whether the last item of the
+        # previous shard calls for capitalization, redo any items that were
+        # processed with a wrong assumption, in order to fix the chain.
+        parser = self.get_parser(doc)
+        assumed = [x[1] for x in results]
+        starts = set(starts)
+        for i in range(1, len(items)):
+            if items[i][0] != items[i-1][0] + 1: continue
+            cap_next = False if i in starts else assumed[i-1]
+            if results[i-1][1] == cap_next: continue
+            results[i] = _capitalize(parser,
+                                     capitalizations,
+                                     items[i][0],
+                                     items[i][1],
+                                     results[i-1][1])
+
+        for (index, text), (new_text, cap_next) in zip(items, results):
+            if new_text != text:
+                new_indices.append(index)
+                new_texts.append(new_text)
         if not new_indices: return
         self.replace_texts(new_indices, doc, new_texts, register=register)
         self.set_action_description(register, _("Capitalizing texts"))
 
-    def _capitalize_first(self, parser, pos):
-        """Capitalize the first alphanumeric character from `pos`."""
-        match = self._re_capitalizable.search(parser.text[pos:])
-        if match is not None:
-            i = pos + match.end() - 1
-            prefix = parser.text[:i]
-            text = parser.text[i:i+1].capitalize()
-            suffix = parser.text[i+1:]
-            parser.text = prefix + text + suffix
-        return match is not None
-
-    def _capitalize_text(self, parser, pattern, cap_next):
-        """Capitalize all matches of `pattern` in `parser`'s text."""
-        try:
-            a, z = parser.next()
-        except StopIteration:
-            return cap_next
-        if pattern.get_field("Capitalize") == "Start":
-            self._capitalize_first(parser, a)
-        if pattern.get_field("Capitalize") == "After":
-            cap_next = not self._capitalize_first(parser, z)
-        return self._capitalize_text(parser, pattern, cap_next)
-
     @aeidon.deco.export
     @aeidon.deco.revertable
-    def correct_common_errors(self, indices, doc, patterns, register=-1):
+    def correct_common_errors(self, indices, doc, patterns, processes=1,
+                              register=-1):
         """
         Correct common human and OCR errors in texts.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
+        be a sequence of instances of :class:`aeidon.Pattern`. `processes` is
+        the amount of processes to use, see :meth:`_map_texts`. Raise
         :exc:`re.error` if a bad regular expression among `patterns`.
         """
-        new_indices = []
-        new_texts = []
-        parser = self.get_parser(doc)
         patterns = [x for x in patterns if x.enabled]
-        re_patterns = self._get_substitutions(patterns)
-        repeats = [x.get_field_boolean("Repeat") for x in patterns]
-        for index in indices or self.get_all_indices():
-            subtitle = self.subtitles[index]
-            parser.set_text(subtitle.get_text(doc))
-            for i, item in enumerate(re_patterns):
-                string, flags, replacement = item
-                parser.set_regex(string, flags)
-                parser.replacement = replacement
-                count = parser.replace_all()
-                while repeats[i] and count:
-                    count = parser.replace_all()
-            text = parser.get_text()
-            if text != subtitle.get_text(doc):
-                new_indices.append(index)
-                new_texts.append(text)
-        if not new_indices: return
-        self.replace_texts(new_indices, doc, new_texts, register=register)
+        substitutions = self._get_substitutions(patterns)
+        indices, new_texts = self._substitute_texts(
+            indices, doc, substitutions, processes)
+        if not indices: return
+        self.replace_texts(indices, doc, new_texts, register=register)
         self.set_action_description(register, _("Correcting common errors"))
 
     def _get_penalties(self, patterns):
@@ -194,40 +316,59 @@ class TextAgent(aeidon.Delegate):
         } for x in patterns]
 
     def _get_substitutions(self, patterns):
-        """Return a list of substitution definitions."""
+        """Return a list of compiled substitution definitions."""
         return [(
-            x.get_field("Pattern"),
-            x.get_flags(),
+            re.compile(x.get_field("Pattern"), x.get_flags()),
             x.get_field("Replacement"),
+            x.get_field_boolean("Repeat", False),
         ) for x in patterns]
 
+    def _map_texts(self, function, args, items, processes):
+        """
+        Return results of `function` for `items` and shard start positions.
+
+        `function` should be a module-level function that accepts `args` and
+        a list of items and returns a list of results. If `processes` is
+        greater than one, `items` are split into contiguous shards processed
+        in parallel in a pool of `processes` processes, ``None`` meaning the
+        amount of processors in the system. Shards are kept to a reasonable
+        minimum size and small amounts of items are processed directly.
+        `args` are sent to each process only once.
+        """
+        count = processes or os.cpu_count() or 1
+        count = min(count, len(items) // self._min_shard_size)
+        if count <= 1:
+            return function(args, items), [0]
+        size = -(-len(items) // count)
+        starts = list(range(0, len(items), size))
+        with concurrent.futures.ProcessPoolExecutor(
+                count, initializer=_init_worker, initargs=(args,)) as executor:
+            futures = [executor.submit(_run_worker, function, items[i:i+size])
+                       for i in starts]
+            results = [x.result() for x in futures]
+        return list(itertools.chain.from_iterable(results)), starts
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def remove_hearing_impaired(self, indices, doc, patterns,
-                                remove_blank=True, register=-1):
+                                remove_blank=True, processes=1,
+                                register=-1):
         """
         Remove hearing impaired parts from subtitles.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
+        be a sequence of instances of :class:`aeidon.Pattern`. `processes` is
+        the amount of processes to use, see :meth:`_map_texts`. Raise
         :exc:`re.error` if a bad regular expression among `patterns`.
         """
-        new_indices = []
-        new_texts = []
         parser = self.get_parser(doc)
         patterns = [x for x in patterns if x.enabled]
-        re_patterns = self._get_substitutions(patterns)
-        for index in indices or self.get_all_indices():
-            subtitle = self.subtitles[index]
-            parser.set_text(subtitle.get_text(doc))
-            for string, flags, replacement in re_patterns:
-                parser.set_regex(string, flags)
-                parser.replacement = replacement
-                parser.replace_all()
-            text = parser.get_text()
-            if text != subtitle.get_text(doc):
-                new_indices.append(index)
-                new_texts.append(text)
+        # Repeating is only supported for common error patterns.
+        substitutions = [(regex, replacement, False) for regex, replacement, repeat
+                         in self._get_substitutions(patterns)]
+
+        new_indices, new_texts = self._substitute_texts(
+            indices, doc, substitutions, processes)
         if not new_indices: return
         new_texts = self._remove_leftover_hi(new_texts, parser)
         self.replace_texts(new_indices, doc, new_texts, register=register)
@@ -243,31 +384,7 @@ class TextAgent(aeidon.Delegate):
 
     def _remove_leftover_hi(self, texts, parser):
         """Remove leftover hearing impaired whitespace and junk."""
-        texts = texts[:]
-        for i, text in enumerate(texts):
-            parser.set_text(text)
-            # Remove leading and trailing spaces.
-            self._replace_all(parser, r"(^\s+|\s+$)", "")
-            # Consolidate multiple consequtive spaces.
-            self._replace_all(parser, r" {2,}", " ")
-            # Remove lines with no alphanumeric characters.
-            self._replace_all(parser, r"^\W*$", "")
-            # Remove empty lines.
-            self._replace_all(parser, r"(^\n|\n$)", "")
-            # Add space after dialogue dashes.
-            self._replace_all(parser, r"^([\-\–\—])(\S)", r"\1 \2")
-            # Remove dialogue dashes if not present on other lines.
-            self._replace_all(parser, r"^[\-\–\—] (.*?^[^\-\–\—])", r"\1")
-            # Remove dialogue dashes from single-line subtitles.
-            self._replace_all(parser, r"\A[\-\–\—] ([^\n]*)\Z", r"\1")
-            texts[i] = parser.get_text()
-        return texts
-
-    def _replace_all(self, parser, pattern, replacement):
-        """Replace all matches of `pattern` in `parser`'s text."""
-        parser.set_regex(pattern)
-        parser.replacement = replacement
-        parser.replace_all()
+        return [_substitute(parser, x, self._leftover_hi) for x in texts]
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -353,3 +470,20 @@ class TextAgent(aeidon.Delegate):
         self.replace_texts(new_indices, doc, new_texts, register=register)
         description = _("Splitting words by spell-check suggestions")
         self.set_action_description(register, description)
+
+    def _substitute_texts(self, indices, doc, substitutions, processes):
+        """Return indices and texts changed by applying `substitutions`."""
+        new_indices = []
+        new_texts = []
+        indices = indices or self.get_all_indices()
+        texts = [self.subtitles[x].get_text(doc) for x in indices]
+        args = (self.get_markup_tag_regex(doc),
+                self.get_markup_clean_func(doc),
+                substitutions)
+
+        results = self._map_texts(_substitute_texts, args, texts, processes)[0]
+        for index, text, new_text in zip(indices, texts, results):
+            if new_text != text:
+                new_indices.append(index)
+                new_texts.append(new_text)
+        return new_indices, new_texts
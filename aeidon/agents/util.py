@@ -22,7 +22,16 @@ import aeidon
 
 class UtilityAgent(aeidon.Delegate):
 
-    """Miscellaneous helper methods."""
+    """
+    Miscellaneous helper methods.
+
+    :ivar _interval_index: :class:`aeidon.IntervalIndex` instance or ``None``
+    """
+
+    def __init__(self, master):
+        """Initialize a :class:`UtilityAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        self._interval_index = None
 
     @aeidon.deco.export
     def get_all_indices(self):
@@ -68,6 +77,18 @@ class UtilityAgent(aeidon.Delegate):
         raise ValueError("Invalid document: {!r}"
                          .format(doc))
 
+    @aeidon.deco.export
+    def get_interval_index(self):
+        """
+        Return :class:`aeidon.IntervalIndex` of subtitle positions.
+
+        The index is created upon first call and kept up to date from
+        then on for fast lookups of subtitles by time.
+        """
+        if self._interval_index is None:
+            self._interval_index = aeidon.IntervalIndex(self.master)
+        return self._interval_index
+
     @aeidon.deco.export
     def get_liner(self, doc):
         """Return a new :class:`aeidon.Liner` instance."""
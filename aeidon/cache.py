@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Cache of parsed subtitle files for fast reopening."""
+
+import aeidon
+import array
+import hashlib
+import os
+import pickle
+
+__all__ = ("ProjectCache",)
+
+
+class ProjectCache:
+
+    """
+    Cache of parsed subtitle files for fast reopening.
+
+    :ivar directory: Path to the directory to store cache files in
+
+    Subtitles read from a file are stored in a binary cache file along with
+    the detected format and properties of the subtitle file, such as header
+    and newlines. Cache files are keyed by path, size, modification time and
+    requested encoding of the source file and a cached version is only used
+    if all of these match.
+
+    Positions are stored as packed integer arrays and texts and the values of
+    format-specific containers as plain lists and dictionaries.
+    """
+
+    # Increment to invalidate existing cache files
+    # when the stored data structure changes.
+    _version = 1
+
+    def __init__(self, directory=None):
+        """Initialize a :class:`ProjectCache` instance."""
+        self.directory = directory or os.path.join(aeidon.CACHE_HOME_DIR,
+                                                   "projects")
+
+    def _get_key(self, path, encoding):
+        """Return a tuple identifying file at `path` or ``None``."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (self._version,
+                aeidon.__version__,
+                os.path.abspath(path),
+                st.st_size,
+                st.st_mtime_ns,
+                encoding)
+
+    def _get_path(self, path):
+        """Return path to cache file for file at `path`."""
+        path = os.path.abspath(path)
+        digest = hashlib.sha1(path.encode("utf_8", "replace")).hexdigest()
+        return os.path.join(self.directory, "{}.cache".format(digest))
+
+    def load(self, path, encoding):
+        """
+        Return file, subtitles and sort count for `path` or ``None``.
+
+        ``None`` is returned if there is no cache or if the cached file is not
+        up to date, i.e. the file at `path` has been changed or is requested
+        with a different `encoding`.
+        """
+        key = self._get_key(path, encoding)
+        if key is None: return None
+        try:
+            with open(self._get_path(path), "rb") as f:
+                data = pickle.load(f)
+            if data["key"] != key: return None
+            return self._unpack(path, data)
+        except Exception:
+            # Treat corrupt and unreadable
+            # cache files as missing.
+            return None
+
+    def _pack(self, file, subtitles, sort_count):
+        """Return a dictionary of data to store."""
+        names = set(x.container for x in aeidon.formats) - set((None,))
+        containers = {}
+        for i, subtitle in enumerate(subtitles):
+            for name in names:
+                if not subtitle.has_container(name): continue
+                values = dict(vars(getattr(subtitle, name)))
+                containers.setdefault(name, []).append((i, values))
+        starts = array.array("q", [x._start for x in subtitles])
+        ends = array.array("q", [x._end for x in subtitles])
+        properties = dict((x, y) for x, y in vars(file).items()
+                          if not x in ("newline", "path", "sniffer"))
+
+        return dict(containers=containers,
+                    ends=ends.tobytes(),
+                    format=file.format.name,
+                    main_texts=[x._main_text for x in subtitles],
+                    newline=file.newline.name,
+                    properties=properties,
+                    sort_count=sort_count,
+                    starts=starts.tobytes())
+
+    def save(self, path, encoding, file, subtitles, sort_count):
+        """
+        Store `file`, `subtitles` and `sort_count` read from `path`.
+
+        `encoding` should be the encoding requested upon opening, which can
+        differ from the final encoding of `file` if a BOM was found.
+        Failure to write the cache file is silently ignored.
+        """
+        key = self._get_key(path, encoding)
+        if key is None: return
+        data = self._pack(file, subtitles, sort_count)
+        data["key"] = key
+        with aeidon.util.silent(OSError):
+            aeidon.util.makedirs(self.directory)
+            with aeidon.util.atomic_open(self._get_path(path), "wb") as f:
+                pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+
+    def _unpack(self, path, data):
+        """Return file, subtitles and sort count from `data`."""
+        format = getattr(aeidon.formats, data["format"])
+        properties = data["properties"]
+        file = aeidon.files.new(format, path, properties["encoding"])
+        for name, value in properties.items():
+            setattr(file, name, value)
+        file.newline = getattr(aeidon.newlines, data["newline"])
+        starts = array.array("q")
+        starts.frombytes(data["starts"])
+        ends = array.array("q")
+        ends.frombytes(data["ends"])
+        subtitles = []
+        for start, end, text in zip(starts, ends, data["main_texts"]):
+            subtitle = aeidon.Subtitle(file.mode)
+            subtitle._start = start
+            subtitle._end = end
+            subtitle._main_text = text
+            subtitles.append(subtitle)
+        for name, items in data["containers"].items():
+            for i, values in items:
+                container = getattr(subtitles[i], name)
+                for key, value in values.items():
+                    setattr(container, key, value)
+        return file, subtitles, data["sort_count"]
@@ -28,9 +28,15 @@ class Calculator:
     Time and frame calculator.
 
     Times are handled as strings, frames as integers and seconds as floats.
+    Additionally, milliseconds as integers are used as the internal position
+    representation of subtitles in time mode, see :class:`aeidon.Subtitle`.
     Only one instance of :class:`Calculator` exists for a given framerate.
     """
 
+    # Largest absolute position in milliseconds,
+    # i.e. the largest that can be shown as a time.
+    MAX_MILLISECONDS = 359999999
+
     _instances = {}
 
     def __new__(cls, framerate=None):
@@ -77,6 +83,10 @@ class Calculator:
         raise ValueError("Invalid type for x: {!r}"
                          .format(type(x)))
 
+    def frame_to_milliseconds(self, frame):
+        """Convert `frame` to milliseconds."""
+        return self.seconds_to_milliseconds(frame / self._framerate)
+
     def frame_to_seconds(self, frame):
         """Convert `frame` to seconds."""
         return aeidon.as_seconds(frame / self._framerate)
@@ -141,6 +151,20 @@ class Calculator:
                 0 <= seconds  <=  59 and
                 0 <= mseconds <= 999)
 
+    def milliseconds_to_frame(self, milliseconds):
+        """Convert `milliseconds` to frame."""
+        return int(round(milliseconds * self._framerate / 1000, 0))
+
+    def milliseconds_to_time(self, milliseconds):
+        """Convert `milliseconds` to time."""
+        sign = "-" if milliseconds < 0 else ""
+        milliseconds = min(abs(milliseconds), self.MAX_MILLISECONDS)
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return ("{}{:02d}:{:02d}:{:02d}.{:03d}"
+                .format(sign, hours, minutes, seconds, milliseconds))
+
     def normalize_time(self, time):
         """
         Convert `time` to valid format.
@@ -190,6 +214,12 @@ class Calculator:
         """Convert `seconds` to frame."""
         return int(round(seconds * self._framerate, 0))
 
+    def seconds_to_milliseconds(self, seconds):
+        """Convert `seconds` to milliseconds."""
+        milliseconds = int(round(seconds * 1000, 0))
+        limit = self.MAX_MILLISECONDS
+        return max(-limit, min(limit, milliseconds))
+
     def seconds_to_time(self, seconds):
         """Convert `seconds` to time."""
         sign = "-" if seconds < 0 else ""
@@ -208,6 +238,15 @@ class Calculator:
         seconds = self.time_to_seconds(time)
         return self.seconds_to_frame(seconds)
 
+    def time_to_milliseconds(self, time):
+        """Convert `time` to milliseconds."""
+        if time.startswith("-"):
+            return -self.time_to_milliseconds(time[1:])
+        return (int(time[ :2]) * 3600000 +
+                int(time[3:5]) *   60000 +
+                int(time[6:8]) *    1000 +
+                int(time[9: ]))
+
     def time_to_seconds(self, time):
         """Convert `time` to seconds."""
         coefficient = -1 if time.startswith("-") else 1
@@ -228,6 +267,17 @@ class Calculator:
         raise ValueError("Invalid type for pos: {!r}"
                          .format(type(pos)))
 
+    def to_milliseconds(self, pos):
+        """Convert `pos` to milliseconds."""
+        if aeidon.is_time(pos):
+            return self.time_to_milliseconds(pos)
+        if aeidon.is_frame(pos):
+            return self.frame_to_milliseconds(pos)
+        if aeidon.is_seconds(pos):
+            return self.seconds_to_milliseconds(pos)
+        raise ValueError("Invalid type for pos: {!r}"
+                         .format(type(pos)))
+
     def to_seconds(self, pos):
         """Convert `pos` to seconds."""
         if aeidon.is_time(pos):
@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Converting subtitle files in batch from the command line.
+
+Files are converted in parallel in a pool of processes, each file opened
+with a fresh :class:`aeidon.Project` and saved in the target format. Markup
+is converted as usual when saving in a different format.
+"""
+
+import aeidon
+import argparse
+import collections
+import concurrent.futures
+import glob
+import os
+import sys
+import time
+
+from aeidon.i18n import _
+
+
+def convert_file(path,
+                 target,
+                 format,
+                 encoding=None,
+                 target_encoding=None,
+                 newline=None,
+                 framerate=None,
+                 target_framerate=None):
+
+    """
+    Convert subtitle file at `path` to `format` and write to `target`.
+
+    `format`, `newline` and framerates should be :attr:`aeidon.formats`,
+    :attr:`aeidon.newlines` and :attr:`aeidon.framerates` items. `encoding`
+    can be ``None`` to use the system default encoding or "auto" to detect
+    encoding. `target_encoding` and `newline` can be ``None`` to use the same
+    as in the input file. `target_framerate` can be ``None`` to not convert
+    framerate.
+
+    Raise :exc:`IOError` if reading or writing fails.
+    Raise :exc:`UnicodeError` if decoding or encoding fails.
+    Raise :exc:`aeidon.FormatError` if unable to detect format.
+    Raise :exc:`aeidon.ParseError` if parsing fails.
+    """
+    if encoding == "auto":
+        encoding = aeidon.FileSniffer(path).detect_encoding()
+        if encoding is None:
+            raise UnicodeError("Failed to detect encoding of file {!r}"
+                               .format(path))
+
+    project = aeidon.Project(framerate)
+    project.open_main(path, encoding)
+    if target_framerate is not None and target_framerate != project.framerate:
+        project.convert_framerate(None, project.framerate, target_framerate)
+    file = aeidon.files.new(format,
+                            target,
+                            target_encoding or project.main_file.encoding,
+                            newline or project.main_file.newline)
+
+    directory = os.path.dirname(file.path)
+    if not os.path.isdir(directory):
+        aeidon.util.makedirs(directory)
+    project.save_main(file)
+
+def _convert_job(job):
+    """Convert file as defined by `job` and return a result tuple."""
+    path, target, kwargs = job
+    # Enumeration items are passed by name to keep jobs easily picklable.
+    kwargs = dict(kwargs)
+    for key, enum in (("format", aeidon.formats),
+                      ("newline", aeidon.newlines),
+                      ("framerate", aeidon.framerates),
+                      ("target_framerate", aeidon.framerates)):
+        if kwargs.get(key) is not None:
+            kwargs[key] = getattr(enum, kwargs[key])
+    start = time.perf_counter()
+    message = None
+    try:
+        convert_file(path, target, **kwargs)
+    except Exception as error:
+        message = str(error) or repr(error)
+    return path, target, time.perf_counter() - start, message
+
+def find_files(paths):
+    """
+    Return a list of ``(path, relative)`` tuples for files in `paths`.
+
+    `paths` can contain files, directories and glob patterns. Directories are
+    searched recursively for files with extensions of known subtitle formats.
+    `relative` is the path relative to the directory searched, the directory
+    part of glob patterns without wildcards or the basename for files given
+    directly.
+    """
+    found = []
+    extensions = tuple(set(x.extension for x in aeidon.formats))
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if not name.lower().endswith(extensions): continue
+                    child = os.path.join(root, name)
+                    found.append((child, os.path.relpath(child, path)))
+            continue
+        matches = [path] if os.path.isfile(path) else sorted(
+            glob.glob(path, recursive=True))
+        root = _get_glob_root(path)
+        for match in filter(os.path.isfile, matches):
+            found.append((match, os.path.relpath(match, root)))
+    return found
+
+def _get_framerates():
+    """Return a dictionary mapping framerate strings to framerates."""
+    return dict(("{:.3f}".format(x.value), x) for x in aeidon.framerates)
+
+def _get_glob_root(pattern):
+    """Return directory part of `pattern` before any wildcards."""
+    root = os.path.dirname(pattern)
+    while glob.has_magic(root):
+        root = os.path.dirname(root)
+    return root or os.curdir
+
+def _get_target(relative, format, output_dir):
+    """Return path of file to write for input file `relative`."""
+    root = os.path.splitext(relative)[0]
+    return os.path.abspath(os.path.join(output_dir, root + format.extension))
+
+def main(args):
+    """Parse arguments, convert files and exit."""
+    aeidon.i18n.bind()
+    opts = _parse_args(args)
+    format = _parse_format(opts.format)
+    kwargs = dict(format=format.name,
+                  encoding=opts.encoding,
+                  target_encoding=opts.target_encoding,
+                  newline=_parse_newline(opts.newline),
+                  framerate=_parse_framerate(opts.framerate),
+                  target_framerate=_parse_framerate(opts.target_framerate))
+
+    jobs = [(path, _get_target(relative, format, opts.output_dir), kwargs)
+            for path, relative in find_files(opts.paths)]
+    failures = 0
+    start = time.perf_counter()
+    # Fail files that would be written to the same target instead of
+    # letting conversions in parallel overwrite each other's output
+    # and files that would overwrite themselves unless asked to.
+    counts = collections.Counter(x[1] for x in jobs)
+    valid_jobs = []
+    for path, target, kwargs in jobs:
+        if counts[target] > 1:
+            failures += 1
+            print(_("{}: Several files would be written to {}").format(
+                path, target), file=sys.stderr)
+            continue
+        if (not opts.in_place and
+            os.path.exists(target) and
+            os.path.samefile(path, target)):
+            failures += 1
+            print(_("{}: File would be overwritten, "
+                    "use --in-place to allow").format(path), file=sys.stderr)
+            continue
+        valid_jobs.append((path, target, kwargs))
+    with concurrent.futures.ProcessPoolExecutor(opts.jobs) as executor:
+        futures = [executor.submit(_convert_job, x) for x in valid_jobs]
+        for future in concurrent.futures.as_completed(futures):
+            path, target, seconds, error = future.result()
+            if error is None:
+                print("{:.3f} s {} -> {}".format(seconds, path, target))
+                continue
+            failures += 1
+            print("{:.3f} s {}: {}".format(seconds, path, error),
+                  file=sys.stderr)
+
+    print(_("Converted {:d} of {:d} files in {:.3f} s").format(
+        len(jobs) - failures, len(jobs), time.perf_counter() - start))
+    raise SystemExit(1 if failures else 0)
+
+def _parse_args(args):
+    """Parse and return options from `args`."""
+    parser = argparse.ArgumentParser(
+        prog="aeidon-convert",
+        usage=_("aeidon-convert [OPTION...] -f FORMAT PATH..."))
+
+    parser.add_argument(
+        "paths",
+        metavar=_("PATH..."),
+        nargs="+",
+        help=_("subtitle files, directories or glob patterns to convert"))
+
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="aeidon-convert {}".format(aeidon.__version__))
+
+    parser.add_argument(
+        "-f", "--format",
+        action="store",
+        metavar=_("FORMAT"),
+        dest="format",
+        required=True,
+        choices=[x.name.lower() for x in aeidon.formats],
+        help=_("format to convert to"))
+
+    parser.add_argument(
+        "-o", "--output-dir",
+        action="store",
+        metavar=_("DIRECTORY"),
+        dest="output_dir",
+        default=os.curdir,
+        help=_("directory to write converted files to"))
+
+    parser.add_argument(
+        "-i", "--in-place",
+        action="store_true",
+        dest="in_place",
+        default=False,
+        help=_("allow overwriting files being converted"))
+
+    parser.add_argument(
+        "-e", "--encoding",
+        action="store",
+        metavar=_("ENCODING"),
+        dest="encoding",
+        default=None,
+        help=_("character encoding used to open files or 'auto'"))
+
+    parser.add_argument(
+        "-E", "--target-encoding",
+        action="store",
+        metavar=_("ENCODING"),
+        dest="target_encoding",
+        default=None,
+        help=_("character encoding used to write files"))
+
+    parser.add_argument(
+        "-n", "--newline",
+        action="store",
+        metavar=_("NEWLINE"),
+        dest="newline",
+        default=None,
+        choices=[x.name.lower() for x in aeidon.newlines],
+        help=_("newline type used to write files"))
+
+    parser.add_argument(
+        "-r", "--framerate",
+        action="store",
+        metavar=_("FPS"),
+        dest="framerate",
+        default=None,
+        choices=sorted(_get_framerates()),
+        help=_("framerate of files to convert"))
+
+    parser.add_argument(
+        "-R", "--target-framerate",
+        action="store",
+        metavar=_("FPS"),
+        dest="target_framerate",
+        default=None,
+        choices=sorted(_get_framerates()),
+        help=_("framerate to convert files to"))
+
+    parser.add_argument(
+        "-j", "--jobs",
+        action="store",
+        metavar=_("N"),
+        dest="jobs",
+        type=int,
+        default=None,
+        help=_("amount of files to convert in parallel"))
+
+    opts = parser.parse_args(args)
+    for name in ("encoding", "target_encoding"):
+        value = getattr(opts, name)
+        if value in (None, "auto"): continue
+        setattr(opts, name, aeidon.encodings.translate_code(value))
+    return opts
+
+def _parse_format(name):
+    """Return format item corresponding to `name`."""
+    return getattr(aeidon.formats, name.upper())
+
+def _parse_framerate(value):
+    """Return name of framerate corresponding to `value` or ``None``."""
+    if value is None: return None
+    return _get_framerates()[value].name
+
+def _parse_newline(name):
+    """Return name of newline item corresponding to `name` or ``None``."""
+    if name is None: return None
+    return name.upper()
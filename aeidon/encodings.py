@@ -174,20 +174,17 @@ def detect(path):
 
     Raise :exc:`IOError` if reading fails.
     """
-    bom_encoding = detect_bom(path)
-    if bom_encoding is not None:
-        return bom_encoding
-    from charset_normalizer import from_path
-    detector = from_path(path)
-    result = detector.best()
-    if result is None:
-        return None
-    return result.encoding
+    with open(path, "rb") as f:
+        return detect_bytes(f.read())
 
 def detect_bom(path):
     """Return corresponding encoding if BOM found, else ``None``."""
     with open(path, "rb") as f:
         line = f.readline()
+    return detect_bom_bytes(line)
+
+def detect_bom_bytes(line):
+    """Return corresponding encoding if BOM found in `line`, else ``None``."""
     if (line.startswith(codecs.BOM_UTF32_BE) and
         is_valid_code("utf_32_be")):
         return "utf_32_be"
@@ -205,6 +202,18 @@ def detect_bom(path):
         return "utf_16_le"
     return None
 
+def detect_bytes(blob):
+    """Detect the encoding of `blob` and return code or ``None``."""
+    bom_encoding = detect_bom_bytes(blob[:4])
+    if bom_encoding is not None:
+        return bom_encoding
+    from charset_normalizer import from_bytes
+    detector = from_bytes(blob)
+    result = detector.best()
+    if result is None:
+        return None
+    return result.encoding
+
 @aeidon.deco.once
 def get_locale_code():
     """Return code of the locale encoding or ``None``."""
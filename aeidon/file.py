@@ -20,7 +20,6 @@
 import aeidon
 import codecs
 import os
-import re
 
 __all__ = ("SubtitleFile",)
 
@@ -37,6 +36,10 @@ class SubtitleFile:
     :ivar header: String of metadata at the top of the file
     :ivar newline: :attr:`aeidon.newlines` item, detected upon read
     :ivar path: Full, absolute path to the file on disk
+    :ivar sniffer: :class:`aeidon.FileSniffer` to read from or ``None``
+
+       If set, file data is read from the buffer of :attr:`sniffer`
+       instead of disk. The sniffer is released once read.
 
     If the file format contains a header, it will default to a fairly blank
     template header read upon instantiation of the class, from either
@@ -46,6 +49,9 @@ class SubtitleFile:
     format = aeidon.formats.NONE
     mode = aeidon.modes.NONE
 
+    # Amount of characters to render before writing to file.
+    _block_size = 65536
+
     def __init__(self, path, encoding, newline=None):
         """Initialize a :class:`SubtitleFile` instance."""
         self.encoding = encoding
@@ -55,6 +61,7 @@ class SubtitleFile:
 
         self.newline = newline or aeidon.util.get_default_newline()
         self.path = os.path.abspath(path)
+        self.sniffer = None
 
     def copy_from(self, other):
         """Copy generic properties from `other`."""
@@ -66,6 +73,54 @@ class SubtitleFile:
         """Return a new subtitle instance with proper properties."""
         return aeidon.Subtitle(self.mode)
 
+    def iter_subtitles(self):
+        """
+        Read file and yield subtitles one at a time.
+
+        Formats that support streaming read the file line by line, keeping
+        only the subtitle being parsed in memory. Other formats fall back to
+        reading all subtitles first with :meth:`read`. :attr:`header`,
+        :attr:`encoding` and :attr:`newline` are updated as reading proceeds
+        and are final only once the generator is exhausted.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        yield from self.read()
+
+    def _iter_lines(self):
+        """
+        Read file and yield lines one at a time.
+
+        All newlines are stripped.
+        All blank lines from beginning and end are skipped.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        blanks = []
+        first = True
+        started = False
+        with open(self.path, "r", encoding=self.encoding) as f:
+            for line in f:
+                if line.endswith("\n"):
+                    line = line[:-1]
+                if first:
+                    line = self._strip_bom(line)
+                    first = False
+                if not line.strip():
+                    # Hold back blank lines until followed by text
+                    # so that blank lines at the end are skipped.
+                    if started:
+                        blanks.append(line)
+                    continue
+                yield from blanks
+                blanks = []
+                started = True
+                yield line
+            newline = aeidon.util.get_newline(f.newlines)
+        if newline is not None:
+            self.newline = newline
+
     def read(self):
         """
         Read file and return subtitles.
@@ -85,24 +140,30 @@ class SubtitleFile:
         Raise :exc:`UnicodeError` if decoding fails.
         Return a list of lines read.
         """
-        re_newline_char = re.compile(r"\r?\n?$")
-        with open(self.path, "r", encoding=self.encoding) as f:
-            lines = f.readlines()
-            lines = [re_newline_char.sub("", x) for x in lines]
-        for index in (0, -1):
-            while lines and not lines[index].strip():
-                lines.pop(index)
-        newline = aeidon.util.detect_newlines(self.path)
+        sniffer = self.sniffer or aeidon.FileSniffer(self.path)
+        if sniffer.path != self.path:
+            sniffer = aeidon.FileSniffer(self.path)
+        lines = sniffer.read_lines(self.encoding)
+        start = 0
+        end = len(lines)
+        while start < end and not lines[start].strip():
+            start += 1
+        while end > start and not lines[end-1].strip():
+            end -= 1
+        lines = lines[start:end]
+        newline = sniffer.detect_newlines(self.encoding)
         if newline is not None:
             self.newline = newline
         if self.encoding == "utf_8":
             bom = str(codecs.BOM_UTF8, "utf_8")
             if lines and lines[0].startswith(bom):
-                # If a UTF-8 BOM (a.k.a. signature) is found, reread file with
+                # If a UTF-8 BOM (a.k.a. signature) is found, decode file with
                 # UTF-8-SIG encoding, which automatically strips the BOM when
                 # reading and adds it when writing.
                 self.encoding = "utf_8_sig"
+                self.sniffer = sniffer
                 return SubtitleFile._read_lines(self)
+        self.sniffer = None
         if self.encoding.startswith("utf_16"):
             # Python automatically strips the UTF-16 BOM when reading, but only
             # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
@@ -119,6 +180,26 @@ class SubtitleFile:
                 lines = [lines[i] for i in range(0, len(lines), 2)]
         return lines
 
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
+        raise NotImplementedError
+
+    def _strip_bom(self, line):
+        """Return `line` with BOM removed, updating encoding properties."""
+        if self.encoding == "utf_8":
+            bom = str(codecs.BOM_UTF8, "utf_8")
+            if line.startswith(bom):
+                # Equivalent to reading with UTF-8-SIG encoding,
+                # see the corresponding comment in _read_lines.
+                self.encoding = "utf_8_sig"
+                return line[len(bom):]
+        if self.encoding.startswith("utf_16"):
+            bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
+            if line.startswith(bom):
+                self.has_utf_16_bom = True
+                return line[len(bom):]
+        return line
+
     def write(self, subtitles, doc):
         """
         Write `subtitles` with text from `doc` to file.
@@ -145,7 +226,18 @@ class SubtitleFile:
         """
         Write `subtitles` with text from `doc` to file `f`.
 
+        Strings yielded by :meth:`_render` are joined and written in blocks
+        of :attr:`_block_size` characters to avoid overhead per subtitle.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
-        raise NotImplementedError
+        blocks = []
+        size = 0
+        for block in self._render(subtitles, doc):
+            blocks.append(block)
+            size += len(block)
+            if size < self._block_size: continue
+            f.write("".join(blocks))
+            blocks = []
+            size = 0
+        f.write("".join(blocks))
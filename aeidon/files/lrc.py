@@ -61,19 +61,14 @@ class LRC(aeidon.SubtitleFile):
         subtitles[-1].duration_seconds = 5
         return subtitles[1:]
 
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
         if self.header.strip():
-            f.write(self.header.strip() + "\n\n")
+            yield self.header.strip() + "\n\n"
         for subtitle in subtitles:
             start = subtitle.calc.round(subtitle.start_time, 2)
             sign = "-" if start.startswith("-") else ""
             first = 4 if start.startswith("-") else 3
             start = sign + start[first:-1]
             text = subtitle.get_text(doc).replace("\n", " ")
-            f.write("[{}]{}\n".format(start, text))
+            yield "[{}]{}\n".format(start, text)
@@ -31,38 +31,44 @@ class MicroDVD(aeidon.SubtitleFile):
     mode = aeidon.modes.FRAME
     _re_line = re.compile(r"^\{(-?\d+)\}\{(-?\d+)\}(.*?)$")
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one at a time.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        yield from self._parse(self._iter_lines())
+
+    def _parse(self, lines):
+        """Parse `lines` and yield subtitles."""
+        for line in lines:
             match = self._re_line.match(line)
             if match is not None:
                 subtitle = self._get_subtitle()
                 subtitle.start_frame = int(match.group(1))
                 subtitle.end_frame = int(match.group(2))
                 subtitle.main_text = match.group(3).replace("|", "\n")
-                subtitles.append(subtitle)
+                yield subtitle
             elif line.startswith("{DEFAULT}"):
                 self.header = line
-        return subtitles
 
-    def write_to_file(self, subtitles, doc, f):
+    def read(self):
         """
-        Write `subtitles` from `doc` to file `f`.
+        Read file and return subtitles.
 
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
         """
+        return list(self._parse(self._read_lines()))
+
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
         if self.header.strip():
-            f.write(self.header + "\n")
+            yield self.header + "\n"
         for subtitle in subtitles:
             text = subtitle.get_text(doc).replace("\n", "|")
-            f.write(("{{{:d}}}{{{:d}}}{}\n"
-                     .format(subtitle.start_frame,
-                             subtitle.end_frame,
-                             text)))
+            yield ("{{{:d}}}{{{:d}}}{}\n"
+                   .format(subtitle.start_frame,
+                           subtitle.end_frame,
+                           text))
@@ -31,34 +31,40 @@ class MPL2(aeidon.SubtitleFile):
     mode = aeidon.modes.TIME
     _re_line = re.compile(r"^\[(-?\d+)\]\[(-?\d+)\](.*?)$")
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one at a time.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        yield from self._parse(self._iter_lines())
+
+    def _parse(self, lines):
+        """Parse `lines` and yield subtitles."""
+        for line in lines:
             match = self._re_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_seconds = float(match.group(1)) / 10
             subtitle.end_seconds = float(match.group(2)) / 10
             subtitle.main_text = match.group(3).replace("|", "\n")
-            subtitles.append(subtitle)
-        return subtitles
+            yield subtitle
 
-    def write_to_file(self, subtitles, doc, f):
+    def read(self):
         """
-        Write `subtitles` from `doc` to file `f`.
+        Read file and return subtitles.
 
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
         """
+        return list(self._parse(self._read_lines()))
+
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
         for subtitle in subtitles:
             text = subtitle.get_text(doc).replace("\n", "|")
-            f.write(("[{:.0f}][{:.0f}]{}\n"
-                     .format(subtitle.start_seconds * 10,
-                             subtitle.end_seconds * 10,
-                             text)))
+            yield ("[{:.0f}][{:.0f}]{}\n"
+                   .format(subtitle.start_seconds * 10,
+                           subtitle.end_seconds * 10,
+                           text))
@@ -93,53 +93,67 @@ class SubStationAlpha(aeidon.SubtitleFile):
         name = aeidon.util.title_to_lower_case(field_name)
         return getattr(subtitle.ssa, name)
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one at a time.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        lines = self._read_lines()
+        yield from self._parse(self._iter_lines())
+
+    def _parse(self, lines):
+        """Parse `lines` and yield subtitles."""
+        lines = iter(lines)
         self._read_header(lines)
+        indices = None
         for line in lines:
-            if not line.startswith("Format:"): continue
-            line = line.replace("Format:", "").strip()
-            fields = self._re_separator.split(line)
-            indices = dict((x, fields.index(x)) for x in fields)
-            max_split = len(fields) - 1
-        for line in lines:
+            if line.startswith("Format:"):
+                line = line.replace("Format:", "").strip()
+                fields = self._re_separator.split(line)
+                indices = dict((x, fields.index(x)) for x in fields)
+                max_split = len(fields) - 1
+                self.event_fields = tuple(fields)
+                continue
             if not line.startswith("Dialogue:"): continue
+            if indices is None:
+                raise aeidon.ParseError("Dialogue before format line")
             line = line.replace("Dialogue:", "").lstrip()
             values = self._re_separator.split(line, max_split)
             subtitle = self._get_subtitle()
             for name, index in indices.items():
                 self._decode_field(name, values[index], subtitle)
-            subtitles.append(subtitle)
-        self.event_fields = tuple(fields)
-        return subtitles
+            yield subtitle
+        if indices is None:
+            raise aeidon.ParseError("No format line found")
+
+    def read(self):
+        """
+        Read file and return subtitles.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return list(self._parse(self._read_lines()))
 
     def _read_header(self, lines):
-        """Read header and remove its lines."""
+        """Read header from iterator `lines` up to events section."""
         self.header = ""
-        while not lines[0].startswith("[Events]"):
+        for line in lines:
+            if line.startswith("[Events]"): break
             self.header += "\n"
-            self.header += lines.pop(0)
+            self.header += line
+        else:
+            raise aeidon.ParseError("No events section found")
         self.header = self.header.strip()
 
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        f.write(self.header + "\n\n")
-        f.write("[Events]\n")
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
+        yield self.header + "\n\n"
+        yield "[Events]\n"
         fields = ", ".join(self.event_fields)
-        f.write("Format: {}\n".format(fields))
+        yield "Format: {}\n".format(fields)
         for subtitle in subtitles:
-            f.write("Dialogue: {}\n".format(",".join([
+            yield "Dialogue: {}\n".format(",".join([
                 self._encode_field(x, subtitle, doc)
-                for x in self.event_fields])))
+                for x in self.event_fields]))
@@ -39,21 +39,39 @@ class SubRip(aeidon.SubtitleFile):
         r" (-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3})"
         r"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?\s*$"))
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one at a time.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        yield from self._parse(self._iter_lines())
+
+    def _parse(self, lines):
+        """Parse `lines` and yield subtitles."""
+        subtitle = None
+        # Hold back the last two lines read, since a number and
+        # a blank line above it, if followed by a time line,
+        # are not part of the text of the preceding subtitle.
+        pending = []
+        for line in lines:
             match = self._re_time_line.match(line)
             if match is None:
-                if subtitles[-1].main_text:
-                    subtitles[-1].main_text += "\n"
-                subtitles[-1].main_text += line
+                pending.append(line)
+                if len(pending) > 2:
+                    self._parse_text(subtitle, pending.pop(0))
                 continue
+            # Remove numbers and blank lines above them.
+            if pending and pending[-1].strip().isdigit():
+                pending.pop()
+                if pending and not pending[-1].strip():
+                    pending.pop()
+            for text in pending:
+                self._parse_text(subtitle, text)
+            pending = []
+            if subtitle is not None:
+                yield subtitle
             subtitle = self._get_subtitle()
             subtitle.start_time = subtitle.calc.normalize_time(match.group(1))
             subtitle.end_time = subtitle.calc.normalize_time(match.group(2))
@@ -62,35 +80,36 @@ class SubRip(aeidon.SubtitleFile):
                 subtitle.subrip.x2 = int(match.group(5))
                 subtitle.subrip.y1 = int(match.group(6))
                 subtitle.subrip.y2 = int(match.group(7))
-            subtitles.append(subtitle)
-        return subtitles
-
-    def _read_lines(self):
-        """Read file to a unicoded list of lines."""
-        lines = ["\n"]
-        for line in aeidon.SubtitleFile._read_lines(self):
-            lines.append(line)
-            match = self._re_time_line.match(line)
-            if match is None: continue
-            # Remove numbers and blank lines above them.
-            if lines[-2].strip().isdigit():
-                if not lines[-3].strip():
-                    lines.pop(-3)
-                lines.pop(-2)
-        return lines
+        for text in pending:
+            self._parse_text(subtitle, text)
+        if subtitle is not None:
+            yield subtitle
+
+    def _parse_text(self, subtitle, line):
+        """Add `line` to the text of `subtitle`."""
+        if subtitle is None:
+            raise aeidon.ParseError("Text before first time line: {!r}"
+                                    .format(line))
 
-    def write_to_file(self, subtitles, doc, f):
+        if subtitle.main_text:
+            subtitle.main_text += "\n"
+        subtitle.main_text += line
+
+    def read(self):
         """
-        Write `subtitles` from `doc` to file `f`.
+        Read file and return subtitles.
 
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
         """
+        return list(self._parse(self._read_lines()))
+
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
         for i, subtitle in enumerate(subtitles):
-            f.write("{:d}\n".format(i + 1))
             start = subtitle.start_time.replace(".", ",")
             end = subtitle.end_time.replace(".", ",")
-            f.write("{} --> {}".format(start, end))
+            coordinates = ""
             # Write Extended SubRip coordinates only if the container
             # has been initialized and the coordinates make some sense.
             if subtitle.has_container("subrip"):
@@ -99,7 +118,11 @@ class SubRip(aeidon.SubtitleFile):
                 y1 = subtitle.subrip.y1
                 y2 = subtitle.subrip.y2
                 if not x1 == x2 == y1 == y2 == 0:
-                    f.write("  X1:{:03d} X2:{:03d}".format(x1, x2))
-                    f.write( " Y1:{:03d} Y2:{:03d}".format(y1, y2))
-            f.write("\n{}\n".format(subtitle.get_text(doc)))
-            f.write("\n")
+                    coordinates = ("  X1:{:03d} X2:{:03d} Y1:{:03d} Y2:{:03d}"
+                                   .format(x1, x2, y1, y2))
+            yield ("{:d}\n{} --> {}{}\n{}\n\n"
+                   .format(i + 1,
+                           start,
+                           end,
+                           coordinates,
+                           subtitle.get_text(doc)))
@@ -57,16 +57,11 @@ class SubViewer2(aeidon.SubtitleFile):
             subtitles.append(subtitle)
         return subtitles
 
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        f.write(self.header + "\n")
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
+        yield self.header + "\n"
         for subtitle in subtitles:
             start = subtitle.calc.round(subtitle.start_time, 2)[:-1]
             end = subtitle.calc.round(subtitle.end_time, 2)[:-1]
             text = subtitle.get_text(doc).replace("\n", "[br]")
-            f.write("\n{},{}\n{}\n".format(start, end, text))
+            yield "\n{},{}\n{}\n".format(start, end, text)
@@ -43,15 +43,22 @@ class TMPlayer(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.two_digit_hour = other.two_digit_hour
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one at a time.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
+        yield from self._parse(self._iter_lines())
+
+    def _parse(self, lines):
+        """Parse `lines` and yield subtitles."""
+        # Each subtitle ends where the next one starts,
+        # so yield subtitles one line late.
+        previous = None
+        for line in lines:
+            subtitle = None
             match = self._re_one_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
@@ -62,29 +69,35 @@ class TMPlayer(aeidon.SubtitleFile):
                     time = time[1:]
                 time = sign + "0" + time
                 subtitle.start_time = time
-                subtitles[-1].end_time = time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
                 self.two_digit_hour = False
             match = self._re_two_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
                 subtitle = self._get_subtitle()
                 subtitle.start_time = line[:i-1] + ".000"
-                subtitles[-1].end_time = subtitle.start_time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
                 self.two_digit_hour = True
-        subtitles[-1].duration_seconds = 5
-        return subtitles[1:]
+            if subtitle is None: continue
+            if previous is not None:
+                previous.end_time = subtitle.start_time
+                yield previous
+            previous = subtitle
+        if previous is not None:
+            previous.duration_seconds = 5
+            yield previous
 
-    def write_to_file(self, subtitles, doc, f):
+    def read(self):
         """
-        Write `subtitles` from `doc` to file `f`.
+        Read file and return subtitles.
 
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
         """
+        return list(self._parse(self._read_lines()))
+
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
         for subtitle in subtitles:
             start = subtitle.calc.round(subtitle.start_time, 0)
             start = (start[:-4] if self.two_digit_hour
@@ -93,4 +106,4 @@ class TMPlayer(aeidon.SubtitleFile):
                            else start[1:-4]))
 
             text = subtitle.get_text(doc).replace("\n", "|")
-            f.write("{}:{}\n".format(start, text))
+            yield "{}:{}\n".format(start, text)
@@ -18,6 +18,7 @@
 """WebVTT file."""
 
 import aeidon
+import itertools
 import re
 
 __all__ = ("WebVTT",)
@@ -45,22 +46,28 @@ class WebVTT(aeidon.SubtitleFile):
         r" (-?(?:\d{1,2}:)?\d{1,2}:\d{1,2}\.\d{1,3})"
         r"(\s+.+)?\s*$"))
 
-    def read(self):
+    def iter_subtitles(self):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles one at a time.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
+        yield from self._parse(self._iter_lines())
+
+    def _parse(self, lines):
+        """Parse `lines` and yield subtitles."""
+        subtitle = None
         current = "header"
+        previous = ""
         self.header = ""
-        lines = list(self._read_lines()) + [""]
-        for i, line in enumerate(lines):
+        for line in itertools.chain(lines, [""]):
             if not line.strip():
                 # A blank line terminates the preceding block.
+                if current == "text":
+                    yield subtitle
                 if current in ("header", "text"):
-                    subtitles.append(self._get_subtitle())
+                    subtitle = self._get_subtitle()
                 current = None
             elif current == "header":
                 # Header should be one line, but allow a block.
@@ -70,7 +77,6 @@ class WebVTT(aeidon.SubtitleFile):
             elif (self._re_style.match(line) or
                   current == "style"):
                 # Bind CSS styles to following subtitle.
-                subtitle = subtitles[-1]
                 if subtitle.webvtt.style:
                     subtitle.webvtt.style += "\n"
                 subtitle.webvtt.style += line
@@ -78,7 +84,6 @@ class WebVTT(aeidon.SubtitleFile):
             elif (self._re_comment.match(line) or
                   current == "comment"):
                 # Bind comments to following subtitle.
-                subtitle = subtitles[-1]
                 if subtitle.webvtt.comment:
                     subtitle.webvtt.comment += "\n"
                 subtitle.webvtt.comment += line
@@ -86,9 +91,8 @@ class WebVTT(aeidon.SubtitleFile):
             elif self._re_time_line.match(line):
                 # Time lines form a block with an optional preceding
                 # cue identifier and following text.
-                subtitle = subtitles[-1]
-                if lines[i-1].strip():
-                    subtitle.webvtt.id = lines[i-1]
+                if previous.strip():
+                    subtitle.webvtt.id = previous
                 match = self._re_time_line.match(line)
                 normalize = subtitle.calc.normalize_time
                 subtitle.start_time = normalize(match.group(1))
@@ -97,39 +101,46 @@ class WebVTT(aeidon.SubtitleFile):
                 current = "text"
             elif current == "text":
                 # Append inividual lines to text block.
-                subtitle = subtitles[-1]
                 if subtitle.main_text:
                     subtitle.main_text += "\n"
                 subtitle.main_text += line
+            previous = line
         # The last blank line has opened a new subtitle without times or text,
         # which we skip. This also means that any possible styles or comments
         # after the last actual subtitle are thrown out as well.
-        return subtitles[:-1]
 
-    def write_to_file(self, subtitles, doc, f):
+    def read(self):
         """
-        Write `subtitles` from `doc` to file `f`.
+        Read file and return subtitles.
 
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
         """
-        writen = lambda x: f.write(x + "\n")
-        nwriten = lambda x: f.write("\n" + x + "\n")
-        writen(self.header.strip() or "WEBVTT")
+        return list(self._parse(self._read_lines()))
+
+    def _render(self, subtitles, doc):
+        """Render `subtitles` from `doc` and yield strings to write."""
+        yield (self.header.strip() or "WEBVTT") + "\n"
         first = 3 if subtitles[-1].end_seconds < 3600 else 0
-        for i, subtitle in enumerate(subtitles):
-            if subtitle.webvtt.style:
-                nwriten(subtitle.webvtt.style)
-            if subtitle.webvtt.comment:
-                nwriten(subtitle.webvtt.comment)
-            f.write("\n")
-            if subtitle.webvtt.id:
-                writen(subtitle.webvtt.id)
+        for subtitle in subtitles:
+            webvtt = (subtitle.webvtt
+                      if subtitle.has_container("webvtt")
+                      else None)
+
+            block = []
+            if webvtt is not None and webvtt.style:
+                block.append("\n" + webvtt.style + "\n")
+            if webvtt is not None and webvtt.comment:
+                block.append("\n" + webvtt.comment + "\n")
+            block.append("\n")
+            if webvtt is not None and webvtt.id:
+                block.append(webvtt.id + "\n")
             # Write times as MM:SS.SSS if all times are less
             # than an hour, else the usual HH:MM:SS.SSS.
             start = subtitle.start_time[first:]
             end = subtitle.end_time[first:]
-            f.write("{} --> {}".format(start, end))
-            if subtitle.webvtt.settings:
-                f.write(" {}".format(subtitle.webvtt.settings.strip()))
-            f.write("\n{}\n".format(subtitle.get_text(doc)))
+            block.append("{} --> {}".format(start, end))
+            if webvtt is not None and webvtt.settings:
+                block.append(" {}".format(webvtt.settings.strip()))
+            block.append("\n{}\n".format(subtitle.get_text(doc)))
+            yield "".join(block)
@@ -17,6 +17,7 @@
 
 """String and regular expression finder and replacer."""
 
+import bisect
 import re
 
 __all__ = ("Finder",)
@@ -30,17 +31,23 @@ class Finder:
     :ivar ignore_case: ``True`` to ignore case when finding matches
     :ivar match: Regular expression object for the latest match of pattern
     :ivar match_span: Tuple of start and end position for match
+    :ivar _matches: Text, pattern, matches and their end positions or ``None``
     :ivar pattern: String or regular expression object to find
     :ivar pos: Current offset from the beginning of the text
     :ivar replacement: Plain- or regular expression replacement string
     :ivar text: Target text to find matches of pattern in
     """
 
+    # Patterns whose match can depend on text before the position searched
+    # from, i.e. those with start anchors, word boundaries or lookbehinds.
+    _re_lookbehind = re.compile(r"(?<!\[)\^|\\[AbB]|\(\?<[=!]")
+
     def __init__(self):
         """Initialize a :class:`Finder` instance."""
         self.ignore_case = False
         self.match = None
         self.match_span = None
+        self._matches = None
         self.pattern = None
         self.pos = None
         self.replacement = None
@@ -104,18 +111,18 @@ class Finder:
                 raise StopIteration
             self.match_span = (index, index + len(pattern))
         else: # Regular expression
-            iterator = self.pattern.finditer(self.text)
-            match = None
-            while True:
-                try:
-                    candidate = next(iterator)
-                    if candidate.end() > self.pos:
-                        raise StopIteration
-                except StopIteration:
-                    break
-                match = candidate
-            if match is None:
+            if (self._matches is None or
+                self._matches[:2] != (self.text, self.pattern)):
+                # Cache matches to avoid finding all of them
+                # again when called repeatedly for the same text.
+                matches = list(self.pattern.finditer(self.text))
+                ends = [x.end() for x in matches]
+                self._matches = (self.text, self.pattern, matches, ends)
+            matches, ends = self._matches[2:]
+            i = bisect.bisect_right(ends, self.pos) - 1
+            if i < 0:
                 raise StopIteration
+            match = matches[i]
             # Avoid getting stuck with zero-length regular expressions.
             if match.span() == self.match_span == (self.pos, self.pos):
                 if self.pos == 0:
@@ -137,8 +144,9 @@ class Finder:
         a, z = self.match_span
         orig_length = len(self.text)
         replacement = self.replacement
-        if not isinstance(self.pattern, str):
-            replacement = self.match.expand(self.replacement)
+        if not isinstance(self.pattern, str) and "\\" in replacement:
+            # Expand only replacements that can refer to groups.
+            replacement = self.match.expand(replacement)
         self.text = self.text[:a] + replacement + self.text[z:]
         shift = len(self.text) - orig_length
         self.pos = (z + shift) if next else a
@@ -151,6 +159,66 @@ class Finder:
         """
         Replace all occurences of pattern.
 
+        Each match is found in the text as modified by preceding replacements,
+        which matters for patterns that depend on context, e.g. ones with
+        a multiline ``^``. Raise :exc:`re.error` if bad replacement.
+        Return the amount of substitutions made.
+        """
+        if (not isinstance(self.pattern, str) and
+            self._re_lookbehind.search(self.pattern.pattern)):
+            # Patterns that look behind can match differently in the text
+            # as modified by preceding replacements, which each match
+            # must then be found in.
+            return self._replace_each()
+        text = self.text
+        pattern = self.pattern
+        if isinstance(pattern, str) and self.ignore_case:
+            text = text.lower()
+            pattern = pattern.lower()
+        # Expand only replacements that can refer to groups.
+        expand = not isinstance(pattern, str) and "\\" in self.replacement
+        # Join the replaced text once at the end
+        # instead of rebuilding it for each match.
+        segments = []
+        count = 0
+        end = 0
+        pos = 0
+        empty_pos = None
+        while True:
+            if isinstance(pattern, str):
+                a = text.find(pattern, pos)
+                if a < 0: break
+                z = a + len(pattern)
+            else: # Regular expression
+                match = pattern.search(text, pos)
+                if match is None: break
+                a, z = match.span()
+                self.match = match
+            # Avoid getting stuck with zero-length matches.
+            if a == z == empty_pos:
+                if pos == len(text): break
+                pos += 1
+                continue
+            replacement = self.replacement
+            if expand:
+                replacement = match.expand(replacement)
+            segments.append(self.text[end:a])
+            segments.append(replacement)
+            count += 1
+            end = z
+            empty_pos = a if a == z else None
+            pos = z
+        segments.append(self.text[end:])
+        self.text = "".join(segments)
+        self.pos = len(self.text)
+        self.match_span = None
+        return count
+
+    def _replace_each(self):
+        """
+        Replace all occurences of pattern one at a time.
+
+        Each match is found in the text as modified by preceding replacements.
         Raise :exc:`re.error` if bad replacement.
         Return the amount of substitutions made.
         """
@@ -162,11 +230,11 @@ class Finder:
             try:
                 self.next()
             except StopIteration:
-                self.pos = len(self.text)
-                self.match_span = None
                 break
             self.replace()
             count += 1
+        self.pos = len(self.text)
+        self.match_span = None
         return count
 
     def set_regex(self, pattern, flags=re.DOTALL|re.MULTILINE):
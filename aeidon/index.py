@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Index of subtitle positions for fast lookups by time."""
+
+import bisect
+
+__all__ = ("IntervalIndex",)
+
+
+class IntervalIndex:
+
+    """
+    Index of subtitle positions for fast lookups by time.
+
+    :ivar project: :class:`aeidon.Project` instance to index
+
+    Start and end positions of subtitles are stored in seconds in the order
+    of subtitles, along with a segment tree of maximum end positions over
+    subtitles ordered by start position. Finding the subtitles that cover
+    a point or overlap a range in time is then a binary search followed by
+    a walk down the tree, visiting only branches that contain matches.
+
+    The index is kept up to date from signals of `project`: changed positions
+    are updated immediately, inserted and removed subtitles mark the tree to
+    be rebuilt upon the next query and opening files or changing framerate
+    causes a full rebuild upon the next query.
+    """
+
+    def __init__(self, project):
+        """Initialize an :class:`IntervalIndex` instance."""
+        self._ends = None
+        self._keys = None
+        self._order = None
+        self._starts = None
+        self._tree = None
+        self.project = project
+        project.connect("main-file-opened", self._on_reset)
+        project.connect("notify::framerate", self._on_reset)
+        project.connect("positions-changed", self._on_positions_changed)
+        project.connect("subtitles-inserted", self._on_subtitles_inserted)
+        project.connect("subtitles-removed", self._on_subtitles_removed)
+        project.connect("translation-file-opened", self._on_reset)
+
+    def _build(self):
+        """Build the tree of maximum end positions."""
+        if (self._starts is None or
+            len(self._starts) != len(self.project.subtitles)):
+            subtitles = self.project.subtitles
+            self._starts = [x.start_seconds for x in subtitles]
+            self._ends = [x.end_seconds for x in subtitles]
+        starts = self._starts
+        n = len(starts)
+        if all(starts[i] <= starts[i+1] for i in range(n - 1)):
+            # Subtitles are usually kept sorted,
+            # in which case no separate order is needed.
+            self._keys = starts
+            self._order = None
+        else:
+            self._order = sorted(range(n), key=starts.__getitem__)
+            self._keys = [starts[i] for i in self._order]
+        size = 1
+        while size < n:
+            size *= 2
+        tree = [float("-inf")] * (2 * size)
+        if self._order is None:
+            tree[size:size+n] = self._ends
+        else:
+            tree[size:size+n] = [self._ends[i] for i in self._order]
+        for i in reversed(range(1, size)):
+            tree[i] = max(tree[2*i], tree[2*i+1])
+        self._tree = tree
+
+    def get_covering(self, seconds):
+        """Return sorted indices of subtitles covering `seconds`."""
+        return self.get_overlapping(seconds, seconds)
+
+    def get_next(self, seconds):
+        """Return index of the first subtitle starting after `seconds`."""
+        if self._tree is None: self._build()
+        i = bisect.bisect_right(self._keys, seconds)
+        if i >= len(self._keys): return None
+        return i if self._order is None else self._order[i]
+
+    def get_overlapping(self, start, end):
+        """Return sorted indices of subtitles overlapping `start`...`end`."""
+        if self._tree is None: self._build()
+        # Only subtitles starting at or before end can overlap,
+        # of those only ones ending at or after start do.
+        count = bisect.bisect_right(self._keys, end)
+        tree = self._tree
+        size = len(tree) // 2
+        found = []
+        stack = [(1, 0, size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= count or tree[node] < start: continue
+            if node >= size:
+                found.append(lo)
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+        if self._order is None:
+            return found
+        return sorted(self._order[i] for i in found)
+
+    def get_previous(self, seconds):
+        """Return index of the last subtitle starting before `seconds`."""
+        if self._tree is None: self._build()
+        i = bisect.bisect_left(self._keys, seconds) - 1
+        if i < 0: return None
+        return i if self._order is None else self._order[i]
+
+    def _on_positions_changed(self, project, indices):
+        """Update positions of subtitles at `indices`."""
+        if self._starts is None: return
+        if len(self._starts) != len(project.subtitles):
+            return self._on_reset()
+        starts = self._starts
+        for index in indices:
+            subtitle = project.subtitles[index]
+            starts[index] = subtitle.start_seconds
+            self._ends[index] = subtitle.end_seconds
+        if self._tree is None: return
+        n = len(starts)
+        if (self._order is not None or
+            any((index > 0 and starts[index-1] > starts[index]) or
+                (index < n - 1 and starts[index] > starts[index+1])
+                for index in indices)):
+            # Order changed, rebuild upon next query.
+            self._tree = None
+            return
+        tree = self._tree
+        size = len(tree) // 2
+        for index in indices:
+            i = index + size
+            tree[i] = self._ends[index]
+            while i > 1:
+                i //= 2
+                tree[i] = max(tree[2*i], tree[2*i+1])
+
+    def _on_reset(self, *args):
+        """Discard all stored positions."""
+        self._starts = None
+        self._tree = None
+
+    def _on_subtitles_inserted(self, project, indices):
+        """Insert positions of subtitles at `indices`."""
+        if self._starts is None: return
+        # Indices are those of the new subtitles after insertion,
+        # insert in ascending order to keep indices valid.
+        for index in sorted(indices):
+            subtitle = project.subtitles[index]
+            self._starts.insert(index, subtitle.start_seconds)
+            self._ends.insert(index, subtitle.end_seconds)
+        self._tree = None
+
+    def _on_subtitles_removed(self, project, indices):
+        """Remove positions of subtitles at `indices`."""
+        if self._starts is None: return
+        for index in sorted(indices, reverse=True):
+            del self._starts[index]
+            del self._ends[index]
+        self._tree = None
@@ -60,50 +60,6 @@ class Liner(aeidon.Parser):
         return  [" ".join(boxes[edges[i]:edges[i+1]])
                  for i in range(len(edges) - 1)]
 
-    def _break_lines(self, boxes, penalties, nlines):
-        """
-        Break `boxes` into lines and return break points and demerit.
-
-        If keeping all boxes on a single line results in a valid and better
-        result than splitting to `nlines` return an empty list. If no
-        valid break points can be found, return ``None``.
-        """
-        breaks = self._list_possible_breaks(boxes, penalties, nlines)
-        best_breaks = None
-        best_demerit = sys.maxsize
-        text = " ".join(boxes)
-        if self.length_func(text) <= self.max_length:
-            # Use a valid one-line solution as the benchmark,
-            # that any more-line solution must beat.
-            best_breaks = []
-            best_demerit = self._calculate_demerit(boxes, penalties, [])
-        if nlines == 1:
-            return best_breaks, best_demerit
-        if nlines == 2:
-            for i in breaks:
-                if penalties[i] > best_demerit: break
-                demerit = self._calculate_demerit(boxes, penalties, [i])
-                if demerit < best_demerit:
-                    best_breaks = [i]
-                    best_demerit = demerit
-            return best_breaks, best_demerit
-        # For more than two lines, loop over first break points and
-        # recursively figure out rest of the breaks in each case.
-        for i in breaks:
-            # Use the maximum total negative penalty
-            # that can accumulate from all later breaks.
-            negpen = sorted(x for x in penalties[i+1:] if x < 0)
-            negpen = sum(negpen[:min(len(negpen), nlines - 2)])
-            if (penalties[i] + negpen) > best_demerit: break
-            value = self._break_lines(boxes[i+1:], penalties[i+1:], nlines-1)
-            if value[0] is None: continue
-            later = [i + 1 + x for x in value[0]]
-            demerit = self._calculate_demerit(boxes, penalties, [i] + later)
-            if demerit < best_demerit:
-                best_breaks = [i] + later
-                best_demerit = demerit
-        return best_breaks, best_demerit
-
     def break_lines(self):
         """Break lines and return text."""
         self.text = self.text.replace("\n", " ")
@@ -117,24 +73,19 @@ class Liner(aeidon.Parser):
         best_breaks = None
         best_demerit = sys.maxsize
         # We can probably handle up to ten lines of text
-        # before finding break points gets intolerably slow.
-        min_nlines = min(2, self.max_lines)
+        # before the demerit measure becomes meaningless.
         max_nlines = min(10, len(boxes))
-        for nlines in range(min_nlines, max_nlines + 1):
-            breaks, demerit = self._break_lines(boxes, penalties, nlines)
-            if breaks is None: continue
-            if demerit < best_demerit:
-                best_breaks = breaks
-                best_demerit = demerit
-            if nlines < self.max_lines:
-                continue
-            pos = -1
-            for i in range(len(boxes)):
-                pos = pos + 1 + len(boxes[i])
-                text = self.text
-                if i in best_breaks:
-                    text = text[:pos] + "\n" + text[pos+1:]
-                self.text = text
+        for nlines, breaks in enumerate(
+                self._find_breaks(boxes, penalties, max_nlines), 1):
+            if breaks is not None:
+                demerit = self._calculate_demerit(boxes, penalties, breaks)
+                if demerit < best_demerit:
+                    best_breaks = breaks
+                    best_demerit = demerit
+            if best_breaks is None: continue
+            if nlines < self.max_lines: continue
+            lines = self._boxes_to_lines(boxes, best_breaks)
+            self.text = "\n".join(lines)
             return self.get_text()
         # If text cannot be broken, return original text.
         return self.get_text()
@@ -183,56 +134,71 @@ class Liner(aeidon.Parser):
             penalties[i] = textpen[pos]
         return penalties
 
-    @aeidon.deco.memoize(100)
-    def _list_possible_breaks(self, boxes, penalties, nlines):
+    def _find_breaks(self, boxes, penalties, max_nlines):
         """
-        Return a list of all possible break points for `boxes`.
+        Yield break points for `boxes` for each amount of lines from one up.
 
-        All break points that would necessarily cause `max_length` to be
-        violated are discarded. Breaks are returned sorted in ascending order
-        of associated `penalties`, so that all remaining breaks can be
-        discarded once a demerit threshold is crossed.
+        Yield ``None`` if `boxes` cannot be broken to the amount of lines
+        without violating :attr:`max_length`.
         """
-        breaks = list(range(len(boxes) - (nlines - 1)))
-        breakpen = penalties[:len(breaks)]
-        if nlines == 1:
-            return []
-        if nlines == 2:
-            keep = [False] * len(breaks)
-            for i in range(len(breaks)):
-                lines = self._boxes_to_lines(boxes, breaks=[i])
-                lengths = map(self.length_func, lines)
-                keep[i] = max(lengths) <= self.max_length
-            breaks = [breaks[i] for i in range(len(breaks)) if keep[i]]
-            breakpen = [breakpen[i] for i in range(len(breakpen)) if keep[i]]
-            # Sort breaks in ascending order by penalties,
-            # so that all remaining breaks can be discarded once
-            # a demerit threshold is crossed.
-            if not breaks: return []
-            points = sorted(zip(breakpen, breaks))
-            breakpen, breaks = zip(*points)
-            return(breaks)
-        # For more than two lines, loop over first break points and
-        # recursively figure out rest of the breaks in each case.
-        keep = [False] * len(breaks)
-        for i in range(len(breaks)):
-            lines = self._boxes_to_lines(boxes, breaks=[i])
-            alength = self.length_func(lines[0])
-            if alength > self.max_length: break
-            later = self._list_possible_breaks(boxes[i+1:],
-                                               penalties[i+1:],
-                                               nlines-1)
+        # Find breaks by dynamic programming over lines, keeping for each
+        # box the best way to end a line before it, i.e. the cost and the
+        # first box of that line. The cost is the demerit as calculated by
+        # _calculate_demerit, except for the mean line length. That is
+        # constant for a given amount of lines if the length function is
+        # additive and is included once comparing different amounts.
+        # The upside-down pyramid depends on the length of the previous
+        # line, which is taken from the best line ending at each box.
+        nboxes = len(boxes)
+        lengths = self._get_line_lengths(boxes)
+        scale = 50 / self.max_length**2
+        states = dict((b, (scale * x**2, 0)) for b, x in lengths[0].items())
+        history = [states]
+        for nlines in range(1, max_nlines + 1):
+            yield self._trace_breaks(history, nboxes)
+            if nlines == max_nlines: break
+            new_states = {}
+            for b, (cost, a) in states.items():
+                # Skip ends that no line can start from.
+                if b == nboxes or not lengths[b]: continue
+                x = lengths[a][b]
+                cost += penalties[b-1]
+                for e, y in lengths[b].items():
+                    # Add deviation and upside-down pyramid.
+                    value = cost + scale * (y**2 + max(0, x - y)**2)
+                    if e in new_states and new_states[e][0] <= value: continue
+                    new_states[e] = (value, b)
+            if not new_states: break
+            states = new_states
+            history.append(states)
+
+    def _get_line_lengths(self, boxes):
+        """
+        Return lengths of lines that can be formed from `boxes`.
 
-            keep[i] = bool(later)
-        breaks = [breaks[i] for i in range(len(breaks)) if keep[i]]
-        breakpen = [breakpen[i] for i in range(len(breakpen)) if keep[i]]
-        # Sort breaks in ascending order by penalties,
-        # so that all remaining breaks can be discarded once
-        # a demerit threshold is crossed.
-        if not breaks: return []
-        points = sorted(zip(breakpen, breaks))
-        breakpen, breaks = zip(*points)
-        return(breaks)
+        Return a list, which for each box has a dictionary mapping the index
+        of the box after the last to the length of the line starting from the
+        box. Lines longer than :attr:`max_length` are excluded.
+        """
+        if self.length_func is len:
+            # Lengths of joined boxes are sums of box lengths and spaces.
+            ends = [0]
+            for box in boxes:
+                ends.append(ends[-1] + len(box) + 1)
+        lengths = []
+        for a in range(len(boxes)):
+            lengths.append({})
+            line = boxes[a]
+            for b in range(a + 1, len(boxes) + 1):
+                if self.length_func is len:
+                    length = ends[b] - ends[a] - 1
+                else:
+                    if b > a + 1:
+                        line = " ".join((line, boxes[b-1]))
+                    length = self.length_func(line)
+                if length > self.max_length: break
+                lengths[a][b] = length
+        return lengths
 
     def set_penalties(self, penalties):
         """
@@ -255,3 +221,13 @@ class Liner(aeidon.Parser):
         """Set the target text to search in and parse it."""
         aeidon.Parser.set_text(self, text.strip())
         self.text = self.text.strip()
+
+    def _trace_breaks(self, history, nboxes):
+        """Return break points of the best last line in `history` or ``None``."""
+        if nboxes not in history[-1]: return None
+        breaks = []
+        b = nboxes
+        for states in reversed(history[1:]):
+            b = states[b][1]
+            breaks.append(b - 1)
+        return breaks[::-1]
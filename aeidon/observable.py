@@ -40,6 +40,11 @@ class Observable:
     :meth:`thaw_notify` will queue notify signals and emit only one of each
     once thawed.
 
+    Similarly, :meth:`freeze_signals` and :meth:`thaw_signals` will queue
+    emissions of given signals and emit them coalesced once thawed, with
+    identical emissions emitted only once and sequences of indices given
+    as the only argument merged to one sorted list of unique indices.
+
     The Observable philosophy and API is highly inspired by GObject_.
 
     .. _GObject: https://developer.gnome.org/gobject/
@@ -48,20 +53,26 @@ class Observable:
     __slots__ = (
         "_blocked_signals",
         "_blocked_state",
+        "_frozen_signals",
         "_notify_frozen",
         "_notify_queue",
+        "_remap_functions",
         "_signal_handlers",
+        "_signal_queue",
     )
 
     signals = ()
 
     def __init__(self):
         """Initialize an :class:`Observable` instance."""
-        self._blocked_signals = []
+        self._blocked_signals = set()
         self._blocked_state = False
+        self._frozen_signals = frozenset()
         self._notify_frozen = False
         self._notify_queue = []
+        self._remap_functions = {}
         self._signal_handlers = {}
+        self._signal_queue = {}
         for signal in self.signals:
             self._add_signal(signal)
 
@@ -89,7 +100,7 @@ class Observable:
         Return ``False`` if already blocked, otherwise ``True``.
         """
         if not signal in self._blocked_signals:
-            self._blocked_signals.append(signal)
+            self._blocked_signals.add(signal)
             return True
         return False
 
@@ -104,6 +115,17 @@ class Observable:
             return True
         return False
 
+    def _coalesce(self, queue):
+        """Return a list of arguments to emit for `queue` of arguments."""
+        if all(map(self._is_indices, queue)):
+            # Merge sequences of indices.
+            return [(sorted(set().union(*(x[0] for x in queue))),)]
+        coalesced = []
+        for args in queue:
+            if not args in coalesced:
+                coalesced.append(args)
+        return coalesced
+
     def connect(self, signal, method, *args):
         """Register to receive notifications of ``signal``."""
         self._signal_handlers[signal].append((method, args))
@@ -116,6 +138,11 @@ class Observable:
 
     def emit(self, signal, *args):
         """Send notification of ``signal`` to all registered observers."""
+        if signal in self._frozen_signals:
+            self._signal_queue.setdefault(signal, []).append(args)
+            return
+        if signal in self._remap_functions:
+            self._remap(self._remap_functions[signal], args)
         if signal.startswith("notify::") and self._notify_frozen:
             if not signal in self._notify_queue:
                 self._notify_queue.append(signal)
@@ -128,6 +155,19 @@ class Observable:
             for method, data in self._signal_handlers[signal]:
                 method(*((self,) + args + data))
 
+    def flush_signals(self):
+        """Emit all signals queued by :meth:`freeze_signals` now."""
+        queue = self._signal_queue
+        self._signal_queue = {}
+        frozen = self._frozen_signals
+        self._frozen_signals = frozenset()
+        try:
+            for signal, signal_queue in queue.items():
+                for args in self._coalesce(signal_queue):
+                    self.emit(signal, *args)
+        finally:
+            self._frozen_signals = frozen
+
     def freeze_notify(self):
         """
         Queue notify signals instead of emitting them.
@@ -139,10 +179,49 @@ class Observable:
             return True
         return False
 
+    def freeze_signals(self, signals, remap_functions=None):
+        """
+        Queue emissions of `signals` instead of emitting them.
+
+        `remap_functions` can be a dictionary mapping signals to functions,
+        emissions of which will cause indices given as the only argument of
+        queued emissions to be mapped by the function, e.g. to keep indices
+        valid across signals of inserted or removed items. The function is
+        called with queued indices followed by arguments of the emission and
+        should return a list of new indices, which can be empty to drop the
+        queued emission. Return ``False`` if already frozen, else ``True``.
+        """
+        if not self._frozen_signals:
+            self._frozen_signals = frozenset(signals)
+            self._remap_functions = dict(remap_functions or {})
+            return True
+        return False
+
+    def _is_indices(self, args):
+        """Return ``True`` if `args` is a single sequence of indices."""
+        return (len(args) == 1 and
+                isinstance(args[0], (list, tuple, set, frozenset, range)) and
+                all(isinstance(x, int) for x in args[0]))
+
     def notify(self, name):
         """Emit notification signal for variable."""
         return self.emit("notify::{}".format(name))
 
+    def _remap(self, function, args):
+        """Map indices of queued emissions with `function`."""
+        for signal in list(self._signal_queue):
+            queue = []
+            for queued_args in self._signal_queue[signal]:
+                if self._is_indices(queued_args):
+                    indices = function(queued_args[0], *args)
+                    if not indices: continue
+                    queued_args = (indices,)
+                queue.append(queued_args)
+            if queue:
+                self._signal_queue[signal] = queue
+            else:
+                del self._signal_queue[signal]
+
     def thaw_notify(self, do=True):
         """
         Emit all queued notify signals and queue no more.
@@ -163,6 +242,24 @@ class Observable:
             return True
         return False
 
+    def thaw_signals(self, do=True):
+        """
+        Emit all signals queued by :meth:`freeze_signals` and queue no more.
+
+        The optional `do` keyword argument should be the return value from
+        :meth:`freeze_signals` to avoid problems with nested functions where
+        signals were frozen at a higher level. If `do` is ``False``, nothing
+        will be done.
+
+        Return ``False`` if already thawed, otherwise ``True``.
+        """
+        if do and self._frozen_signals:
+            self.flush_signals()
+            self._frozen_signals = frozenset()
+            self._remap_functions = {}
+            return True
+        return False
+
     def unblock(self, signal, do=True):
         """
         Unblock all emissions of `signal`.
@@ -18,6 +18,7 @@
 """Text parser for markup-tag-aware text editing."""
 
 import aeidon
+import bisect
 
 __all__ = ("Parser",)
 
@@ -29,8 +30,9 @@ class Parser(aeidon.Finder):
 
     :ivar clean_func: Function to clean tags or ``None``
     :ivar _margins: Start tag, end tag that every line is wrapped in
+    :ivar _positions: List of positions of markup tags in text without tags
     :ivar re_tag: Regular expression object to match any tag
-    :ivar _tags: List of lists of markup tag, position
+    :ivar _tags: List of markup tags
 
     The purpose of :class:`Parser` is to split text to the actual text and its
     markup tags, allowing the text to be edited while keeping its tags separate
@@ -54,6 +56,7 @@ class Parser(aeidon.Finder):
         aeidon.Finder.__init__(self)
         self.clean_func = clean_func
         self._margins = None
+        self._positions = None
         self.re_tag = re_tag
         self._tags = None
 
@@ -61,10 +64,17 @@ class Parser(aeidon.Finder):
         """Reassemble the full text and return it."""
         if not self.text:
             self._margins = []
+            self._positions = []
             self._tags = []
-        text = self.text[:]
-        for pos, tag in self._tags:
-            text = text[:pos] + tag + text[pos:]
+        segments = []
+        end = 0
+        for pos, tag in zip(self._positions, self._tags):
+            pos = min(pos, len(self.text))
+            segments.append(self.text[end:pos])
+            segments.append(tag)
+            end = pos
+        segments.append(self.text[end:])
+        text = "".join(segments)
         if self._margins:
             text = text.replace("\n", "{1}\n{0}".format(*self._margins))
             text = self._margins[0] + text + self._margins[1]
@@ -72,6 +82,14 @@ class Parser(aeidon.Finder):
             text = self.clean_func(text)
         return text
 
+    def _is_opening(self, text, pos):
+        """Return ``True`` if a tag at `pos` in `text` would be opening."""
+        # Try to determine whether a tag at position pos would be an opening
+        # or a closing tag, i.e. attached to the next or the previous word.
+        if pos < len(text):
+            return not text[pos].isspace()
+        return pos > len(text)
+
     def replace(self, next=True):
         """
         Replace the current match of pattern.
@@ -80,10 +98,21 @@ class Parser(aeidon.Finder):
         beginning. Raise :exc:`re.error` if bad replacement.
         """
         a = self.match_span[0]
-        orig_text = self.text[:]
+        orig_text = self.text
         aeidon.Finder.replace(self, next)
         shift = len(self.text) - len(orig_text)
-        self._shift_tags(a, shift, orig_text)
+        self._shift_tags(a, shift, self._is_opening(orig_text, a))
+
+    def replace_all(self):
+        """
+        Replace all occurences of pattern.
+
+        Raise :exc:`re.error` if bad replacement.
+        Return the amount of substitutions made.
+        """
+        # Replace one at a time to shift markup tags after each,
+        # which needs the position of each replacement.
+        return self._replace_each()
 
     def _set_margins(self, text):
         """Find the margin markup tags in `text` if such exist."""
@@ -115,14 +144,20 @@ class Parser(aeidon.Finder):
 
     def _set_tags(self, text):
         """Find markup tags in `text`."""
+        # Store positions in text without tags,
+        # i.e. excluding the lengths of preceding tags.
+        length = 0
         for match in self.re_tag.finditer(text):
             a, z = match.span()
-            self._tags.append([a, text[a:z]])
+            self._positions.append(a - length)
+            self._tags.append(text[a:z])
+            length += z - a
 
     def set_text(self, text):
         """Set the target text to search in and parse it."""
         aeidon.Finder.set_text(self, text)
         self._margins = []
+        self._positions = []
         self._tags = []
         if self.re_tag is None: return
         if text.count("\n"):
@@ -131,36 +166,25 @@ class Parser(aeidon.Finder):
             self._set_tags(text)
         self.text = self.re_tag.sub("", text)
 
-    def _shift_tags(self, pos, shift, orig_text):
+    def _shift_tags(self, pos, shift, opening):
         """Shift all markup tags after `pos`."""
         if not shift: return
         if not self._tags: return
-        # Try to determine whether a tag at position pos would be an opening
-        # or a closing tag, i.e. attached to the next or the previous word.
-        opening = True
-        if pos < len(orig_text):
-            if orig_text[pos].isspace():
-                opening = False
-        elif pos == len(orig_text):
-            opening = False
         closing = not opening
-        # Get length of tags *before* position. Try to add strings (positive
+        # Find the first tag after position. Try to add strings (positive
         # shift) inside tags and remove strings (negative shift) after tags.
-        pos_with_tags = pos
-        for tag_pos, tag in self._tags:
-            if shift > 0 and closing:
-                if tag_pos < pos_with_tags:
-                    pos_with_tags += len(tag)
-            elif tag_pos <= pos_with_tags:
-                pos_with_tags += len(tag)
-        between_length = 0
-        for i, (tag_pos, tag) in enumerate(self._tags):
-            orig_end = pos_with_tags - shift + between_length
-            if (shift < 0) and (pos_with_tags < tag_pos < orig_end):
-                # If tag is in the middle of what is being removed, it must be
-                # shifted to the start of the removal block, but not so far
-                # that it would overlap with preceding tags.
-                self._tags[i][0] = pos_with_tags + between_length
-                between_length += len(tag)
-            elif tag_pos >= pos_with_tags:
-                self._tags[i][0] += shift
+        if shift > 0 and closing:
+            first = bisect.bisect_left(self._positions, pos)
+        else:
+            first = bisect.bisect_right(self._positions, pos)
+        end = pos - shift
+        # This is linear in the amount of tags after position, but subtitle
+        # texts rarely have more than a few tags, so lazy shifts in a tree
+        # would cost more than they save.
+        for i in range(first, len(self._positions)):
+            if shift < 0 and self._positions[i] < end:
+                # If tag is in the middle of what is being removed,
+                # it must be shifted to the start of the removal block.
+                self._positions[i] = pos
+            else:
+                self._positions[i] += shift
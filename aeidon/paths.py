@@ -20,9 +20,35 @@
 import os
 import sys
 
-__all__ = ("CONFIG_HOME_DIR", "DATA_DIR", "DATA_HOME_DIR", "LOCALE_DIR",)
+__all__ = (
+    "CACHE_HOME_DIR",
+    "CONFIG_HOME_DIR",
+    "DATA_DIR",
+    "DATA_HOME_DIR",
+    "LOCALE_DIR",
+)
 
 
+def get_cache_home_directory():
+    """Return path to the user's cache directory."""
+    if sys.platform == "win32":
+        return get_cache_home_directory_windows()
+    return get_cache_home_directory_xdg()
+
+def get_cache_home_directory_windows():
+    """Return path to the user's cache directory on Windows."""
+    directory = os.path.expanduser("~")
+    directory = os.environ.get("LOCALAPPDATA", directory)
+    directory = os.path.join(directory, "Gaupol", "cache")
+    return os.path.abspath(directory)
+
+def get_cache_home_directory_xdg():
+    """Return path to the user's XDG cache directory."""
+    directory = os.path.join(os.path.expanduser("~"), ".cache")
+    directory = os.environ.get("XDG_CACHE_HOME", directory)
+    directory = os.path.join(directory, "gaupol")
+    return os.path.abspath(directory)
+
 def get_config_home_directory():
     """Return path to the user's configuration directory."""
     if sys.platform == "win32":
@@ -109,6 +135,7 @@ def get_locale_directory_source():
     directory = os.path.join(directory, "locale")
     return os.path.abspath(directory)
 
+CACHE_HOME_DIR = get_cache_home_directory()
 CONFIG_HOME_DIR = get_config_home_directory()
 DATA_DIR = get_data_directory()
 DATA_HOME_DIR = get_data_home_directory()
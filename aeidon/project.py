@@ -18,6 +18,7 @@
 """Model for subtitle data."""
 
 import aeidon
+import collections
 
 __all__ = ("Project",)
 
@@ -32,10 +33,14 @@ class ProjectMeta(type):
     into thinking that the resulting instantiated class actually contains those
     methods, which it does not since the methods are removed during
     :meth:`Project.__init__`.
+
+    The names of exported methods of each agent are also stored once per
+    class in ``_delegation_table`` so that instances only need to bind them.
     """
 
     def __new__(meta, class_name, bases, dic):
         new_dict = dic.copy()
+        table = []
         for agent_class_name in aeidon.agents.__all__:
             agent_class = getattr(aeidon.agents, agent_class_name)
             def is_delegate_method(name):
@@ -44,9 +49,15 @@ class ProjectMeta(type):
                         hasattr(value, "export") and
                         value.export is True)
 
-            attr_names = list(filter(is_delegate_method, dir(agent_class)))
+            attr_names = tuple(filter(is_delegate_method, dir(agent_class)))
             for attr_name in attr_names:
+                if any(attr_name in x[1] for x in table):
+                    raise ValueError("Multiple definitions of {!r}"
+                                     .format(attr_name))
+
                 new_dict[attr_name] = getattr(agent_class, attr_name)
+            table.append((agent_class, attr_names))
+        new_dict["_delegation_table"] = tuple(table)
         return type.__new__(meta, class_name, bases, new_dict)
 
 
@@ -55,6 +66,11 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
     """
     Model for subtitle data.
 
+    :ivar cache: :class:`aeidon.ProjectCache` instance or ``None``
+
+       If not ``None``, parsed subtitle files are cached and reopening
+       an unchanged file loads subtitles from the cache.
+
     :ivar calc: Instance of :class:`aeidon.Calculator` used
     :ivar clipboard: Instance of :class:`aeidon.Clipboard` used
     :ivar _delegations: Dictionary mapping method names to agent methods
@@ -66,8 +82,13 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
        one and undoing decreases value by one.
 
     :ivar main_file: Main instance of :class:`aeidon.SubtitleFile`
-    :ivar redoables: Stack of :class:`aeidon.RevertableAction` instances
+    :ivar redoables: Deque of :class:`aeidon.RevertableAction`, newest first
     :ivar subtitles: List of :class:`aeidon.Subtitle` instances
+    :ivar table: ``True`` to store :attr:`subtitles` in columnar form
+
+       If ``True``, :attr:`subtitles` is a :class:`aeidon.SubtitleTable`
+       instead of a list, which uses a lot less memory for large files.
+
     :ivar tran_changed: Integer, status of translation document
 
        At unchanged state (i.e. file on disk corresponds to the state of the
@@ -76,7 +97,14 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar tran_file: Translation instance of :class:`aeidon.SubtitleFile`
     :ivar undo_limit: Maximum size of undo/redo stacks or None for no limit
-    :ivar undoables: Stack of :class:`aeidon.RevertableAction` instances
+    :ivar undo_size_limit: Maximum memory use of undo/redo stacks or None
+
+       Approximate memory use in bytes of all actions in both stacks,
+       as reported by :meth:`aeidon.RevertableAction.get_size`. Once
+       exceeded, oldest actions are removed, but at least the most recent
+       action of both stacks is kept.
+
+    :ivar undoables: Deque of :class:`aeidon.RevertableAction`, newest first
     :ivar video_path: Full, absolute path to the video file on disk
 
     Signals and their arguments for callback functions:
@@ -111,22 +139,25 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         "translation-texts-changed",
     )
 
-    def __init__(self, framerate=None):
+    def __init__(self, framerate=None, table=False, cache=False):
         """Initialize a :class:`Project` instance."""
         aeidon.Observable.__init__(self)
         framerate = framerate or aeidon.framerates.FPS_23_976
+        self.cache = aeidon.ProjectCache() if cache else None
         self.calc = aeidon.Calculator(framerate)
         self.clipboard = aeidon.Clipboard()
         self._delegations = {}
         self.framerate = framerate
         self.main_changed = 0
         self.main_file = None
-        self.redoables = []
-        self.subtitles = []
+        self.redoables = collections.deque()
+        self.subtitles = aeidon.SubtitleTable() if table else []
+        self.table = table
         self.tran_changed = None
         self.tran_file = None
         self.undo_limit = 100000
-        self.undoables = []
+        self.undo_size_limit = 512 * 1024**2
+        self.undoables = collections.deque()
         self.video_path = None
         self._init_delegations()
 
@@ -139,22 +170,13 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     def _init_delegations(self):
         """Initialize the delegation mappings."""
-        for agent_class_name in aeidon.agents.__all__:
-            agent = getattr(aeidon.agents, agent_class_name)(self)
-            def is_delegate_method(name):
-                value = getattr(agent, name)
-                return (callable(value) and
-                        hasattr(value, "export") and
-                        value.export is True)
-
-            attr_names = list(filter(is_delegate_method, dir(agent)))
+        cls = self.__class__
+        for agent_class, attr_names in self._delegation_table:
+            agent = agent_class(self)
             for attr_name in attr_names:
-                attr_value = getattr(agent, attr_name)
-                if attr_name in self._delegations:
-                    raise ValueError("Multiple definitions of {!r}"
-                                     .format(attr_name))
-
-                self._delegations[attr_name] = attr_value
-                # Remove class-level function added by ProjectMeta.
-                if hasattr(self.__class__, attr_name):
-                    delattr(self.__class__, attr_name)
+                self._delegations[attr_name] = getattr(agent, attr_name)
+            if attr_names and attr_names[0] in cls.__dict__:
+                # Remove class-level functions added by ProjectMeta,
+                # which is needed only upon the first instantiation.
+                for attr_name in attr_names:
+                    delattr(cls, attr_name)
@@ -18,10 +18,31 @@
 """Actions that can be reverted, i.e. undone and redone."""
 
 import aeidon
+import sys
 
 __all__ = ("RevertableAction", "RevertableActionGroup",)
 
 
+def _get_size(value):
+    """Return approximate size of `value` in bytes, including contents."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float)):
+        return size
+    if isinstance(value, dict):
+        return size + sum(_get_size(x) + _get_size(y)
+                          for x, y in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(map(_get_size, value))
+    if isinstance(value, aeidon.Subtitle):
+        # Calculators and enumeration items are shared,
+        # count only the subtitle itself and its texts.
+        return (size +
+                sys.getsizeof(value.__dict__) +
+                _get_size(value._main_text) +
+                _get_size(value._tran_text))
+    return size
+
+
 class RevertableAction:
 
     """
@@ -50,9 +71,23 @@ class RevertableAction:
         self.revert_args = ()
         self.revert_function = None
         self.revert_kwargs = {}
+        self._size = None
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def get_size(self):
+        """
+        Return approximate amount of memory in bytes retained by action.
+
+        Size is calculated upon first call and cached, :attr:`revert_args`
+        and :attr:`revert_kwargs` should not be changed after that.
+        """
+        if self._size is None:
+            self._size = (sys.getsizeof(self) +
+                          _get_size(self.revert_args) +
+                          _get_size(self.revert_kwargs))
+        return self._size
+
     def _get_reversion_register(self):
         """Return the :attr:`aeidon.registers` item for reversion."""
         if self.register.shift == 1:
@@ -90,3 +125,7 @@ class RevertableActionGroup:
         self.description = None
         for key, value in kwargs.items():
             setattr(self, key, value)
+
+    def get_size(self):
+        """Return approximate amount of memory in bytes retained by actions."""
+        return sum(x.get_size() for x in self.actions)
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Detecting properties of a subtitle file from a single read."""
+
+import aeidon
+import os
+
+__all__ = ("FileSniffer",)
+
+
+class FileSniffer:
+
+    """
+    Detecting properties of a subtitle file from a single read.
+
+    :ivar path: Full, absolute path to the file on disk
+
+    The whole file is read from disk once upon instantiation. BOM, encoding,
+    format and newlines are then detected from the buffer in memory and the
+    decoded text can be handed to :class:`aeidon.SubtitleFile` for parsing.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize a :class:`FileSniffer` instance.
+
+        Raise :exc:`IOError` if reading fails.
+        """
+        self.path = os.path.abspath(path)
+        with open(self.path, "rb") as f:
+            self._blob = f.read()
+        self._lines = None
+        self._text = None
+        self._text_encoding = None
+
+    def decode(self, encoding):
+        """
+        Return text of file decoded with `encoding`.
+
+        Newlines are not translated.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        if encoding != self._text_encoding:
+            # Keep only the most recent decoding
+            # to avoid holding several copies of the text.
+            self._lines = None
+            self._text = str(self._blob, encoding)
+            self._text_encoding = encoding
+        return self._text
+
+    def detect_bom(self):
+        """Return corresponding encoding if BOM found, else ``None``."""
+        return aeidon.encodings.detect_bom_bytes(self._blob[:4])
+
+    def detect_encoding(self):
+        """Return code of detected encoding or ``None``."""
+        return aeidon.encodings.detect_bytes(self._blob)
+
+    def detect_format(self, encoding):
+        """
+        Detect and return format of file.
+
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        Return an :attr:`aeidon.formats` enumeration item.
+        """
+        format = aeidon.util.detect_format_lines(self.read_lines(encoding))
+        if format is not None:
+            return format
+        raise aeidon.FormatError("Failed to detect format of file {!r}"
+                                 .format(self.path))
+
+    def detect_newlines(self, encoding):
+        """
+        Detect and return the newline type of file or ``None``.
+
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        text = self.decode(encoding)
+        windows = text.count("\r\n")
+        mac = text.count("\r") - windows
+        unix = text.count("\n") - windows
+        found = [x for x, count in ((aeidon.newlines.WINDOWS, windows),
+                                    (aeidon.newlines.MAC, mac),
+                                    (aeidon.newlines.UNIX, unix))
+                 if count > 0]
+        if not found:
+            return None
+        if len(found) == 1:
+            return found[0]
+        # See the corresponding comment in aeidon.util.get_newline.
+        return aeidon.newlines.WINDOWS
+
+    def read_lines(self, encoding):
+        """
+        Return a list of lines in file decoded with `encoding`.
+
+        All newlines are stripped.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        text = self.decode(encoding)
+        if self._lines is None:
+            # Split once per decoding, lines are needed
+            # both to detect format and to parse.
+            text = aeidon.util.normalize_newlines(text)
+            self._lines = text.split("\n")
+            if self._lines and not self._lines[-1]:
+                # Mimic readlines by not counting
+                # a trailing newline as an empty line.
+                self._lines.pop()
+        return list(self._lines)
@@ -22,6 +22,8 @@ import os
 import re
 
 with aeidon.util.silent(Exception):
+    import gi
+    gi.require_version("Gspell", "1")
     from gi.repository import Gspell
 
 __all__ = ("SpellChecker", "SpellCheckNavigator", "SpellCheckTokenizer")
@@ -50,6 +50,10 @@ class Subtitle:
     Use :func:`aeidon.as_time`, :func:`aeidon.as_frame` or
     :func:`aeidon.as_seconds` if necessary to ensure correct type.
 
+    Positions are stored internally as integers, milliseconds in time mode
+    and frames in frame mode, so that comparing, shifting and scaling are
+    plain integer arithmetic. Time strings are only produced on demand.
+
     Additional format-specific attributes are kept under separate containers,
     e.g. ``ssa`` for Sub Station Alpha formats, accessed as ``subtitle.ssa.*``.
     These containers are lazily created upon first use in order to avoid slow
@@ -58,26 +62,24 @@ class Subtitle:
 
     def __init__(self, mode=None, framerate=None):
         """Initialize a :class:`Subtitle` instance."""
-        self._start = None
-        self._end = None
+        self._start = 0
+        self._end = 0
         self._main_text = ""
         self._tran_text = ""
         self._mode = mode or aeidon.modes.TIME
         self._framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(self._framerate)
-        self.start = "00:00:00.000"
-        self.end = "00:00:00.000"
 
     def __eq__(self, other):
         """Compare subtitle equality by value."""
         if not isinstance(other, Subtitle):
             raise NotImplementedError
-        return (self.start == other.start and
-                self.end == other.end and
-                self.main_text == other.main_text and
-                self.tran_text == other.tran_text and
-                self.framerate == other.framerate and
-                self.mode == other.mode)
+        return (self._mode == other._mode and
+                self._start == other._start and
+                self._end == other._end and
+                self._main_text == other._main_text and
+                self._tran_text == other._tran_text and
+                self._framerate == other._framerate)
 
     def __getattr__(self, name):
         """Return lazily instantiated format-specific attribute container."""
@@ -92,6 +94,8 @@ class Subtitle:
     def __ge__(self, other):
         """Compare start positions."""
         if self._mode == aeidon.modes.TIME:
+            if other._mode == aeidon.modes.TIME:
+                return self._start >= other._start
             return self.start_seconds >= other.start_seconds
         if self._mode == aeidon.modes.FRAME:
             return self.start_frame >= other.start_frame
@@ -101,6 +105,8 @@ class Subtitle:
     def __gt__(self, other):
         """Compare start positions."""
         if self._mode == aeidon.modes.TIME:
+            if other._mode == aeidon.modes.TIME:
+                return self._start > other._start
             return self.start_seconds > other.start_seconds
         if self._mode == aeidon.modes.FRAME:
             return self.start_frame > other.start_frame
@@ -110,6 +116,8 @@ class Subtitle:
     def __le__(self, other):
         """Compare start positions."""
         if self._mode == aeidon.modes.TIME:
+            if other._mode == aeidon.modes.TIME:
+                return self._start <= other._start
             return self.start_seconds <= other.start_seconds
         if self._mode == aeidon.modes.FRAME:
             return self.start_frame <= other.start_frame
@@ -119,38 +127,47 @@ class Subtitle:
     def __lt__(self, other):
         """Compare start positions."""
         if self._mode == aeidon.modes.TIME:
+            if other._mode == aeidon.modes.TIME:
+                return self._start < other._start
             return self.start_seconds < other.start_seconds
         if self._mode == aeidon.modes.FRAME:
             return self.start_frame < other.start_frame
         raise ValueError("Invalid mode: {!r}"
                          .format(self._mode))
 
+    def _add(self, x, y):
+        """Return sum of native internal positions `x` and `y`."""
+        if self._mode == aeidon.modes.TIME:
+            limit = aeidon.Calculator.MAX_MILLISECONDS
+            return max(-limit, min(limit, x + y))
+        return x + y
+
     def convert_framerate(self, framerate):
         """Set framerate and convert positions to it."""
         coefficient = framerate.value / self._framerate.value
         if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds / coefficient
-            self.end_seconds = self.end_seconds / coefficient
+            self._start = self._round(self._start / coefficient)
+            self._end = self._round(self._end / coefficient)
         if self._mode == aeidon.modes.FRAME:
-            self.start_frame = round(coefficient * self.start_frame)
-            self.end_frame = round(coefficient * self.end_frame)
+            self._start = round(coefficient * self._start)
+            self._end = round(coefficient * self._end)
         self.framerate = framerate
 
     def _convert_position(self, value):
-        """Return `value` of position in correct mode."""
+        """Return `value` of position as a native internal position."""
         if aeidon.is_time(value):
             if self._mode == aeidon.modes.TIME:
-                return value
+                return self.calc.time_to_milliseconds(value)
             if self._mode == aeidon.modes.FRAME:
                 return self.calc.time_to_frame(value)
         if aeidon.is_frame(value):
             if self._mode == aeidon.modes.TIME:
-                return self.calc.frame_to_time(value)
+                return self.calc.frame_to_milliseconds(value)
             if self._mode == aeidon.modes.FRAME:
                 return value
         if aeidon.is_seconds(value):
             if self._mode == aeidon.modes.TIME:
-                return self.calc.seconds_to_time(value)
+                return self.calc.seconds_to_milliseconds(value)
             if self._mode == aeidon.modes.FRAME:
                 return self.calc.seconds_to_frame(value)
         raise ValueError("Invalid type for value: {!r}"
@@ -164,12 +181,19 @@ class Subtitle:
         subtitle._main_text = self._main_text
         subtitle._tran_text = self._tran_text
         # Copy all containers that have been instantiated.
-        containers = (x.container for x in aeidon.formats)
-        for name in set(dir(self)) & set(containers):
+        for name in set(x.container for x in aeidon.formats):
+            if not self.has_container(name): continue
             container = copy.deepcopy(getattr(self, name))
             setattr(subtitle, name, container)
         return subtitle
 
+    def copy_positions(self):
+        """Return a new subtitle instance with the same positions only."""
+        subtitle = Subtitle(self._mode, self._framerate)
+        subtitle._start = self._start
+        subtitle._end = self._end
+        return subtitle
+
     @property
     def duration(self):
         """Return duration in correct mode."""
@@ -184,7 +208,7 @@ class Subtitle:
     def duration(self, value):
         """Set duration from `value`."""
         value = self._convert_position(value)
-        self._end = self.calc.add(self._start, value)
+        self._end = self._add(self._start, value)
 
     @property
     def duration_frame(self):
@@ -199,7 +223,8 @@ class Subtitle:
     @property
     def duration_seconds(self):
         """Return duration as seconds."""
-        return self.end_seconds - self.start_seconds
+        return (self._get_milliseconds(self._end) -
+                self._get_milliseconds(self._start)) / 1000
 
     @duration_seconds.setter
     def duration_seconds(self, value):
@@ -209,7 +234,9 @@ class Subtitle:
     @property
     def duration_time(self):
         """Return duration as time."""
-        return self.calc.seconds_to_time(self.duration_seconds)
+        return self.calc.milliseconds_to_time(
+            self._get_milliseconds(self._end) -
+            self._get_milliseconds(self._start))
 
     @duration_time.setter
     def duration_time(self, value):
@@ -219,6 +246,8 @@ class Subtitle:
     @property
     def end(self):
         """Return end position in correct mode."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(self._end)
         return self._end
 
     @end.setter
@@ -229,12 +258,7 @@ class Subtitle:
     @property
     def end_frame(self):
         """Return end position as frames."""
-        if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._end)
-        if self._mode == aeidon.modes.FRAME:
-            return self._end
-        raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+        return self._get_frame(self._end)
 
     @end_frame.setter
     def end_frame(self, value):
@@ -244,7 +268,7 @@ class Subtitle:
     @property
     def end_seconds(self):
         """Return end position as seconds."""
-        return self.calc.time_to_seconds(self.end_time)
+        return self._get_milliseconds(self._end) / 1000
 
     @end_seconds.setter
     def end_seconds(self, value):
@@ -254,12 +278,8 @@ class Subtitle:
     @property
     def end_time(self):
         """Return end position as time."""
-        if self._mode == aeidon.modes.TIME:
-            return self._end
-        if self._mode == aeidon.modes.FRAME:
-            return self.calc.frame_to_time(self._end)
-        raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+        return self.calc.milliseconds_to_time(
+            self._get_milliseconds(self._end))
 
     @end_time.setter
     def end_time(self, value):
@@ -295,6 +315,24 @@ class Subtitle:
         raise ValueError("Invalid mode: {!r}"
                          .format(mode))
 
+    def _get_frame(self, pos):
+        """Return native internal position `pos` as frames."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_frame(pos)
+        if self._mode == aeidon.modes.FRAME:
+            return pos
+        raise ValueError("Invalid mode: {!r}"
+                         .format(self._mode))
+
+    def _get_milliseconds(self, pos):
+        """Return native internal position `pos` as milliseconds."""
+        if self._mode == aeidon.modes.TIME:
+            return pos
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.frame_to_milliseconds(pos)
+        raise ValueError("Invalid mode: {!r}"
+                         .format(self._mode))
+
     def get_start(self, mode):
         """Return start position in `mode`."""
         if mode == aeidon.modes.TIME:
@@ -315,7 +353,7 @@ class Subtitle:
 
     def has_container(self, name):
         """Return ``True`` if container has been instantiated."""
-        return name in dir(self)
+        return name in self.__dict__
 
     @property
     def main_text(self):
@@ -336,21 +374,24 @@ class Subtitle:
     def mode(self, mode):
         """Set current position mode."""
         if mode == aeidon.modes.TIME:
-            self._start = self.start_time
-            self._end = self.end_time
+            self._start = self._get_milliseconds(self._start)
+            self._end = self._get_milliseconds(self._end)
         if mode == aeidon.modes.FRAME:
-            self._start = self.start_frame
-            self._end = self.end_frame
+            self._start = self._get_frame(self._start)
+            self._end = self._get_frame(self._end)
         self._mode = mode
 
+    def _round(self, pos):
+        """Return native internal position `pos` rounded to an integer."""
+        if self._mode == aeidon.modes.TIME:
+            limit = aeidon.Calculator.MAX_MILLISECONDS
+            return max(-limit, min(limit, int(round(pos, 0))))
+        return int(round(pos, 0))
+
     def scale_positions(self, value):
         """Multiply start and end positions by `value`."""
-        if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds * value
-            self.end_seconds = self.end_seconds * value
-        if self._mode == aeidon.modes.FRAME:
-            self.start_frame = round(self._start * value)
-            self.end_frame = round(self._end * value)
+        self._start = self._round(self._start * value)
+        self._end = self._round(self._end * value)
 
     def set_text(self, doc, value):
         """Set text corresponding to `doc` to `value`."""
@@ -361,12 +402,15 @@ class Subtitle:
 
     def shift_positions(self, value):
         """Add `value` to start and end positions."""
-        self._start = self.calc.add(self._start, value)
-        self._end = self.calc.add(self._end, value)
+        value = self._convert_position(value)
+        self._start = self._add(self._start, value)
+        self._end = self._add(self._end, value)
 
     @property
     def start(self):
         """Return start position in correct mode."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.milliseconds_to_time(self._start)
         return self._start
 
     @start.setter
@@ -377,12 +421,7 @@ class Subtitle:
     @property
     def start_frame(self):
         """Return start position as frames."""
-        if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._start)
-        if self._mode == aeidon.modes.FRAME:
-            return self._start
-        raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+        return self._get_frame(self._start)
 
     @start_frame.setter
     def start_frame(self, value):
@@ -392,7 +431,7 @@ class Subtitle:
     @property
     def start_seconds(self):
         """Return start position as seconds."""
-        return self.calc.time_to_seconds(self.start_time)
+        return self._get_milliseconds(self._start) / 1000
 
     @start_seconds.setter
     def start_seconds(self, value):
@@ -402,12 +441,8 @@ class Subtitle:
     @property
     def start_time(self):
         """Return start position as time."""
-        if self._mode == aeidon.modes.TIME:
-            return self._start
-        if self._mode == aeidon.modes.FRAME:
-            return self.calc.frame_to_time(self._start)
-        raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+        return self.calc.milliseconds_to_time(
+            self._get_milliseconds(self._start))
 
     @start_time.setter
     def start_time(self, value):
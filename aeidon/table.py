@@ -0,0 +1,307 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Columnar storage of subtitle data."""
+
+import aeidon
+import array
+import collections.abc
+
+__all__ = ("SubtitleRow", "SubtitleTable",)
+
+
+class SubtitleRow(aeidon.Subtitle):
+
+    """
+    View of a single row of :class:`SubtitleTable`.
+
+    :ivar index: Index of the row in the table
+
+    Rows behave like :class:`aeidon.Subtitle` instances, but all values are
+    read from and written to the columns of the table. Rows are only valid
+    until subtitles are inserted to or removed from the table. Use
+    :meth:`copy` to get a detached :class:`aeidon.Subtitle` instance.
+    """
+
+    def __init__(self, table, index):
+        """Initialize a :class:`SubtitleRow` instance."""
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "index", index)
+
+    def __getattr__(self, name):
+        """Return lazily instantiated format-specific attribute container."""
+        if name in (x.container for x in aeidon.formats):
+            return self._table._get_container(self.index, name)
+        raise AttributeError("Invalid container name: {!r}"
+                             .format(name))
+
+    @property
+    def calc(self):
+        """Return :class:`aeidon.Calculator` instance used."""
+        return aeidon.Calculator(self._framerate)
+
+    @property
+    def _end(self):
+        return self._table._ends[self.index]
+
+    @_end.setter
+    def _end(self, value):
+        self._table._ends[self.index] = value
+
+    @property
+    def _framerate(self):
+        return self._table._framerate_items[
+            self._table._framerates[self.index]]
+
+    @_framerate.setter
+    def _framerate(self, value):
+        code = self._table._intern(self._table._framerate_items, value)
+        self._table._framerates[self.index] = code
+
+    @property
+    def framerate(self):
+        """Return framerate."""
+        return self._framerate
+
+    @framerate.setter
+    def framerate(self, value):
+        """Set framerate from `value`."""
+        self._framerate = value
+
+    def has_container(self, name):
+        """Return ``True`` if container has been instantiated."""
+        return self._table._has_container(self.index, name)
+
+    @property
+    def _main_text(self):
+        return self._table._main_texts[self.index]
+
+    @_main_text.setter
+    def _main_text(self, value):
+        self._table._main_texts[self.index] = value
+
+    @property
+    def _mode(self):
+        return self._table._mode_items[self._table._modes[self.index]]
+
+    @_mode.setter
+    def _mode(self, value):
+        code = self._table._intern(self._table._mode_items, value)
+        self._table._modes[self.index] = code
+
+    @property
+    def _start(self):
+        return self._table._starts[self.index]
+
+    @_start.setter
+    def _start(self, value):
+        self._table._starts[self.index] = value
+
+    @property
+    def _tran_text(self):
+        return self._table._tran_texts[self.index]
+
+    @_tran_text.setter
+    def _tran_text(self, value):
+        self._table._tran_texts[self.index] = value
+
+
+class SubtitleTable(collections.abc.MutableSequence):
+
+    """
+    Columnar storage of subtitle data.
+
+    :class:`SubtitleTable` is a drop-in replacement for a list of
+    :class:`aeidon.Subtitle` instances, that stores start and end positions
+    in integer arrays and texts in plain lists. Modes and framerates are
+    stored as small integer codes referring to the distinct values in use.
+    Format-specific containers are kept in sparse side tables, keyed by a
+    row identifier that stays constant when rows are inserted or removed.
+
+    Indexing returns :class:`SubtitleRow` views. Inserting copies values
+    from given subtitles into the columns and popping returns detached
+    :class:`aeidon.Subtitle` instances.
+    """
+
+    def __init__(self, subtitles=()):
+        """Initialize a :class:`SubtitleTable` instance."""
+        self._containers = {}
+        self._ends = array.array("q")
+        self._framerate_items = []
+        self._framerates = array.array("H")
+        self._ids = array.array("Q")
+        self._main_texts = []
+        self._mode_items = []
+        self._modes = array.array("H")
+        self._next_id = 0
+        self._starts = array.array("q")
+        self._tran_texts = []
+        self.extend(subtitles)
+
+    def __delitem__(self, index):
+        """Remove subtitle at `index`."""
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(len(self))), reverse=True):
+                self.__delitem__(i)
+            return
+        index = self._get_index(index)
+        row_id = self._ids[index]
+        for containers in self._containers.values():
+            containers.pop(row_id, None)
+        for column in self._get_columns():
+            del column[index]
+
+    def __eq__(self, other):
+        """Compare subtitles in order by value."""
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            x == y for x, y in zip(self, other))
+
+    def __getitem__(self, index):
+        """Return a view of row at `index`."""
+        if isinstance(index, slice):
+            return [SubtitleRow(self, i)
+                    for i in range(*index.indices(len(self)))]
+        return SubtitleRow(self, self._get_index(index))
+
+    def __iter__(self):
+        """Iterate over views of all rows."""
+        for i in range(len(self)):
+            yield SubtitleRow(self, i)
+
+    def __len__(self):
+        """Return the amount of subtitles."""
+        return len(self._ids)
+
+    def __setitem__(self, index, subtitle):
+        """Replace subtitle at `index` with `subtitle`."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            values = [self._get_values(x) for x in subtitle]
+            if len(indices) != len(values):
+                raise ValueError("Cannot resize table via slice assignment")
+            for i, value in zip(indices, values):
+                del self[i]
+                self._insert_values(i, value)
+            return
+        index = self._get_index(index)
+        values = self._get_values(subtitle)
+        del self[index]
+        self._insert_values(index, values)
+
+    def clear(self):
+        """Remove all subtitles."""
+        self._containers = {}
+        for column in self._get_columns():
+            del column[:]
+
+    def _get_columns(self):
+        """Return a tuple of all per-row columns."""
+        return (self._ends,
+                self._framerates,
+                self._ids,
+                self._main_texts,
+                self._modes,
+                self._starts,
+                self._tran_texts)
+
+    def _get_container(self, index, name):
+        """Return container `name` for row at `index`, creating if needed."""
+        containers = self._containers.setdefault(name, {})
+        row_id = self._ids[index]
+        if not row_id in containers:
+            containers[row_id] = aeidon.containers.new(name)
+        return containers[row_id]
+
+    def _get_index(self, index):
+        """Return non-negative `index` or raise :exc:`IndexError`."""
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Table index out of range")
+        return index
+
+    def _get_values(self, subtitle):
+        """Return a tuple of values of `subtitle` to store in a row."""
+        containers = {}
+        for name in set(x.container for x in aeidon.formats):
+            if subtitle.has_container(name):
+                containers[name] = getattr(subtitle, name)
+        return (subtitle._start,
+                subtitle._end,
+                subtitle._main_text,
+                subtitle._tran_text,
+                subtitle._mode,
+                subtitle._framerate,
+                containers)
+
+    def _has_container(self, index, name):
+        """Return ``True`` if container `name` instantiated at `index`."""
+        containers = self._containers.get(name, {})
+        return self._ids[index] in containers
+
+    def insert(self, index, subtitle):
+        """Insert `subtitle` at `index`."""
+        length = len(self)
+        if index < 0:
+            index = max(0, index + length)
+        index = min(index, length)
+        self._insert_values(index, self._get_values(subtitle))
+
+    def _insert_values(self, index, values):
+        """Insert a row of `values` at `index`."""
+        start, end, main_text, tran_text, mode, framerate, containers = values
+        row_id = self._next_id
+        self._next_id += 1
+        self._ends.insert(index, end)
+        self._framerates.insert(index, self._intern(
+            self._framerate_items, framerate))
+        self._ids.insert(index, row_id)
+        self._main_texts.insert(index, main_text)
+        self._modes.insert(index, self._intern(self._mode_items, mode))
+        self._starts.insert(index, start)
+        self._tran_texts.insert(index, tran_text)
+        for name, container in containers.items():
+            self._containers.setdefault(name, {})[row_id] = container
+
+    def _intern(self, items, value):
+        """Return integer code of `value` in `items`, adding if needed."""
+        for i, item in enumerate(items):
+            if item is value or item == value:
+                return i
+        items.append(value)
+        return len(items) - 1
+
+    def pop(self, index=-1):
+        """Remove and return a detached copy of subtitle at `index`."""
+        subtitle = self[index].copy()
+        del self[index]
+        return subtitle
+
+    def reverse(self):
+        """Reverse the order of subtitles in place."""
+        self.sort(key=lambda x: -x.index)
+
+    def sort(self, key=None, reverse=False):
+        """Sort subtitles in place, by default by start position."""
+        rows = sorted(self, key=key, reverse=reverse)
+        values = [self._get_values(x) for x in rows]
+        self.clear()
+        for i, value in enumerate(values):
+            self._insert_values(i, value)
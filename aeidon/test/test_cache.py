@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+
+
+class TestProjectCache(aeidon.TestCase):
+
+    def setup_method(self, method):
+        directory = aeidon.temp.create_directory()
+        self.cache = aeidon.ProjectCache(directory)
+
+    def save(self, format):
+        path = self.new_temp_file(format)
+        file = aeidon.files.new(format, path, "ascii")
+        subtitles = file.read()
+        self.cache.save(path, "ascii", file, subtitles, 1)
+        return path, file, subtitles
+
+    def test_load(self):
+        for format in aeidon.formats:
+            path, file, subtitles = self.save(format)
+            cached = self.cache.load(path, "ascii")
+            assert cached is not None
+            assert cached[0].format == file.format
+            assert cached[0].header == file.header
+            assert cached[0].newline == file.newline
+            assert cached[1] == subtitles
+            assert cached[2] == 1
+
+    def test_load__changed(self):
+        path = self.save(aeidon.formats.SUBRIP)[0]
+        with open(path, "a") as f:
+            f.write("\n")
+        assert self.cache.load(path, "ascii") is None
+
+    def test_load__containers(self):
+        format = aeidon.formats.ASS
+        path, file, subtitles = self.save(format)
+        cached = self.cache.load(path, "ascii")
+        assert cached[0].event_fields == file.event_fields
+        assert cached[1][0].ssa.style == subtitles[0].ssa.style
+        assert cached[1][0].ssa.margin_l == subtitles[0].ssa.margin_l
+
+    def test_load__corrupt(self):
+        path = self.save(aeidon.formats.SUBRIP)[0]
+        with open(self.cache._get_path(path), "wb") as f:
+            f.write(b"test")
+        assert self.cache.load(path, "ascii") is None
+
+    def test_load__encoding(self):
+        path = self.save(aeidon.formats.SUBRIP)[0]
+        assert self.cache.load(path, "utf_8") is None
+
+    def test_load__missing(self):
+        path = self.new_subrip_file()
+        assert self.cache.load(path, "ascii") is None
+
+    def test_save(self):
+        path = self.save(aeidon.formats.SUBRIP)[0]
+        assert os.path.isfile(self.cache._get_path(path))
@@ -44,6 +44,10 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.add("00:00:10.000",
                              "00:00:10.000") == "00:00:20.000"
 
+    def test_frame_to_milliseconds(self):
+        calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert calc.frame_to_milliseconds(127) == 5080
+
     def test_frame_to_seconds(self):
         calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert calc.frame_to_seconds(127) == 5.08
@@ -99,6 +103,14 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.is_valid_time("12:34:56.789")
         assert self.calc.is_valid_time("-12:34:56.789")
 
+    def test_milliseconds_to_frame(self):
+        assert self.calc.milliseconds_to_frame(6552000) == 157091
+
+    def test_milliseconds_to_time(self):
+        assert self.calc.milliseconds_to_time(68951154) == "19:09:11.154"
+        assert self.calc.milliseconds_to_time(-1500) == "-00:00:01.500"
+        assert self.calc.milliseconds_to_time(10**9) == "99:59:59.999"
+
     def test_normalize_time(self):
         assert self.calc.normalize_time("1:2:3.4") == "01:02:03.400"
         assert self.calc.normalize_time("-1:2:3,4") == "-01:02:03.400"
@@ -116,12 +128,19 @@ class TestCalculator(aeidon.TestCase):
     def test_seconds_to_frame(self):
         assert self.calc.seconds_to_frame(6552) == 157091
 
+    def test_seconds_to_milliseconds(self):
+        assert self.calc.seconds_to_milliseconds(68951.15388) == 68951154
+
     def test_seconds_to_time(self):
         assert self.calc.seconds_to_time(68951.15388) == "19:09:11.154"
 
     def test_time_to_frame(self):
         assert self.calc.time_to_frame("01:22:36.144") == 118829
 
+    def test_time_to_milliseconds(self):
+        assert self.calc.time_to_milliseconds("03:45:22.117") == 13522117
+        assert self.calc.time_to_milliseconds("-00:00:01.500") == -1500
+
     def test_time_to_seconds(self):
         assert self.calc.time_to_seconds("03:45:22.117") == 13522.117
 
@@ -131,6 +150,12 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.to_frame(25) == 25
         assert self.calc.to_frame(1.0) == 25
 
+    def test_to_milliseconds(self):
+        self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert self.calc.to_milliseconds("00:00:01.000") == 1000
+        assert self.calc.to_milliseconds(25) == 1000
+        assert self.calc.to_milliseconds(1.0) == 1000
+
     def test_to_seconds(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_seconds("00:00:01.000") == 1.0
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+import pytest
+import shutil
+
+
+class TestModule(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.directory = aeidon.temp.create_directory()
+        os.makedirs(os.path.join(self.directory, "a"))
+        for name in ("1.srt", os.path.join("a", "2.srt")):
+            path = os.path.join(self.directory, name)
+            shutil.copyfile(self.new_subrip_file(), path)
+        with open(os.path.join(self.directory, "3.xyz"), "w") as f:
+            f.write("test\n")
+
+    def test_convert_file(self):
+        path = self.new_subrip_file()
+        target = os.path.join(self.directory, "b", "test.sub")
+        aeidon.convert.convert_file(path,
+                                    target,
+                                    aeidon.formats.MICRODVD,
+                                    encoding="ascii",
+                                    newline=aeidon.newlines.WINDOWS)
+
+        project = aeidon.Project()
+        project.open_main(target, "ascii")
+        assert project.main_file.format == aeidon.formats.MICRODVD
+        assert project.main_file.newline == aeidon.newlines.WINDOWS
+
+    def test_convert_file__framerate(self):
+        path = self.new_subrip_file()
+        target = os.path.join(self.directory, "test.srt")
+        aeidon.convert.convert_file(path,
+                                    target,
+                                    aeidon.formats.SUBRIP,
+                                    encoding="ascii",
+                                    framerate=aeidon.framerates.FPS_25_000,
+                                    target_framerate=aeidon.framerates.FPS_24_000)
+
+        orig = aeidon.Project()
+        orig.open_main(path, "ascii")
+        project = aeidon.Project()
+        project.open_main(target, "ascii")
+        start = orig.subtitles[-1].start_seconds * 25 / 24
+        assert abs(project.subtitles[-1].start_seconds - start) < 0.002
+
+    def test_find_files(self):
+        files = aeidon.convert.find_files([self.directory])
+        assert [x[1] for x in files] == ["1.srt", os.path.join("a", "2.srt")]
+
+    def test_find_files__glob(self):
+        pattern = os.path.join(self.directory, "**", "*.srt")
+        files = aeidon.convert.find_files([pattern])
+        assert sorted(x[1] for x in files) == ["1.srt",
+                                               os.path.join("a", "2.srt")]
+
+    def test_find_files__glob_subdirectory(self):
+        pattern = os.path.join(self.directory, "*", "*.srt")
+        files = aeidon.convert.find_files([pattern])
+        assert [x[1] for x in files] == [os.path.join("a", "2.srt")]
+
+    def test_main(self):
+        output = os.path.join(self.directory, "out")
+        args = ["-f", "microdvd", "-e", "ascii", "-o", output, "-j", "1"]
+        with pytest.raises(SystemExit) as info:
+            aeidon.convert.main(args + [self.directory])
+        assert info.value.code == 0
+        assert os.path.isfile(os.path.join(output, "1.sub"))
+        assert os.path.isfile(os.path.join(output, "a", "2.sub"))
+
+    def test_main__duplicate(self):
+        os.makedirs(os.path.join(self.directory, "b"))
+        path = os.path.join(self.directory, "b", "2.srt")
+        shutil.copyfile(self.new_subrip_file(), path)
+        output = os.path.join(self.directory, "out")
+        args = ["-f", "microdvd", "-e", "ascii", "-o", output]
+        patterns = [os.path.join(self.directory, x, "*.srt") for x in "ab"]
+        with pytest.raises(SystemExit) as info:
+            aeidon.convert.main(args + patterns)
+        assert info.value.code == 1
+        assert not os.path.isfile(os.path.join(output, "2.sub"))
+
+    def test_main__failure(self):
+        path = os.path.join(self.directory, "3.xyz")
+        output = os.path.join(self.directory, "out")
+        args = ["-f", "subrip", "-e", "ascii", "-o", output, path]
+        with pytest.raises(SystemExit) as info:
+            aeidon.convert.main(args)
+        assert info.value.code == 1
+
+    def test_main__in_place(self):
+        path = os.path.join(self.directory, "1.srt")
+        with open(path, "rb") as f:
+            blob = f.read()
+        args = ["-f", "subrip", "-e", "ascii", "-R", "25.000",
+                "-o", self.directory, path]
+        with pytest.raises(SystemExit) as info:
+            aeidon.convert.main(args)
+        assert info.value.code == 1
+        with open(path, "rb") as f:
+            assert f.read() == blob
+        with pytest.raises(SystemExit) as info:
+            aeidon.convert.main(["--in-place"] + args)
+        assert info.value.code == 0
+        with open(path, "rb") as f:
+            assert f.read() != blob
@@ -155,6 +155,12 @@ class TestModule(aeidon.TestCase):
         name = aeidon.encodings.detect(self.new_subrip_file())
         assert aeidon.encodings.is_valid_code(name)
 
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_detect_bytes__bom(self):
+        blob = codecs.BOM_UTF8 + b"test\n"
+        encoding = aeidon.encodings.detect_bytes(blob)
+        assert encoding == "utf_8_sig"
+
     def test_detect_bom__none(self):
         path = self.new_subrip_file()
         encoding = aeidon.encodings.detect_bom(path)
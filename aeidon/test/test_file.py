@@ -32,6 +32,47 @@ class TestSubtitleFile(aeidon.TestCase):
         newline = aeidon.newlines.UNIX
         self.file = PuppetSubtitleFile(path, "ascii", newline)
 
+    def test_iter_subtitles(self):
+        # SubViewer 2.0 falls back on reading all subtitles.
+        format = aeidon.formats.SUBVIEWER2
+        path = self.new_temp_file(format)
+        file = aeidon.files.new(format, path, "ascii")
+        assert list(file.iter_subtitles()) == file.read()
+
+    def test_iter_subtitles__utf_16_be(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf_16_be") as f:
+            f.write(str(codecs.BOM_UTF16_BE, "utf_16_be"))
+            f.write(text)
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_16_be")
+        assert list(file.iter_subtitles())
+        assert file.has_utf_16_bom
+
+    def test_iter_subtitles__utf_8_sig(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf_8_sig") as f:
+            f.write(text)
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
+        assert list(file.iter_subtitles()) == file.read()
+        assert file.encoding == "utf_8_sig"
+
+    def test__iter_lines(self):
+        with open(self.file.path, "w", newline="") as f:
+            f.write("\r\n\r\na\r\n\r\n b\r\n \r\n\r\n")
+        assert list(self.file._iter_lines()) == ["a", "", " b"]
+        assert self.file.newline == aeidon.newlines.WINDOWS
+
+    def test_read__sniffer(self):
+        path = self.new_subrip_file()
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        file.sniffer = aeidon.FileSniffer(path)
+        assert file.read()
+        assert file.sniffer is None
+
     def test_read__utf_16(self):
         path = self.new_subrip_file()
         with open(path, "r") as f:
@@ -69,3 +110,15 @@ class TestSubtitleFile(aeidon.TestCase):
             f.write(text)
         file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
         file.read()
+
+    def test_write_to_file__blocks(self):
+        path = self.new_subrip_file()
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        subtitles = file.read()
+        file.write(subtitles, aeidon.documents.MAIN)
+        with open(path, "r") as f:
+            text = f.read()
+        file._block_size = 1
+        file.write(subtitles, aeidon.documents.MAIN)
+        with open(path, "r") as f:
+            assert f.read() == text
@@ -72,6 +72,12 @@ class TestFinder(aeidon.TestCase):
         pos = self.find_indices(next=False)
         assert pos == [50, 27, 4, 0]
 
+    def test_previous__regex_set_text(self):
+        self.finder.set_regex(r"\s")
+        self.finder.previous()
+        self.finder.set_text("a b")
+        assert self.finder.previous() == (1, 2)
+
     def test_previous__string(self):
         self.finder.pattern = "it"
         pos = self.find_indices(next=False)
@@ -194,6 +200,23 @@ class TestFinder(aeidon.TestCase):
             "Oneonlyrisksit,because"
             "one'ssurvivaldependsonit.")
 
+    def test_replace_all__context(self):
+        self.finder.set_text("  One\n  two")
+        self.finder.set_regex(r"^ ")
+        self.finder.replacement = ""
+        count = self.finder.replace_all()
+        assert count == 4
+        assert self.finder.text == "One\ntwo"
+
+    def test_replace_all__groups(self):
+        self.finder.set_regex(r"(\w+)(,|\.)")
+        self.finder.replacement = r"\2\1"
+        count = self.finder.replace_all()
+        assert count == 2
+        assert self.finder.text == (
+            "One only risks ,it because\n"
+            "one's survival depends on .it")
+
     def test_replace_all__string(self):
         self.finder.pattern = "i"
         self.finder.replacement = "-"
@@ -202,3 +225,12 @@ class TestFinder(aeidon.TestCase):
         assert self.finder.text == (
             "One only r-sks -t, because\n"
             "one's surv-val depends on -t.")
+
+    def test_replace_all__zero_length(self):
+        self.finder.set_regex(r"\b")
+        self.finder.replacement = "|"
+        count = self.finder.replace_all()
+        assert count == 22
+        assert self.finder.text == (
+            "|One| |only| |risks| |it|, |because|\n"
+            "|one|'|s| |survival| |depends| |on| |it|.")
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestIntervalIndex(aeidon.TestCase):
+
+    def assert_matches(self):
+        subtitles = self.project.subtitles
+        for seconds in range(-10, int(subtitles[-1].end_seconds) + 10):
+            seconds = seconds + 0.5
+            covering = [i for i, x in enumerate(subtitles)
+                        if x.start_seconds <= seconds <= x.end_seconds]
+            assert self.index.get_covering(seconds) == covering
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.index = self.project.get_interval_index()
+
+    def test_get_covering(self):
+        self.assert_matches()
+
+    def test_get_covering__positions_changed(self):
+        self.assert_matches()
+        self.project.shift_positions(None, aeidon.as_seconds(3.2))
+        self.assert_matches()
+        self.project.set_duration(5, aeidon.as_seconds(60))
+        self.assert_matches()
+        self.project.set_start(2, aeidon.as_seconds(1000))
+        self.assert_matches()
+
+    def test_get_covering__subtitles_inserted(self):
+        self.assert_matches()
+        self.project.insert_subtitles((4, 0, 9))
+        self.assert_matches()
+
+    def test_get_covering__subtitles_removed(self):
+        self.assert_matches()
+        self.project.remove_subtitles((1, 5, 6))
+        self.assert_matches()
+        self.project.undo()
+        self.assert_matches()
+
+    def test_get_next(self):
+        subtitle = self.project.subtitles[3]
+        index = self.index.get_next(subtitle.start_seconds)
+        assert index == 4
+        assert self.index.get_next(10**6) is None
+
+    def test_get_overlapping(self):
+        subtitles = self.project.subtitles
+        start = subtitles[2].end_seconds
+        end = subtitles[4].start_seconds
+        assert self.index.get_overlapping(start, end) == [2, 3, 4]
+
+    def test_get_previous(self):
+        subtitle = self.project.subtitles[3]
+        index = self.index.get_previous(subtitle.start_seconds)
+        assert index == 2
+        assert self.index.get_previous(-10**6) is None
@@ -89,3 +89,12 @@ class TestLiner(aeidon.TestCase):
             "was bored she took a golden ball,\n"
             "and threw it up high and caught it; and\n"
             "this ball was her favorite plaything.")
+
+    def test_break_lines__tags(self):
+        text = ("<i>Close by the king's castle</i> "
+                "lay a <b>great</b> dark forest.")
+
+        self.liner.set_text(text)
+        assert self.liner.break_lines() == (
+            "<i>Close by the king's castle</i>\n"
+            "lay a <b>great</b> dark forest.")
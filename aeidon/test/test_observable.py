@@ -20,7 +20,7 @@ import aeidon
 
 class PuppetObservable(aeidon.Observable):
 
-    signals = ("do",)
+    signals = ("changed", "do", "reset")
 
     def __init__(self):
         aeidon.Observable.__init__(self)
@@ -29,6 +29,10 @@ class PuppetObservable(aeidon.Observable):
 
 class TestObservable(aeidon.TestCase):
 
+    def on_changed(self, obj, indices):
+        assert obj is self.obs
+        self.changed.append(indices)
+
     def on_do(self, obj):
         assert obj is self.obs
         self.do_count += 1
@@ -40,8 +44,10 @@ class TestObservable(aeidon.TestCase):
 
     def setup_method(self, method):
         self.obs = PuppetObservable()
+        self.changed = []
         self.do_count = 0
         self.notify_count = 0
+        self.obs.connect("changed", self.on_changed)
         self.obs.connect("do", self.on_do)
         self.obs.connect("notify::x", self.on_notify_x)
 
@@ -78,12 +84,47 @@ class TestObservable(aeidon.TestCase):
         self.obs.emit("do")
         assert self.do_count == 1
 
+    def test_flush_signals(self):
+        self.obs.freeze_signals(("changed",))
+        self.obs.emit("changed", [1])
+        self.obs.flush_signals()
+        assert self.changed == [[1]]
+        self.obs.emit("changed", [2])
+        assert self.changed == [[1]]
+
     def test_freeze_notify(self):
         assert self.obs.freeze_notify()
         assert not self.obs.freeze_notify()
         self.obs.x = 1
         assert self.notify_count == 0
 
+    def test_freeze_signals(self):
+        assert self.obs.freeze_signals(("changed", "do"))
+        assert not self.obs.freeze_signals(("changed", "do"))
+        self.obs.emit("changed", [1])
+        self.obs.emit("do")
+        assert not self.changed
+        assert self.do_count == 0
+
+    def test_freeze_signals__remap(self):
+        def remap(indices):
+            return [x + 1 for x in indices if x != 2]
+        self.obs.freeze_signals(("changed",), {"do": remap})
+        self.obs.emit("changed", [1, 2])
+        self.obs.emit("do")
+        assert self.do_count == 1
+        assert not self.changed
+        self.obs.emit("changed", [2])
+        self.obs.thaw_signals()
+        assert self.changed == [[2]]
+
+    def test_freeze_signals__remap_empty(self):
+        self.obs.freeze_signals(("changed",), {"do": lambda x: []})
+        self.obs.emit("changed", [1])
+        self.obs.emit("do")
+        self.obs.thaw_signals()
+        assert not self.changed
+
     def test_notify(self):
         self.obs.notify("x")
         assert self.notify_count == 1
@@ -96,6 +137,17 @@ class TestObservable(aeidon.TestCase):
         assert not self.obs.thaw_notify()
         assert self.notify_count == 1
 
+    def test_thaw_signals(self):
+        self.obs.freeze_signals(("changed", "do"))
+        self.obs.emit("do")
+        self.obs.emit("do")
+        self.obs.emit("changed", (3, 1))
+        self.obs.emit("changed", [1, 2])
+        assert self.obs.thaw_signals()
+        assert not self.obs.thaw_signals()
+        assert self.do_count == 1
+        assert self.changed == [[1, 2, 3]]
+
     def test_unblock(self):
         self.obs.block("do")
         assert self.obs.unblock("do")
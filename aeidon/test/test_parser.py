@@ -39,6 +39,30 @@ class TestParser(aeidon.TestCase):
         self.parser.set_text(text)
         assert self.parser.get_text() == text
 
+    def test_replace_all__context(self):
+        text = "<i>--- One</i>\n--- <b>two</b>"
+        self.parser.set_text(text)
+        self.parser.set_regex(r"^-")
+        self.parser.replacement = ""
+        assert self.parser.replace_all() == 6
+        assert self.parser.get_text() == "<i> One</i>\n <b>two</b>"
+
+    def test_replace_all__empty_lines(self):
+        text = "<i>One</i>\n\n<b>two</b>"
+        self.parser.set_text(text)
+        self.parser.set_regex(r"(^\n|\n$)")
+        self.parser.replacement = ""
+        assert self.parser.replace_all() == 1
+        assert self.parser.get_text() == "<i>One</i>\n<b>two</b>"
+
+    def test_replace_all__empty_lines_spanned(self):
+        text = "<i>One\n\n- two.</i>"
+        self.parser.set_text(text)
+        self.parser.set_regex(r"(^\n|\n$)")
+        self.parser.replacement = ""
+        assert self.parser.replace_all() == 1
+        assert self.parser.get_text() == "<i>One\n- two.</i>"
+
     def test_replace_all__regex(self):
         text = ("<i>One only risks it, <b>because</b>\n"
                 "one's survival depends on it.</i>")
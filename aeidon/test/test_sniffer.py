@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import codecs
+
+from unittest.mock import patch
+
+
+class TestFileSniffer(aeidon.TestCase):
+
+    def new_sniffer(self, text):
+        path = aeidon.temp.create()
+        with open(path, "w", newline="") as f:
+            f.write(text)
+        return aeidon.FileSniffer(path)
+
+    def test_decode(self):
+        sniffer = self.new_sniffer("a\r\nb\r\n")
+        assert sniffer.decode("ascii") == "a\r\nb\r\n"
+
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_detect_bom(self):
+        path = self.new_subrip_file()
+        with open(path, "rb") as f:
+            blob = f.read()
+        with open(path, "wb") as f:
+            f.write(codecs.BOM_UTF8 + blob)
+        sniffer = aeidon.FileSniffer(path)
+        assert sniffer.detect_bom() == "utf_8_sig"
+
+    def test_detect_bom__none(self):
+        sniffer = aeidon.FileSniffer(self.new_subrip_file())
+        assert sniffer.detect_bom() is None
+
+    def test_detect_format(self):
+        for format in aeidon.formats:
+            sniffer = aeidon.FileSniffer(self.new_temp_file(format))
+            assert sniffer.detect_format("ascii") == format
+
+    def test_detect_format__error(self):
+        sniffer = self.new_sniffer("a\nb\nc\n")
+        self.assert_raises(aeidon.FormatError,
+                           sniffer.detect_format,
+                           "ascii")
+
+    def test_detect_newlines__mac(self):
+        sniffer = self.new_sniffer("a\rb\rc\r")
+        newlines = sniffer.detect_newlines("ascii")
+        assert newlines == aeidon.newlines.MAC
+
+    def test_detect_newlines__none(self):
+        sniffer = self.new_sniffer("a")
+        assert sniffer.detect_newlines("ascii") is None
+
+    def test_detect_newlines__unix(self):
+        sniffer = self.new_sniffer("a\nb\nc\n")
+        newlines = sniffer.detect_newlines("ascii")
+        assert newlines == aeidon.newlines.UNIX
+
+    def test_detect_newlines__windows(self):
+        sniffer = self.new_sniffer("a\r\nb\r\nc\r\n")
+        newlines = sniffer.detect_newlines("ascii")
+        assert newlines == aeidon.newlines.WINDOWS
+
+    def test_read_lines(self):
+        sniffer = self.new_sniffer("a\r\nb\rc\n\nd\n")
+        lines = sniffer.read_lines("ascii")
+        assert lines == ["a", "b", "c", "", "d"]
+
+    def test_read_lines__cached(self):
+        sniffer = self.new_sniffer("a\nb\n")
+        lines = sniffer.read_lines("ascii")
+        lines.append("c")
+        assert sniffer.read_lines("ascii") == ["a", "b"]
+        assert sniffer.read_lines("utf_8") == ["a", "b"]
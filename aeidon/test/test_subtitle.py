@@ -60,6 +60,16 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.start == "00:00:01.043"
         assert self.tsub.end == "00:00:02.085"
 
+    def test_copy_positions(self):
+        self.tsub.ssa.layer = 1
+        subtitle = self.tsub.copy_positions()
+        assert subtitle.start == self.tsub.start
+        assert subtitle.end == self.tsub.end
+        assert subtitle.mode == self.tsub.mode
+        assert subtitle.framerate == self.tsub.framerate
+        assert subtitle.main_text == ""
+        assert not subtitle.has_container("ssa")
+
     def test_duration__get(self):
         assert self.tsub.duration == "00:00:02.000"
         assert self.fsub.duration == 200
@@ -178,6 +188,12 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.get_text(MAIN) == "main"
         assert self.tsub.get_text(TRAN) == "translation"
 
+    def test_has_container(self):
+        assert not self.tsub.has_container("ssa")
+        self.tsub.ssa.layer = 1
+        assert self.tsub.has_container("ssa")
+        assert not self.tsub.has_container("subrip")
+
     def test_main_text__get(self):
         assert self.tsub.main_text == "main"
         assert self.fsub.main_text == "main"
@@ -193,8 +209,8 @@ class TestSubtitle(aeidon.TestCase):
     def test_mode__set_frame(self):
         self.fsub.mode = FRAME
         self.fsub.mode = TIME
-        assert self.fsub._start == "00:00:04.000"
-        assert self.fsub._end == "00:00:12.000"
+        assert self.fsub._start == 4000
+        assert self.fsub._end == 12000
 
     def test_mode__set_time(self):
         self.tsub.mode = TIME
@@ -225,13 +241,13 @@ class TestSubtitle(aeidon.TestCase):
 
     def test_shift_positions__seconds(self):
         self.tsub.shift_positions(1.0)
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub._start == 2000
+        assert self.tsub._end == 4000
 
     def test_shift_positions__time(self):
         self.tsub.shift_positions("00:00:01.000")
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub._start == 2000
+        assert self.tsub._end == 4000
 
     def test_start__get(self):
         assert self.tsub.start == "00:00:01.000"
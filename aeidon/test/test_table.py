@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestSubtitleRow(aeidon.TestCase):
+
+    def setup_method(self, method):
+        project = self.new_project()
+        self.subtitles = project.subtitles
+        self.table = aeidon.SubtitleTable(self.subtitles)
+
+    def test_copy(self):
+        subtitle = self.table[1].copy()
+        assert type(subtitle) is aeidon.Subtitle
+        assert subtitle == self.subtitles[1]
+
+    def test_framerate__set(self):
+        framerate = aeidon.framerates.FPS_25_000
+        self.table[0].framerate = framerate
+        assert self.table[0].framerate == framerate
+        assert self.table[0].calc is aeidon.Calculator(framerate)
+        assert self.table[1].framerate != framerate
+
+    def test_has_container(self):
+        assert not self.table[0].has_container("ssa")
+        self.table[0].ssa.layer = 1
+        assert self.table[0].has_container("ssa")
+        assert self.table[0].ssa.layer == 1
+        assert not self.table[1].has_container("ssa")
+
+    def test_mode__set(self):
+        self.table[0].mode = aeidon.modes.FRAME
+        assert self.table[0].start == self.subtitles[0].start_frame
+        assert self.table[1].mode == aeidon.modes.TIME
+
+    def test_shift_positions(self):
+        self.table[0].shift_positions(1.0)
+        self.subtitles[0].shift_positions(1.0)
+        assert self.table[0].start == self.subtitles[0].start
+        assert self.table[0].end == self.subtitles[0].end
+
+    def test_start__set(self):
+        self.table[0].start = "00:00:01.500"
+        assert self.table[0].start == "00:00:01.500"
+        assert self.table[0].start_seconds == 1.5
+
+    def test_text__set(self):
+        self.table[0].main_text = "test"
+        assert self.table[0].main_text == "test"
+        assert self.table[1].main_text != "test"
+
+
+class TestSubtitleTable(aeidon.TestCase):
+
+    def setup_method(self, method):
+        project = self.new_project()
+        self.subtitles = project.subtitles
+        self.table = aeidon.SubtitleTable(self.subtitles)
+
+    def test___delitem__(self):
+        del self.table[0]
+        assert self.table == self.subtitles[1:]
+
+    def test___delitem____slice(self):
+        del self.table[1:3]
+        assert self.table == self.subtitles[:1] + self.subtitles[3:]
+
+    def test___eq__(self):
+        assert self.table == self.subtitles
+        assert self.table == aeidon.SubtitleTable(self.subtitles)
+        assert self.table != self.subtitles[1:]
+
+    def test___getitem__(self):
+        assert self.table[0] == self.subtitles[0]
+        assert self.table[-1] == self.subtitles[-1]
+        self.assert_raises(IndexError, lambda: self.table[len(self.table)])
+
+    def test___getitem____slice(self):
+        assert self.table[1:3] == self.subtitles[1:3]
+
+    def test___iter__(self):
+        assert list(self.table) == self.subtitles
+
+    def test___len__(self):
+        assert len(self.table) == len(self.subtitles)
+
+    def test___setitem__(self):
+        self.table[0] = self.subtitles[1]
+        assert self.table[0] == self.subtitles[1]
+        assert len(self.table) == len(self.subtitles)
+
+    def test_clear(self):
+        self.table.clear()
+        assert len(self.table) == 0
+
+    def test_insert(self):
+        subtitle = aeidon.Subtitle()
+        subtitle.ssa.layer = 2
+        self.table.insert(1, subtitle)
+        assert self.table[1] == subtitle
+        assert self.table[1].ssa.layer == 2
+        assert self.table[2] == self.subtitles[1]
+
+    def test_pop(self):
+        self.table[1].ssa.layer = 3
+        subtitle = self.table.pop(1)
+        assert type(subtitle) is aeidon.Subtitle
+        assert subtitle == self.subtitles[1]
+        assert subtitle.ssa.layer == 3
+        assert not self.table[1].has_container("ssa")
+
+    def test_reverse(self):
+        self.table.reverse()
+        assert self.table == self.subtitles[::-1]
+
+    def test_sort(self):
+        self.table.reverse()
+        self.table.sort()
+        assert self.table == self.subtitles
@@ -21,6 +21,7 @@ import aeidon
 import collections
 import contextlib
 import inspect
+import itertools
 import locale
 import mimetypes
 import os
@@ -159,15 +160,22 @@ def detect_format(path, encoding):
     Raise :exc:`aeidon.FormatError` if unable to detect format.
     Return an :attr:`aeidon.formats` enumeration item.
     """
-    re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
     with open(path, "r", encoding=encoding) as f:
-        for line in f:
-            for format, re_id in re_ids:
-                if re_id.search(line) is not None:
-                    return format
+        format = detect_format_lines(f)
+    if format is not None:
+        return format
     raise aeidon.FormatError("Failed to detect format of file {!r}"
                              .format(path))
 
+def detect_format_lines(lines):
+    """Detect and return format of subtitle file `lines` or ``None``."""
+    re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
+    for line in lines:
+        for format, re_id in re_ids:
+            if re_id.search(line) is not None:
+                return format
+    return None
+
 def detect_newlines(path):
     """Detect and return the newline type of file at `path` or ``None``."""
     try:
@@ -176,20 +184,7 @@ def detect_newlines(path):
             chars = f.newlines
     except Exception:
         return None
-    if chars is None:
-        return None
-    if isinstance(chars, str):
-        return aeidon.newlines.find_item("value", chars)
-    if isinstance(chars, tuple):
-        if len(chars) == 1:
-            return aeidon.newlines.find_item("value", chars[0])
-        # This is not actually correct. If both CR and LF are detected,
-        # it could mean a mixture of Mac and Unix newlines on separate
-        # lines or one Windows newline in a mostly something else file.
-        # We could count the frequencies, but it's probably not worth
-        # the effort.
-        return aeidon.newlines.WINDOWS
-    return None
+    return get_newline(chars)
 
 def flatten(lst):
     """
@@ -236,6 +231,28 @@ def get_encoding_alias(encoding):
         return aliases[encoding]
     return encoding
 
+def get_newline(chars):
+    """
+    Return newline type matching `chars` or ``None``.
+
+    `chars` should be the value of the ``newlines`` attribute of a file
+    object, i.e. ``None``, a string or a tuple of strings.
+    """
+    if chars is None:
+        return None
+    if isinstance(chars, str):
+        return aeidon.newlines.find_item("value", chars)
+    if isinstance(chars, tuple):
+        if len(chars) == 1:
+            return aeidon.newlines.find_item("value", chars[0])
+        # This is not actually correct. If both CR and LF are detected,
+        # it could mean a mixture of Mac and Unix newlines on separate
+        # lines or one Windows newline in a mostly something else file.
+        # We could count the frequencies, but it's probably not worth
+        # the effort.
+        return aeidon.newlines.WINDOWS
+    return None
+
 def get_ranges(lst):
     """
     Return a list of ranges in list of integers.
@@ -244,9 +261,9 @@ def get_ranges(lst):
     [[1, 2, 3], [5, 6, 7], [9], [11, 12]]
     """
     if not lst: return []
-    lst = sorted(get_unique(lst))
-    ranges = [[lst.pop(0)]]
-    for item in lst:
+    lst = sorted(set(lst))
+    ranges = [[lst[0]]]
+    for item in itertools.islice(lst, 1, None):
         if item == ranges[-1][-1] + 1:
             ranges[-1].append(item)
         else:
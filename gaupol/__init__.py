@@ -47,6 +47,7 @@ gi.require_version("Gdk", "3.0")
 gi.require_version("Gtk", "3.0")
 
 for module, version in {
+    "Gspell": "1",
     "Gst": "1.0",
     "GstPbutils": "1.0",
     "GstVideo": "1.0",
@@ -72,6 +73,7 @@ from gaupol.entries import * # noqa
 from gaupol.renderers import * # noqa
 from gaupol.floatlabel import * # noqa
 from gaupol.spell import * # noqa
+from gaupol.model import * # noqa
 from gaupol.view import * # noqa
 from gaupol.page import * # noqa
 from gaupol.player import * # noqa
@@ -268,14 +268,11 @@ class EditAgent(aeidon.Delegate):
         pos = self.player.get_position(mode)
         if pos is None: return
         page = self.get_current_page()
-        for i, subtitle in reversed(list(enumerate(page.project.subtitles))):
-            if subtitle.start_seconds < pos:
-                page.view.select_rows([i])
-                page.view.scroll_to_row([i])
-                return
+        i = page.project.get_interval_index().get_previous(pos)
         # Select the first subtitle, if nothing previous.
-        page.view.select_rows([0])
-        page.view.scroll_to_row([0])
+        if i is None: i = 0
+        page.view.select_rows([i])
+        page.view.scroll_to_row([i])
 
     @aeidon.deco.export
     def _on_select_next_from_video_position_activate(self, *args):
@@ -284,15 +281,11 @@ class EditAgent(aeidon.Delegate):
         pos = self.player.get_position(mode)
         if pos is None: return
         page = self.get_current_page()
-        for i, subtitle in enumerate(page.project.subtitles):
-            if subtitle.start_seconds > pos:
-                page.view.select_rows([i])
-                page.view.scroll_to_row([i])
-                return
+        i = page.project.get_interval_index().get_next(pos)
         # Select the last subtitle, if nothing next.
-        last = len(page.project.subtitles) - 1
-        page.view.select_rows([last])
-        page.view.scroll_to_row([last])
+        if i is None: i = len(page.project.subtitles) - 1
+        page.view.select_rows([i])
+        page.view.scroll_to_row([i])
 
     @aeidon.deco.export
     def _on_set_end_from_video_position_activate(self, *args):
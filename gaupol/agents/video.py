@@ -41,18 +41,71 @@ class VideoAgent(aeidon.Delegate):
         aeidon.Delegate.__init__(self, master)
         # Maintain an up-to-date cache of subtitle positions in seconds and
         # subtitle texts in order to allow fast polled updates in video player.
-        # This cache must be updated when page or subtitle data changes.
+        # This cache is rebuilt when the page changes and patched using the
+        # indices of project signals when subtitle data changes. The cursor
+        # is the index of the last subtitle shown, which during playback is
+        # usually still the one to show or immediately followed by it.
         self._cache = []
+        self._cache_project = None
+        self._cursor = None
         self._update_handlers = []
 
     def _clear_subtitle_cache(self):
         """Clear subtitle position and text cache."""
+        self._disconnect_cache_project()
         self._cache = []
+        self._cursor = None
+
+    def _connect_cache_project(self, project):
+        """Connect to signals of `project` to keep cache up to date."""
+        self._disconnect_cache_project()
+        self._cache_project = project
+        for signal, method in self._get_cache_project_handlers():
+            project.connect(signal, method)
+
+    def _disconnect_cache_project(self):
+        """Disconnect from signals of project of cache."""
+        if self._cache_project is None: return
+        for signal, method in self._get_cache_project_handlers():
+            self._cache_project.disconnect(signal, method)
+        self._cache_project = None
+
+    def _find_cached_subtitle(self, pos):
+        """Return index of the last subtitle at `pos` or ``None``."""
+        if (self._cache is None or
+            len(self._cache) != len(self._cache_project.subtitles)):
+            self._rebuild_subtitle_cache()
+        cache = self._cache
+        candidates = []
+        if self._cursor is not None:
+            candidates = [self._cursor, self._cursor + 1]
+        # Since subtitles are sorted by start position, a subtitle is the last
+        # one at pos if it covers pos and the next one starts only after pos.
+        for i in candidates:
+            if i >= len(cache) or cache[i][0] > pos: break
+            if i + 1 < len(cache) and cache[i+1][0] <= pos: continue
+            if cache[i][1] < pos: break
+            self._cursor = i
+            return i
+        indices = self._cache_project.get_interval_index().get_covering(pos)
+        self._cursor = indices[-1] if indices else None
+        return self._cursor
+
+    def _get_cache_project_handlers(self):
+        """Return a list of signals and methods to update cache with."""
+        return [
+            ("main-file-opened",   self._on_cache_project_reset),
+            ("main-texts-changed", self._on_cache_project_main_texts_changed),
+            ("notify::framerate",  self._on_cache_project_reset),
+            ("positions-changed",  self._on_cache_project_positions_changed),
+            ("subtitles-inserted", self._on_cache_project_subtitles_inserted),
+            ("subtitles-removed",  self._on_cache_project_subtitles_removed),
+            ("translation-file-opened", self._on_cache_project_reset),
+        ]
 
     def _init_cache_updates(self):
         """Initialize cache updates on application signals."""
         self.connect("page-added",    self._update_subtitle_cache)
-        self.connect("page-changed",  self._update_subtitle_cache)
         self.connect("page-closed",   self._update_subtitle_cache)
         self.connect("page-switched", self._update_subtitle_cache)
 
@@ -180,6 +233,45 @@ class VideoAgent(aeidon.Delegate):
         if not gaupol.conf.video_player.autoplay:
             self.player.pause()
 
+    def _on_cache_project_main_texts_changed(self, project, indices):
+        """Update texts of subtitles at `indices` in cache."""
+        if self._cache is None: return
+        for i in indices:
+            start, end, text = self._cache[i]
+            self._cache[i] = (start, end, project.subtitles[i].main_text)
+
+    def _on_cache_project_positions_changed(self, project, indices):
+        """Update positions of subtitles at `indices` in cache."""
+        if self._cache is None: return
+        for i in indices:
+            subtitle = project.subtitles[i]
+            self._cache[i] = (subtitle.start_seconds,
+                              subtitle.end_seconds,
+                              self._cache[i][2])
+
+    def _on_cache_project_reset(self, *args):
+        """Discard cache to be rebuilt upon next use."""
+        self._cache = None
+        self._cursor = None
+
+    def _on_cache_project_subtitles_inserted(self, project, indices):
+        """Insert subtitles at `indices` to cache."""
+        if self._cache is None: return
+        for i in sorted(indices):
+            subtitle = project.subtitles[i]
+            self._cache.insert(i, (subtitle.start_seconds,
+                                   subtitle.end_seconds,
+                                   subtitle.main_text))
+
+        self._cursor = None
+
+    def _on_cache_project_subtitles_removed(self, project, indices):
+        """Remove subtitles at `indices` from cache."""
+        if self._cache is None: return
+        for i in sorted(indices, reverse=True):
+            del self._cache[i]
+        self._cursor = None
+
     @aeidon.deco.export
     def _on_load_video_activate(self, *args):
         """Load a video file."""
@@ -242,9 +334,11 @@ class VideoAgent(aeidon.Delegate):
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None:
             return True # to be called again.
-        subtitles = list(filter(lambda x: x[0] <= pos <= x[1], self._cache))
-        if subtitles:
-            text = subtitles[-1][2]
+        i = None
+        if self._cache_project is not None:
+            i = self._find_cached_subtitle(pos)
+        if i is not None:
+            text = self._cache[i][2]
             if text != self.player.subtitle_text_raw:
                 self.player.subtitle_text = text
         else:
@@ -284,15 +378,19 @@ class VideoAgent(aeidon.Delegate):
         """Seek to the start of the next subtitle."""
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None: return
-        subtitles = list(filter(lambda x: x[0] > pos + 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[0][0])
+        page = self.get_current_page()
+        if page is None: return
+        i = page.project.get_interval_index().get_next(pos + 0.001)
+        if i is None: return
+        self.player.seek(page.project.subtitles[i].start_seconds)
 
     @aeidon.deco.export
     def _on_seek_previous_activate(self, *args):
         """Seek to the start of the previous subtitle."""
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None: return
+        if self._cache is None:
+            self._rebuild_subtitle_cache()
         subtitles = list(filter(lambda x: x[1] < pos - 0.001, self._cache))
         if not subtitles: return
         self.player.seek(subtitles[-1][0])
@@ -352,6 +450,13 @@ class VideoAgent(aeidon.Delegate):
         self.volume_button.set_value(self.player.volume)
         self.update_gui()
 
+    def _rebuild_subtitle_cache(self):
+        """Rebuild subtitle position and text cache from project."""
+        self._cache = [(x.start_seconds, x.end_seconds, x.main_text)
+                       for x in self._cache_project.subtitles]
+
+        self._cursor = None
+
     def _update_languages_menu(self):
         """Update the audio language selection menu."""
         menu = self.get_menubar_section("audio-languages-placeholder")
@@ -372,9 +477,9 @@ class VideoAgent(aeidon.Delegate):
                 action.set_state(str(i))
 
     def _update_subtitle_cache(self, *args, **kwargs):
-        """Update subtitle position and text cache."""
+        """Update subtitle position and text cache for current page."""
         page = self.get_current_page()
         if self.player is None or page is None:
             return self._clear_subtitle_cache()
-        self._cache = [(x.start_seconds, x.end_seconds, x.main_text)
-                       for x in page.project.subtitles]
+        self._connect_cache_project(page.project)
+        self._rebuild_subtitle_cache()
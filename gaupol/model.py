@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""List data model reading subtitle data directly from a project."""
+
+import aeidon
+import gaupol
+
+from gi.repository import GObject
+from gi.repository import Gtk
+
+__all__ = ("SubtitleModel",)
+
+
+class SubtitleModel(GObject.Object, Gtk.TreeModel):
+
+    """
+    List data model reading subtitle data directly from a project.
+
+    :ivar edit_mode: :attr:`aeidon.modes` item corresponding to editing mode
+    :ivar project: The :class:`aeidon.Project` instance to read data from
+
+    Columns are those of :attr:`gaupol.fields` and values are read lazily
+    from :attr:`project.subtitles` when requested by the view, so subtitle
+    data is not copied. The model does not listen to project signals itself,
+    instead the owner of the model should call :meth:`insert_rows`,
+    :meth:`remove_rows` and :meth:`update_rows` to notify views of changes.
+
+    Row ``i`` is stored in tree iterators as ``i + 1`` to keep user data of
+    the first row distinct from a ``NULL`` pointer.
+    """
+
+    def __init__(self, project, edit_mode):
+        """Initialize a :class:`SubtitleModel` instance."""
+        GObject.Object.__init__(self)
+        self._count = len(project.subtitles)
+        self._stamp = id(self) & 0x7fffffff
+        self.edit_mode = edit_mode
+        self.project = project
+        if edit_mode == aeidon.modes.TIME:
+            self._types = (int, str, str, float, str, str)
+        if edit_mode == aeidon.modes.FRAME:
+            self._types = (int, int, int, int, str, str)
+
+    def do_get_column_type(self, index):
+        """Return type of column at `index`."""
+        return self._types[index]
+
+    def do_get_flags(self):
+        """Return flags of the model."""
+        return Gtk.TreeModelFlags.LIST_ONLY
+
+    def do_get_iter(self, path):
+        """Return tree iterator for `path`."""
+        return self._new_iter(path.get_indices()[0])
+
+    def do_get_n_columns(self):
+        """Return the amount of columns."""
+        return len(self._types)
+
+    def do_get_path(self, itr):
+        """Return tree path for `itr`."""
+        return gaupol.util.tree_row_to_path(itr.user_data - 1)
+
+    def do_get_value(self, itr, column):
+        """Return value of `column` in row of `itr`."""
+        return self._get_value(itr.user_data - 1, column)
+
+    def do_iter_children(self, parent):
+        """Return tree iterator for the first child of `parent`."""
+        if parent is not None: return (False, None)
+        return self._new_iter(0)
+
+    def do_iter_has_child(self, itr):
+        """Return ``False``, rows don't have children."""
+        return False
+
+    def do_iter_n_children(self, itr):
+        """Return the amount of children of `itr`."""
+        return self._count if itr is None else 0
+
+    def do_iter_next(self, itr):
+        """Move `itr` to the next row and return ``True`` if valid."""
+        if itr.user_data >= self._count: return False
+        itr.user_data += 1
+        return True
+
+    def do_iter_nth_child(self, parent, n):
+        """Return tree iterator for child `n` of `parent`."""
+        if parent is not None: return (False, None)
+        return self._new_iter(n)
+
+    def do_iter_parent(self, child):
+        """Return ``False``, rows don't have parents."""
+        return (False, None)
+
+    def do_iter_previous(self, itr):
+        """Move `itr` to the previous row and return ``True`` if valid."""
+        if itr.user_data <= 1: return False
+        itr.user_data -= 1
+        return True
+
+    def _get_value(self, row, field):
+        """Return value of subtitle data for `row` and `field`."""
+        if field == gaupol.fields.NUMBER:
+            return row + 1
+        mode = self.edit_mode
+        subtitle = self.project.subtitles[row]
+        if field == gaupol.fields.START:
+            return subtitle.get_start(mode)
+        if field == gaupol.fields.END:
+            return subtitle.get_end(mode)
+        if field == gaupol.fields.DURATION:
+            if mode == aeidon.modes.TIME:
+                return subtitle.duration_seconds
+            if mode == aeidon.modes.FRAME:
+                return subtitle.duration_frame
+            raise ValueError("Invalid mode: {!r}"
+                             .format(mode))
+
+        if field == gaupol.fields.MAIN_TEXT:
+            return subtitle.main_text
+        if field == gaupol.fields.TRAN_TEXT:
+            return subtitle.tran_text
+        raise ValueError("Invalid field: {!r}"
+                         .format(field))
+
+    def insert_rows(self, rows):
+        """Notify views of subtitles inserted at `rows`."""
+        # Rows are indices after insertion, emit in ascending order
+        # so that each is valid at the time of its emission.
+        for row in sorted(rows):
+            self._count += 1
+            path = gaupol.util.tree_row_to_path(row)
+            self.row_inserted(path, self._new_iter(row)[1])
+
+    def _new_iter(self, row):
+        """Return a ``(valid, iter)`` tuple for `row`."""
+        if not 0 <= row < self._count: return (False, None)
+        itr = Gtk.TreeIter()
+        itr.stamp = self._stamp
+        itr.user_data = row + 1
+        return (True, itr)
+
+    def remove_rows(self, rows):
+        """Notify views of subtitles removed from `rows`."""
+        for row in sorted(rows, reverse=True):
+            self._count -= 1
+            path = gaupol.util.tree_row_to_path(row)
+            self.row_deleted(path)
+
+    def update_rows(self, rows):
+        """Notify views of changed data in `rows`."""
+        # Walk contiguous ranges with a single path and iterator
+        # each to avoid creating new ones for every row.
+        for lst in aeidon.util.get_ranges(rows):
+            valid, itr = self._new_iter(lst[0])
+            if not valid: continue
+            path = gaupol.util.tree_row_to_path(lst[0])
+            for row in lst:
+                self.row_changed(path, itr)
+                if not self.do_iter_next(itr): break
+                path.next()
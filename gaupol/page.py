@@ -60,6 +60,7 @@ class Page(aeidon.Observable):
         self.untitle = _("Untitled {:d}").format(count)
         self.view = gaupol.View(self.edit_mode)
         self._init_project()
+        self.reload_view_all()
         self._init_widgets()
         self._init_signal_handlers()
         self.update_tab_label()
@@ -89,29 +90,6 @@ class Page(aeidon.Observable):
             return os.path.basename(self.project.main_file.path)
         return self.untitle
 
-    def _get_subtitle_value(self, row, field):
-        """Return value of subtitle data for `row` and `field`."""
-        mode = self.edit_mode
-        subtitle = self.project.subtitles[row]
-        if field == gaupol.fields.START:
-            return subtitle.get_start(mode)
-        if field == gaupol.fields.END:
-            return subtitle.get_end(mode)
-        if field == gaupol.fields.DURATION:
-            if mode == aeidon.modes.TIME:
-                return subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                return subtitle.duration_frame
-            raise ValueError("Invalid mode: {!r}"
-                             .format(mode))
-
-        if field == gaupol.fields.MAIN_TEXT:
-            return subtitle.main_text
-        if field == gaupol.fields.TRAN_TEXT:
-            return subtitle.tran_text
-        raise ValueError("Invalid field: {!r}"
-                         .format(field))
-
     def _get_tab_close_button(self):
         """Initialize and return a tab close button."""
         button = Gtk.Button()
@@ -236,20 +214,7 @@ class Page(aeidon.Observable):
     def _on_project_subtitles_inserted(self, project, rows):
         """Insert rows to the view and select them."""
         if not rows: return
-        mode = self.edit_mode
-        store = self.view.get_model()
-        for row in sorted(rows):
-            subtitle = self.project.subtitles[row]
-            store.insert(row)
-            store[row][0] = row + 1
-            store[row][1] = subtitle.get_start(mode)
-            store[row][2] = subtitle.get_end(mode)
-            if mode == aeidon.modes.TIME:
-                store[row][3] = subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                store[row][3] = subtitle.duration_frame
-            store[row][4] = subtitle.main_text
-            store[row][5] = subtitle.tran_text
+        self._update_model("insert_rows", rows)
         self.view.set_focus(rows[0])
         self.view.select_rows(rows)
         gaupol.util.iterate_main()
@@ -257,17 +222,7 @@ class Page(aeidon.Observable):
     def _on_project_subtitles_removed(self, project, rows):
         """Remove rows from the view."""
         if not rows: return
-        store = self.view.get_model()
-        if len(rows) > 50:
-            # Unset and later reset the model if removing a large amount
-            # of rows, because a large batch of separate live updates
-            # directly made to the view are slow.
-            self.view.set_model(None)
-        for row in reversed(sorted(rows)):
-            path = gaupol.util.tree_row_to_path(row)
-            store.remove(store.get_iter(path))
-        if len(rows) > 50:
-            self.view.set_model(store)
+        self._update_model("remove_rows", rows)
         if self.project.subtitles:
             row = min(rows[0], len(self.project.subtitles)-1)
             col = self.view.get_focus()[1]
@@ -308,29 +263,14 @@ class Page(aeidon.Observable):
 
     def reload_view(self, rows, fields):
         """Reload the view in `rows` and `fields`."""
-        store = self.view.get_model()
-        for row, field in ((x, y) for x in rows for y in fields):
-            value = self._get_subtitle_value(row, field)
-            store[row][field] = value
+        # Values are read from the project on demand,
+        # all fields of rows are redrawn regardless.
+        self.view.get_model().update_rows(rows)
 
     def reload_view_all(self):
-        """Clear and repopulate the entire view."""
-        store = self.view.get_model()
-        self.view.set_model(None)
-        store.clear()
-        mode = self.edit_mode
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.insert(i)
-            store[i][0] = i + 1
-            store[i][1] = subtitle.get_start(mode)
-            store[i][2] = subtitle.get_end(mode)
-            if mode == aeidon.modes.TIME:
-                store[i][3] = subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                store[i][3] = subtitle.duration_frame
-            store[i][4] = subtitle.main_text
-            store[i][5] = subtitle.tran_text
-        self.view.set_model(store)
+        """Reset the entire view to match project data."""
+        model = gaupol.SubtitleModel(self.project, self.edit_mode)
+        self.view.set_model(model)
 
     def text_column_to_document(self, col):
         """Translate view's column enumeration to document enumeration."""
@@ -341,6 +281,18 @@ class Page(aeidon.Observable):
         raise ValueError("Invalid column: {!r}"
                          .format(col))
 
+    def _update_model(self, name, rows):
+        """Call model method `name` with inserted or removed `rows`."""
+        model = self.view.get_model()
+        if len(rows) <= 50:
+            return getattr(model, name)(rows)
+        # Unset and later reset the model if inserting or removing a large
+        # amount of rows, because a large batch of separate live structural
+        # changes directly made to the view are slow.
+        self.view.set_model(None)
+        getattr(model, name)(rows)
+        self.view.set_model(model)
+
     def update_tab_label(self):
         """Update the notebook tab label and return title."""
         title = self.get_main_basename()
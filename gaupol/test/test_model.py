@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import gaupol
+
+
+class TestSubtitleModel(gaupol.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.model = gaupol.SubtitleModel(self.project, aeidon.modes.TIME)
+
+    def test_get_value(self):
+        subtitle = self.project.subtitles[3]
+        assert self.model[3][0] == 4
+        assert self.model[3][1] == subtitle.start_time
+        assert self.model[3][2] == subtitle.end_time
+        assert self.model[3][3] == subtitle.duration_seconds
+        assert self.model[3][4] == subtitle.main_text
+        assert self.model[3][5] == subtitle.tran_text
+
+    def test_get_value__frame(self):
+        model = gaupol.SubtitleModel(self.project, aeidon.modes.FRAME)
+        subtitle = self.project.subtitles[3]
+        assert model[3][1] == subtitle.start_frame
+        assert model[3][3] == subtitle.duration_frame
+
+    def test_insert_rows(self):
+        self.project.insert_subtitles((0, 4))
+        self.model.insert_rows((0, 4))
+        assert len(self.model) == len(self.project.subtitles)
+        assert self.model[4][4] == self.project.subtitles[4].main_text
+
+    def test_iter(self):
+        texts = [x[4] for x in self.model]
+        assert texts == [x.main_text for x in self.project.subtitles]
+
+    def test_remove_rows(self):
+        self.project.remove_subtitles((0, 4))
+        self.model.remove_rows((0, 4))
+        assert len(self.model) == len(self.project.subtitles)
+
+    def test_update_rows(self):
+        self.project.set_text(2, aeidon.documents.MAIN, "test")
+        self.model.update_rows((2,))
+        assert self.model[2][4] == "test"
@@ -46,15 +46,9 @@ class TestView(gaupol.TestCase):
 
     def setup_frame(self):
         self.view = gaupol.View(aeidon.modes.FRAME)
-        store = self.view.get_model()
         self.project = self.new_project()
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.append((i + 1,
-                          subtitle.start_frame,
-                          subtitle.end_frame,
-                          subtitle.duration_frame,
-                          subtitle.main_text,
-                          subtitle.tran_text))
+        model = gaupol.SubtitleModel(self.project, aeidon.modes.FRAME)
+        self.view.set_model(model)
 
     def setup_method(self, method):
         random.choice((self.setup_frame, self.setup_time))()
@@ -62,15 +56,9 @@ class TestView(gaupol.TestCase):
 
     def setup_time(self):
         self.view = gaupol.View(aeidon.modes.TIME)
-        store = self.view.get_model()
         self.project = self.new_project()
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.append((i + 1,
-                          subtitle.start_time,
-                          subtitle.end_time,
-                          subtitle.duration_seconds,
-                          subtitle.main_text,
-                          subtitle.tran_text))
+        model = gaupol.SubtitleModel(self.project, aeidon.modes.TIME)
+        self.view.set_model(model)
 
     def test_select_rows(self):
         self.view.select_rows(())
@@ -39,7 +39,10 @@ class View(Gtk.TreeView):
        The values of the enumeration items correspond to the column indices and
        are updated when columns are added, removed or reordered. Note that
        these indices are not necessarily the same as the column indices in the
-       underlying :class:`Gtk.ListStore` data model.
+       underlying data model.
+
+    The data model is not created by the view, but should be set by its owner,
+    usually to a :class:`gaupol.SubtitleModel`.
     """
 
     def __init__(self, edit_mode):
@@ -170,12 +173,6 @@ class View(Gtk.TreeView):
 
     def _init_props(self, edit_mode):
         """Initialize properties."""
-        if edit_mode == aeidon.modes.TIME:
-            columns = (int, str, str, float, str, str)
-        if edit_mode == aeidon.modes.FRAME:
-            columns = (int, int, int, int, str, str)
-        store = Gtk.ListStore(*columns)
-        self.set_model(store)
         self._init_columns(edit_mode)
         self._init_cell_data_functions()
         self.set_name("gaupol-view")
@@ -27,6 +27,7 @@ setup(
     license="GPL",
     packages=find_packages(exclude=["gaupol*", "*.test"]),
     package_data={"aeidon": ["data/*/*"]},
+    scripts=["bin/aeidon-convert"],
     python_requires=">=3.5.0",
     install_requires=["charset-normalizer>2.0"],
 )
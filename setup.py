@@ -154,6 +154,8 @@ class Distribution(distribution):
             self.packages.append(path[path.find(name):])
 
     def __find_scripts(self, name):
+        if name == "aeidon":
+            self.scripts.append("bin/aeidon-convert")
         if name == "gaupol":
             self.scripts.append("bin/gaupol")
 
@@ -165,6 +167,7 @@ class Distribution(distribution):
         if self.with_aeidon:
             self.__find_data_files("aeidon")
             self.__find_packages("aeidon")
+            self.__find_scripts("aeidon")
         if self.with_aeidon and self.with_iso_codes:
             self.__find_data_files("iso-codes")
         if self.with_gaupol: